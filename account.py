@@ -1,6 +1,25 @@
 import streamlit as st
 from src.models.goal import CreditInfo
 
+LANGUAGES = ["English", "Swahili", "French"]
+THEMES = ["Light", "Dark", "Auto"]
+
+def _persist(widget_key: str, key: str) -> None:
+    """
+    Copy a widget's value to a plain session key. Streamlit drops
+    widget-keyed state on reruns where the widget is not rendered, so other
+    pages read the plain key instead.
+    """
+    st.session_state[key] = st.session_state[widget_key]
+
+def _persisted_selectbox(label: str, options: list, key: str, default: str):
+    """Selectbox whose choice survives leaving this page, kept in session_state[key]"""
+    current = st.session_state.get(key, default)
+    return st.selectbox(
+        label, options, index=options.index(current) if current in options else 0,
+        key=f"{key}_widget", on_change=_persist, args=(f"{key}_widget", key)
+    )
+
 def render_account_page():
     """Render account/profile page"""
     
@@ -58,8 +77,8 @@ def render_account_page():
         st.selectbox("Currency", ["USD", "EUR", "GBP", "KES"])
     
     with col2:
-        st.selectbox("Language", ["English", "Swahili", "French"])
-        st.selectbox("Theme", ["Light", "Dark", "Auto"])
+        _persisted_selectbox("Language", LANGUAGES, "language", "English")
+        _persisted_selectbox("Theme", THEMES, "theme", "Dark")
         st.checkbox("Data Export Reminders", value=True)
     
     st.divider()
@@ -1,7 +1,16 @@
+import threading
+from functools import lru_cache
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
+from src.services.expense_cube import ExpenseCube
+from src.services.filter_index import FilterIndex
+from src.services.export_service import export_frame
+from src.models.category_registry import get_category_registry
+from src.models.money import from_cents, to_cents, format_money, format_money_series
+from src.ui.components import render_download_button, render_paginated_table
+from src.ui.chart_data import FULL_WIDTH, downsample, monthly_series, point_budget, render_daily_trend
+from src.ui.figure_cache import cached_figure
+from src.utils.perf import timed
 
 # Attractive color palette with extended colors for custom categories
 CATEGORY_COLORS = {
@@ -16,200 +25,314 @@ CATEGORY_COLORS = {
 
 CUSTOM_COLORS = ['#FF9F43', '#10AC84', '#5F27CD', '#00D2D3', '#FF6348', '#C44569', '#40407A', '#2C2C54', '#FD79A8', '#FDCB6E']
 
-def render_analytics_dashboard(df):
-    """Render enhanced analytics dashboard with attractive colors"""
+def get_category_color_map(categories):
+    """Color per category; custom categories get a palette slot fixed by their registry code"""
+    return dict(_category_color_map(tuple(categories)))
+
+@lru_cache(maxsize=64)
+def _category_color_map(categories):
+    # Registry codes never change once assigned, so a category's color is fixed for the process
+    registry = get_category_registry()
+    return tuple(
+        (cat, CATEGORY_COLORS.get(cat, CUSTOM_COLORS[registry.code(cat) % len(CUSTOM_COLORS)]))
+        for cat in categories
+    )
+
+ANALYTICS_TABS = ["📊 Overview", "📈 Trends", "📋 Detailed Reports"]
+
+# Tables of each tab for the current data version (figures live in the figure cache),
+# keyed by (tab, data version); switching tabs reuses them
+# Shared by every session's script thread; all access goes through the lock
+_TAB_ARTIFACTS = {}
+_TAB_ARTIFACTS_LOCK = threading.Lock()
+
+def _tab_artifacts(tab, version, build):
+    """Build a tab's artifacts once per data version (always when version is None)"""
+    if version is None:
+        return build()
+    
+    with _TAB_ARTIFACTS_LOCK:
+        cached = _TAB_ARTIFACTS.get((tab, version))
+    if cached is not None:
+        return cached
+    
+    # Built outside the lock, as in FigureCache; racing sessions just build twice
+    cached = build()
+    with _TAB_ARTIFACTS_LOCK:
+        for stale in [key for key in _TAB_ARTIFACTS if key[1] != version]:
+            del _TAB_ARTIFACTS[stale]
+        _TAB_ARTIFACTS[(tab, version)] = cached
+    return cached
+
+@timed()
+def render_analytics_dashboard(df, cube=None, version=None, index=None):
+    """
+    Render enhanced analytics dashboard with attractive colors.
+    
+    Only the selected view is computed; pass the repository's data version
+    to reuse its figures and exports across reruns, and the service's
+    FilterIndex to filter Detailed Reports without scanning df.
+    """
     
     if df.empty:
         st.info("📊 No data available for analytics. Start adding expenses!")
         return
     
-    # Prepare data
-    df['date'] = pd.to_datetime(df['date'])
-    df['month'] = df['date'].dt.strftime('%Y-%m')
-    df['day_name'] = df['date'].dt.day_name()
+    # Rollups come from the (day, category) cube rather than regrouping df
+    if cube is None:
+        cube = ExpenseCube.from_frame(df)
     
-    # Analytics Tabs
-    tab1, tab2, tab3 = st.tabs(["📊 Overview", "📈 Trends", "📋 Detailed Reports"])
+    # A radio instead of st.tabs: tab bodies would all run on every rerun
+    selected_tab = st.radio(
+        "Analytics view", ANALYTICS_TABS, horizontal=True,
+        key="analytics_tab", label_visibility="collapsed"
+    )
     
-    with tab1:
-        # Key Metrics Row with attractive colors
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            total_expenses = df['amount'].sum()
-            st.metric("💰 Total Expenses", f"${total_expenses:.2f}")
-        
-        with col2:
-            avg_expense = df['amount'].mean()
-            st.metric("📊 Average Expense", f"${avg_expense:.2f}")
-        
-        with col3:
-            expense_count = len(df)
-            st.metric("🔢 Total Transactions", expense_count)
-        
-        with col4:
-            top_category = df.groupby('category')['amount'].sum().idxmax()
-            st.metric("🎯 Top Category", top_category.title())
-        
-        # Charts Row
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.subheader("💰 Spending by Category")
-            category_totals = df.groupby('category')['amount'].sum().sort_values(ascending=True)
-            
-            fig = px.bar(
-                x=category_totals.values,
-                y=category_totals.index,
-                orientation='h',
-                title="Category Spending Analysis",
-                labels={'x': 'Amount ($)', 'y': 'Category'},
-                color=category_totals.index,
-                color_discrete_map={**CATEGORY_COLORS, **{cat: CUSTOM_COLORS[i % len(CUSTOM_COLORS)] 
-                                   for i, cat in enumerate([c for c in category_totals.index if c not in CATEGORY_COLORS])}}
-            )
-            fig.update_layout(height=400, showlegend=False, plot_bgcolor='rgba(0,0,0,0)')
-            st.plotly_chart(fig, use_container_width=True)
-            
-            # Category CSV Export
-            category_df = pd.DataFrame({
-                'Category': category_totals.index,
-                'Amount': category_totals.values,
-                'Percentage': (category_totals.values / category_totals.sum() * 100).round(1)
-            })
-            
-            csv_categories = category_df.to_csv(index=False)
-            st.download_button(
-                "📥 Download Category Data",
-                csv_categories,
-                "category_analysis.csv",
-                "text/csv"
-            )
-        
-        with col2:
-            st.subheader("📅 Recent Activity")
-            recent = df.sort_values('date', ascending=False).head(10)
-            
-            # Format for display
-            display_df = recent[['date', 'category', 'amount', 'description']].copy()
-            display_df['date'] = display_df['date'].dt.strftime('%Y-%m-%d')
-            display_df['amount'] = display_df['amount'].apply(lambda x: f"${x:.2f}")
-            
-            st.dataframe(display_df, use_container_width=True, hide_index=True)
-            
-            # Recent Activity CSV Export
-            csv_recent = recent.to_csv(index=False)
-            st.download_button(
-                "📥 Download Recent Activity",
-                csv_recent,
-                "recent_expenses.csv",
-                "text/csv"
-            )
-    
-    with tab2:
-        st.subheader("📈 Spending Trends")
-        
-        # Monthly Trend with gradient
-        monthly_spending = df.groupby('month')['amount'].sum().reset_index()
-        
-        fig = px.area(
-            monthly_spending,
-            x='month',
-            y='amount',
-            title='Monthly Spending Trend',
-            color_discrete_sequence=['#667eea']
+    if selected_tab == ANALYTICS_TABS[0]:
+        _render_overview(df, cube, version)
+    elif selected_tab == ANALYTICS_TABS[1]:
+        _render_trends(cube, version)
+    else:
+        _render_detailed_reports(df, cube, version, index)
+
+# Figure builders run only on a figure-cache miss, so plotly is imported there
+
+def _category_bar_figure(cube):
+    import plotly.express as px
+    
+    category_totals = cube.category_totals().sort_values(ascending=True)
+    fig = px.bar(
+        x=from_cents(category_totals.values),
+        y=category_totals.index,
+        orientation='h',
+        title="Category Spending Analysis",
+        labels={'x': 'Amount ($)', 'y': 'Category'},
+        color=category_totals.index,
+        color_discrete_map=get_category_color_map(category_totals.index)
+    )
+    fig.update_layout(height=400, showlegend=False, plot_bgcolor='rgba(0,0,0,0)')
+    return fig
+
+def _monthly_figure(cube):
+    import plotly.express as px
+    
+    # Monthly Trend with gradient, capped to the chart's point budget
+    monthly = downsample(monthly_series(cube), point_budget(FULL_WIDTH))
+    monthly_spending = from_cents(monthly).rename('amount').rename_axis('month').reset_index()
+    
+    fig = px.area(
+        monthly_spending,
+        x='month',
+        y='amount',
+        title='Monthly Spending Trend',
+        color_discrete_sequence=['#667eea']
+    )
+    fig.update_layout(height=400, plot_bgcolor='rgba(0,0,0,0)')
+    return fig
+
+def _weekday_figure(cube):
+    import plotly.express as px
+    
+    daily_avg = from_cents(cube.weekday_average())
+    fig = px.bar(
+        x=daily_avg.index,
+        y=daily_avg.values,
+        title='Average Spending by Day of Week',
+        color=daily_avg.values,
+        color_continuous_scale='sunset'
+    )
+    fig.update_layout(plot_bgcolor='rgba(0,0,0,0)')
+    return fig
+
+def _category_pie_figure(cube):
+    import plotly.express as px
+    
+    category_totals = cube.category_totals().sort_values(ascending=True)
+    fig = px.pie(
+        values=from_cents(category_totals.values),
+        names=category_totals.index,
+        title='Spending Distribution',
+        color=category_totals.index,
+        color_discrete_map=get_category_color_map(category_totals.index),
+        hole=0.4
+    )
+    fig.update_traces(textposition='inside', textinfo='percent+label')
+    return fig
+
+def _build_overview(df, cube):
+    category_totals = cube.category_totals().sort_values(ascending=True)
+    category_df = pd.DataFrame({
+        'Category': category_totals.index,
+        'Amount': from_cents(category_totals.values),
+        'Percentage': (category_totals.values / category_totals.sum() * 100).round(1)
+    })
+    
+    recent = df.nlargest(10, 'date')
+    
+    # Display columns are formatted from the 10-row view; df itself is never touched
+    display_df = pd.DataFrame({
+        'date': recent['date'].dt.strftime('%Y-%m-%d'),
+        'category': recent['category'],
+        'amount': format_money_series(recent['amount_cents']),
+        'description': recent['description']
+    })
+    
+    return {
+        'category_table': category_df,
+        'recent': export_frame(recent),
+        'recent_display': display_df,
+        'top_category': category_totals.idxmax()
+    }
+
+@timed()
+def _render_overview(df, cube, version):
+    overview = _tab_artifacts('overview', version, lambda: _build_overview(df, cube))
+    
+    # Key Metrics Row with attractive colors
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("💰 Total Expenses", format_money(cube.total))
+    
+    with col2:
+        st.metric("📊 Average Expense", format_money(cube.mean))
+    
+    with col3:
+        st.metric("🔢 Total Transactions", cube.transaction_count)
+    
+    with col4:
+        st.metric("🎯 Top Category", overview['top_category'].title())
+    
+    # Charts Row
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("💰 Spending by Category")
+        st.plotly_chart(
+            cached_figure('analytics.category_bar', version, lambda: _category_bar_figure(cube)),
+            use_container_width=True
         )
-        fig.update_layout(height=400, plot_bgcolor='rgba(0,0,0,0)')
-        st.plotly_chart(fig, use_container_width=True)
         
-        # Day of Week Analysis
-        col1, col2 = st.columns(2)
+        render_download_button(
+            "📥 Download Category Data", lambda: overview['category_table'],
+            "category_analysis", version, lazy=False
+        )
+    
+    with col2:
+        st.subheader("📅 Recent Activity")
+        st.dataframe(overview['recent_display'], use_container_width=True, hide_index=True)
         
-        with col1:
-            daily_avg = df.groupby('day_name')['amount'].mean().reindex([
-                'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday'
-            ])
-            
-            fig = px.bar(
-                x=daily_avg.index,
-                y=daily_avg.values,
-                title='Average Spending by Day of Week',
-                color=daily_avg.values,
-                color_continuous_scale='sunset'
-            )
-            fig.update_layout(plot_bgcolor='rgba(0,0,0,0)')
-            st.plotly_chart(fig, use_container_width=True)
+        # Recent Activity CSV Export
+        render_download_button(
+            "📥 Download Recent Activity", lambda: overview['recent'],
+            "recent_expenses", version, filters={'limit': len(overview['recent'])}, lazy=False
+        )
+
+@timed()
+def _render_trends(cube, version):
+    st.subheader("📈 Spending Trends")
+    st.plotly_chart(
+        cached_figure('analytics.monthly_area', version, lambda: _monthly_figure(cube)),
+        use_container_width=True
+    )
+    
+    # Zoomable daily view, cached per zoom range
+    render_daily_trend(cube, key="analytics_daily", version=version)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.plotly_chart(
+            cached_figure('analytics.weekday_bar', version, lambda: _weekday_figure(cube)),
+            use_container_width=True
+        )
+    
+    with col2:
+        st.plotly_chart(
+            cached_figure('analytics.category_pie', version, lambda: _category_pie_figure(cube)),
+            use_container_width=True
+        )
+
+@timed()
+def _render_detailed_reports(df, cube, version, index=None):
+    st.subheader("📋 Detailed Reports")
+    
+    if index is None:
+        index = FilterIndex.from_frame(df)
+    
+    # Filters
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        selected_categories = st.multiselect(
+            "Filter by Category",
+            options=cube.categories,
+            default=cube.categories
+        )
+    
+    with col2:
+        min_amount = st.number_input("Minimum Amount", value=0.0, step=0.01)
+    
+    with col3:
+        max_amount = st.number_input("Maximum Amount", value=from_cents(cube.max_amount), step=0.01)
+    
+    with col4:
+        first, last = index.date_bounds
+        first_day, last_day = first.date(), last.date()
+        date_range = st.date_input(
+            "Date Range", value=(first_day, last_day),
+            min_value=first_day, max_value=last_day
+        )
+    
+    # Resolve filters to row ids through the index; no full-frame mask or copy.
+    # Bounds left at their defaults are passed as None so the index can skip them
+    start = end = None
+    if isinstance(date_range, (tuple, list)) and len(date_range) == 2:
+        if date_range[0] > first_day:
+            start = pd.Timestamp(date_range[0])
+        if date_range[1] < last_day:
+            end = pd.Timestamp(date_range[1]) + pd.Timedelta(days=1)
+    min_cents, max_cents = to_cents(min_amount), to_cents(max_amount)
+    result = index.query(
+        categories=selected_categories,
+        min_cents=min_cents if min_cents > 0 else None,
+        max_cents=max_cents if max_cents < cube.max_amount else None,
+        start=start,
+        end=end
+    )
+    
+    # Display filtered data
+    if result.count:
+        st.write(f"**Showing {result.count} transactions**")
         
-        with col2:
-            # Category Distribution Pie Chart
-            fig = px.pie(
-                values=category_totals.values,
-                names=category_totals.index,
-                title='Spending Distribution',
-                color_discrete_map=CATEGORY_COLORS,
-                hole=0.4
-            )
-            fig.update_traces(textposition='inside', textinfo='percent+label')
-            st.plotly_chart(fig, use_container_width=True)
-    
-    with tab3:
-        st.subheader("📋 Detailed Reports")
+        # Only the visible page is sorted out, sliced and formatted
+        render_paginated_table(df, index, result.ids, key="detailed_reports")
         
-        # Filters
+        # Summary stats come straight from the index
         col1, col2, col3 = st.columns(3)
-        
         with col1:
-            selected_categories = st.multiselect(
-                "Filter by Category",
-                options=df['category'].unique(),
-                default=df['category'].unique()
-            )
-        
+            st.metric("💸 Filtered Total", format_money(result.total_cents))
         with col2:
-            min_amount = st.number_input("Minimum Amount", value=0.0, step=0.01)
-        
+            st.metric("📊 Filtered Average", format_money(result.mean_cents))
         with col3:
-            max_amount = st.number_input("Maximum Amount", value=float(df['amount'].max()), step=0.01)
+            st.metric("🔢 Transaction Count", result.count)
         
-        # Apply filters
-        filtered_df = df[
-            (df['category'].isin(selected_categories)) &
-            (df['amount'] >= min_amount) &
-            (df['amount'] <= max_amount)
-        ].copy()
-        
-        # Display filtered data
-        if not filtered_df.empty:
-            st.write(f"**Showing {len(filtered_df)} transactions**")
-            
-            # Format for display
-            display_filtered = filtered_df[['date', 'category', 'amount', 'description']].copy()
-            display_filtered['date'] = display_filtered['date'].dt.strftime('%Y-%m-%d %H:%M')
-            display_filtered['amount'] = display_filtered['amount'].apply(lambda x: f"${x:.2f}")
-            
-            st.dataframe(display_filtered, use_container_width=True, hide_index=True)
-            
-            # Summary stats with colors
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.metric("💸 Filtered Total", f"${filtered_df['amount'].sum():.2f}")
-            with col2:
-                st.metric("📊 Filtered Average", f"${filtered_df['amount'].mean():.2f}")
-            with col3:
-                st.metric("🔢 Transaction Count", len(filtered_df))
-            
-            # Export filtered data
-            csv_filtered = filtered_df.to_csv(index=False)
-            st.download_button(
-                "📥 Download Filtered Data",
-                csv_filtered,
-                "filtered_expenses.csv",
-                "text/csv",
-                use_container_width=True
-            )
-        else:
-            st.warning("No transactions match the selected filters.")
+        # Export filtered data, cached per data version and filter set
+        filters = {
+            'categories': sorted(selected_categories),
+            'min_cents': min_cents,
+            'max_cents': max_cents,
+            'start': start,
+            'end': end
+        }
+        render_download_button(
+            "📥 Download Filtered Data", lambda: export_frame(df.iloc[result.ids]),
+            "filtered_expenses", version, filters=filters, use_container_width=True
+        )
+    else:
+        st.warning("No transactions match the selected filters.")
 
+@timed()
 def render_expense_summary_cards(df):
     """Render summary cards with attractive styling"""
     
@@ -217,10 +340,10 @@ def render_expense_summary_cards(df):
         return
     
     # Calculate metrics
-    total_spending = df['amount'].sum()
-    avg_daily = df['amount'].mean()
+    total_spending = df['amount_cents'].sum()
+    avg_daily = df['amount_cents'].mean()
     transaction_count = len(df)
-    top_category = df.groupby('category')['amount'].sum().idxmax()
+    top_category = df.groupby('category', observed=True)['amount_cents'].sum().idxmax()
     
     # Create attractive metric cards
     col1, col2, col3, col4 = st.columns(4)
@@ -228,14 +351,14 @@ def render_expense_summary_cards(df):
     with col1:
         st.metric(
             label="💰 Total Spending",
-            value=f"${total_spending:.2f}",
+            value=format_money(total_spending),
             delta=f"{transaction_count} transactions"
         )
     
     with col2:
         st.metric(
             label="📊 Average Transaction",
-            value=f"${avg_daily:.2f}",
+            value=format_money(avg_daily),
             delta="per transaction"
         )
     
@@ -244,13 +367,13 @@ def render_expense_summary_cards(df):
         st.metric(
             label="🏷️ Categories Used",
             value=category_count,
-            delta=f"out of 7 available"
+            delta=f"out of {len(get_category_registry())} available"
         )
     
     with col4:
-        top_amount = df.groupby('category')['amount'].sum().max()
+        top_amount = df.groupby('category', observed=True)['amount_cents'].sum().max()
         st.metric(
             label="🎯 Top Category",
             value=top_category.title(),
-            delta=f"${top_amount:.2f}"
+            delta=format_money(top_amount)
         )
\ No newline at end of file
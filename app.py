@@ -1,148 +1,46 @@
-import streamlit as st
-from src.config import PAGE_TITLE, PAGE_ICON
-from src.services.expense_service import ExpenseService
-from src.ui.navigation import render_navigation_sidebar
-from src.ui.dashboard import render_dashboard
-from src.ui.account import render_account_page
-from src.ui.analytics import render_analytics_dashboard, render_expense_summary_cards
-from src.ui.goals import render_goals_page
-from src.ui.education import render_education_center
-from src.ui.sidebar import render_sidebar
-from src.design_system.colors import get_color, SEMANTIC_COLORS
+from src.utils.startup_profiler import PROFILER, lazy_attr
+from src.utils.perf import span, trace
+from src.services.metrics import ACTIVE_SESSIONS, start_metrics_server
 
-# Semantic Color System CSS
-st.markdown(f"""
-<style>
-    :root {{
-        /* Text Colors */
-        --text-primary: {get_color('text.primary', dark_mode=True)};
-        --text-secondary: {get_color('text.secondary', dark_mode=True)};
-        --text-muted: {get_color('text.muted', dark_mode=True)};
-        --text-inverse: {get_color('text.inverse', dark_mode=True)};
-        
-        /* Background Colors */
-        --bg-primary: {get_color('background.primary', dark_mode=True)};
-        --bg-secondary: {get_color('background.secondary', dark_mode=True)};
-        --bg-tertiary: {get_color('background.tertiary', dark_mode=True)};
-        
-        /* Interactive Colors */
-        --interactive-primary: {get_color('interactive.primary.default')};
-        --interactive-primary-hover: {get_color('interactive.primary.hover')};
-        --interactive-success: {get_color('interactive.success.default')};
-        --interactive-warning: {get_color('interactive.warning.default')};
-        --interactive-danger: {get_color('interactive.danger.default')};
-        
-        /* Financial Colors */
-        --financial-positive: {get_color('financial.positive')};
-        --financial-negative: {get_color('financial.negative')};
-        --financial-neutral: {get_color('financial.neutral')};
-        --financial-pending: {get_color('financial.pending')};
-    }}
-    
-    .stApp {{
-        background-color: var(--bg-primary);
-        color: var(--text-primary);
-    }}
-    
-    .stSidebar {{
-        background-color: var(--bg-secondary);
-    }}
-    
-    .stSelectbox > div > div {{
-        background-color: var(--bg-secondary);
-        color: var(--text-primary);
-        border-color: var(--bg-tertiary);
-    }}
-    
-    .stMetric {{
-        background-color: var(--bg-secondary);
-        padding: 1rem;
-        border-radius: 0.75rem;
-        border: 1px solid var(--bg-tertiary);
-    }}
-    
-    .stButton > button {{
-        background-color: var(--interactive-success);
-        color: var(--text-inverse);
-        border: none;
-        border-radius: 0.5rem;
-        font-weight: 600;
-        transition: background-color 0.2s ease;
-    }}
-    
-    .stButton > button:hover {{
-        background-color: var(--interactive-primary-hover);
-    }}
-    
-    .stDataFrame {{
-        background-color: var(--bg-secondary);
-    }}
-    
-    h1, h2, h3 {{
-        color: var(--text-primary);
-    }}
-    
-    /* Financial Status Colors */
-    .positive {{ color: var(--financial-positive); }}
-    .negative {{ color: var(--financial-negative); }}
-    .neutral {{ color: var(--financial-neutral); }}
-    .pending {{ color: var(--financial-pending); }}
-    
-    /* Status Indicators */
-    .status-success {{ 
-        background-color: rgba(34, 197, 94, 0.1);
-        color: var(--interactive-success);
-        border: 1px solid rgba(34, 197, 94, 0.2);
-    }}
-    
-    .status-warning {{ 
-        background-color: rgba(245, 158, 11, 0.1);
-        color: var(--interactive-warning);
-        border: 1px solid rgba(245, 158, 11, 0.2);
-    }}
-    
-    .status-danger {{ 
-        background-color: rgba(239, 68, 68, 0.1);
-        color: var(--interactive-danger);
-        border: 1px solid rgba(239, 68, 68, 0.2);
-    }}
-</style>
-""", unsafe_allow_html=True)
+with PROFILER.importing("core"):
+    import streamlit as st
+    from src.config import PAGE_TITLE, PAGE_ICON
+    from src.ui.navigation import render_navigation_sidebar, render_quick_stats
+    from src.design_system.colors import get_theme_css
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
 
-st.set_page_config(page_title=PAGE_TITLE, page_icon=PAGE_ICON, layout="wide")
+# Page modules (and the plotly/pandas they pull in) are imported on first visit
+PAGES = {
+    "🏠 Dashboard": "src.ui.dashboard",
+    "👤 Account": "src.ui.account",
+    "📊 Analytics": "src.ui.analytics",
+    "🎯 Goals": "src.ui.goals",
+    "📚 Learning": "src.ui.education",
+}
 
-service = ExpenseService()
+# Pages that read expense data; only these build an ExpenseService (and load pandas)
+DATA_PAGES = ("🏠 Dashboard", "📊 Analytics")
 
-# Navigation Sidebar with semantic colors
-selected_page = render_navigation_sidebar()
+_service = None
 
-# Show expense form modal if triggered
-if st.session_state.get('show_expense_form', False):
-    with st.container():
-        render_sidebar(service)
-    st.session_state.show_expense_form = False
+def get_service():
+    """This rerun's ExpenseService, imported and built on first use"""
+    global _service
+    if _service is None:
+        _service = lazy_attr("src.services.expense_service", "ExpenseService")()
+    return _service
 
-# Page Routing
-if selected_page == "🏠 Dashboard":
-    render_dashboard(service)
-    
-elif selected_page == "👤 Account":
-    render_account_page()
-    
-elif selected_page == "📊 Analytics":
+def render_analytics_page(service):
+    analytics = PROFILER.load(PAGES["📊 Analytics"])
     st.header("📊 Advanced Analytics")
     df = service.get_all_expenses()
-    render_expense_summary_cards(df)
+    analytics.render_expense_summary_cards(df)
     st.divider()
-    render_analytics_dashboard(df)
-    
-elif selected_page == "🎯 Goals":
-    render_goals_page()
-    
-elif selected_page == "📚 Learning":
-    render_education_center()
-    
-elif selected_page == "⚙️ Settings":
+    analytics.render_analytics_dashboard(
+        df, service.get_cube(df), service.repository.get_data_version(), service.get_filter_index(df)
+    )
+
+def render_settings_page():
     st.header("⚙️ Settings")
     st.info("Settings page - Coming soon!")
     
@@ -156,4 +54,57 @@ elif selected_page == "⚙️ Settings":
     
     with col2:
         st.checkbox("Dark Mode", value=True)
-        st.checkbox("Email Notifications", value=True)
\ No newline at end of file
+        st.checkbox("Email Notifications", value=True)
+
+    # Cold-start cost of this server process
+    with st.expander("🚀 Startup Profile"):
+        st.json(PROFILER.report())
+    
+    # Developer panel: where recent reruns spent their time
+    if st.checkbox("🛠️ Show performance panel", key="perf_panel"):
+        lazy_attr("src.ui.perf_panel", "render_perf_panel")()
+
+# Semantic Color System CSS, prebuilt per theme in the design system
+st.markdown(get_theme_css(st.session_state.get("theme", "Dark")), unsafe_allow_html=True)
+
+st.set_page_config(page_title=PAGE_TITLE, page_icon=PAGE_ICON, layout="wide")
+
+# Prometheus endpoint on a background thread, started once per process
+start_metrics_server()
+run_context = get_script_run_ctx()
+if run_context is not None:
+    ACTIVE_SESSIONS.touch(run_context.session_id)
+
+# Every rerun is one trace of nested timing spans (see the Settings perf panel)
+with trace("rerun") as rerun:
+    # Navigation Sidebar with semantic colors
+    selected_page = render_navigation_sidebar()
+    rerun['page'] = selected_page
+    if selected_page in DATA_PAGES:
+        render_quick_stats(get_service())
+
+    # Show expense form modal if triggered
+    if st.session_state.get('show_expense_form', False):
+        with st.container():
+            lazy_attr("src.ui.sidebar", "render_sidebar")(get_service())
+        st.session_state.show_expense_form = False
+
+    # Page Routing; a page's first render in this process includes importing it
+    with PROFILER.first_render(selected_page), span(f"page {selected_page}"):
+        if selected_page == "🏠 Dashboard":
+            lazy_attr(PAGES[selected_page], "render_dashboard")(get_service())
+    
+        elif selected_page == "👤 Account":
+            lazy_attr(PAGES[selected_page], "render_account_page")()
+    
+        elif selected_page == "📊 Analytics":
+            render_analytics_page(get_service())
+    
+        elif selected_page == "🎯 Goals":
+            lazy_attr(PAGES[selected_page], "render_goals_page")()
+    
+        elif selected_page == "📚 Learning":
+            lazy_attr(PAGES[selected_page], "render_education_center")()
+    
+        elif selected_page == "⚙️ Settings":
+            render_settings_page()
\ No newline at end of file
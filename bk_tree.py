@@ -0,0 +1,91 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+
+def bounded_levenshtein(a: str, b: str, limit: int) -> int:
+    """
+    Edit distance between a and b, giving up early: any distance above
+    limit is reported as limit + 1.
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    if len(a) < len(b):
+        a, b = b, a
+
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        row_min = i
+        for j, cb in enumerate(b, 1):
+            cost = previous[j - 1] + (ca != cb)
+            insert = current[j - 1] + 1
+            delete = previous[j] + 1
+            best = min(cost, insert, delete)
+            current.append(best)
+            if best < row_min:
+                row_min = best
+        if row_min > limit:
+            return limit + 1
+        previous = current
+
+    return min(previous[-1], limit + 1)
+
+class BKTree:
+    """
+    Burkhard-Keller tree for bounded edit-distance lookups.
+
+    Each child edge is labelled with the distance to its parent, so by the
+    triangle inequality a query only descends into edges within
+    max_distance of its distance to the current node. Lookups touch a
+    small fraction of the vocabulary instead of scanning all of it.
+    """
+
+    # Distances are computed with this cap; edges never need larger labels
+    _MAX_EDGE = 64
+
+    def __init__(self, words: Iterable[str] = ()):
+        self._root: Optional[Tuple[str, Dict[int, tuple]]] = None
+        self._size = 0
+        for word in words:
+            self.add(word)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, word: str) -> None:
+        if self._root is None:
+            self._root = (word, {})
+            self._size = 1
+            return
+
+        node = self._root
+        while True:
+            distance = bounded_levenshtein(word, node[0], self._MAX_EDGE)
+            if distance == 0:
+                return
+            child = node[1].get(distance)
+            if child is None:
+                node[1][distance] = (word, {})
+                self._size += 1
+                return
+            node = child
+
+    def search(self, word: str, max_distance: int) -> List[Tuple[int, str]]:
+        """All (distance, word) within max_distance, closest first"""
+        if self._root is None or max_distance < 0:
+            return []
+
+        found = []
+        stack = [self._root]
+        while stack:
+            candidate, children = stack.pop()
+            distance = bounded_levenshtein(word, candidate, self._MAX_EDGE)
+            if distance <= max_distance:
+                found.append((distance, candidate))
+            low, high = distance - max_distance, distance + max_distance
+            stack.extend(child for d, child in children.items() if low <= d <= high)
+
+        found.sort()
+        return found
+
+    def closest(self, word: str, max_distance: int) -> Optional[str]:
+        matches = self.search(word, max_distance)
+        return matches[0][1] if matches else None
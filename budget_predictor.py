@@ -10,8 +10,15 @@ from typing import Dict, List, Optional, Tuple
 import warnings
 warnings.filterwarnings('ignore')
 
-from src.ml.data_processor import DataProcessor
+from src.ml.data_processor import DataProcessor, FEATURE_COLUMNS
+from src.services.expense_cube import ExpenseCube
+from src.models.money import to_cents_array, from_cents
 from src.config import MODEL_FILE, MIN_TRAINING_SAMPLES, EXPENSE_CATEGORIES
+from src.services.metrics import REGISTRY
+
+INFERENCE_SECONDS = REGISTRY.histogram(
+    "fedha_predictor_inference_seconds", "Latency of monthly budget predictions"
+)
 
 class BudgetPredictor:
     """
@@ -140,10 +147,7 @@ class BudgetPredictor:
                 return False
             
             # Define feature columns and target
-            feature_cols = [
-                'month', 'day', 'day_of_week', 'is_weekend',
-                'category_encoded', 'week_of_month'
-            ]
+            feature_cols = FEATURE_COLUMNS
             
             # Check if all required features exist
             missing_features = [f for f in feature_cols if f not in features.columns]
@@ -248,6 +252,7 @@ class BudgetPredictor:
     # PREDICTION METHODS
     # ========================================================================
     
+    @INFERENCE_SECONDS.timed
     def predict_monthly_budget(
         self, 
         df: pd.DataFrame, 
@@ -335,16 +340,8 @@ class BudgetPredictor:
         category: str
     ) -> List[float]:
         """Create feature vector for a specific date and category"""
-        category_encoded = EXPENSE_CATEGORIES.index(category) if category in EXPENSE_CATEGORIES else 0
-        
-        return [
-            date.month,                           # month
-            date.day,                             # day
-            date.weekday(),                       # day_of_week (0=Monday)
-            1 if date.weekday() >= 5 else 0,     # is_weekend
-            category_encoded,                     # category_encoded
-            (date.day - 1) // 7 + 1              # week_of_month (1-5)
-        ]
+        # Same registry-code encoding as training (DataProcessor.prepare_features)
+        return self.processor.feature_row(date, category)
     
     def _fallback_prediction(self, df: pd.DataFrame) -> Dict[str, float]:
         """Simple average-based prediction when ML model unavailable"""
@@ -366,11 +363,29 @@ class BudgetPredictor:
     # ANALYSIS & INSIGHTS
     # ========================================================================
     
-    def get_spending_insights(self, df: pd.DataFrame) -> Dict:
-        """Generate insights about spending patterns"""
+    def get_spending_insights(
+        self, 
+        df: pd.DataFrame, 
+        cube: Optional[ExpenseCube] = None
+    ) -> Dict:
+        """
+        Generate insights about spending patterns.
+        
+        Args:
+            df: Historical expense data
+            cube: Pre-built aggregate cube; its quantile sketches answer the
+                median/percentile queries without sorting df
+        """
         if df is None or df.empty:
             return {}
         
+        if cube is None:
+            cube = ExpenseCube.from_frame(pd.DataFrame({
+                'date': df['Date'],
+                'amount_cents': to_cents_array(df['Amount']),
+                'category': df['Category']
+            }))
+        
         features = self.processor.prepare_features(df)
         
         if features is None or features.empty:
@@ -384,7 +399,13 @@ class BudgetPredictor:
             },
             "spending_by_category": df.groupby('Category')['Amount'].sum().to_dict(),
             "average_expense": float(df['Amount'].mean()),
-            "median_expense": float(df['Amount'].median()),
+            "median_expense": from_cents(cube.quantile(0.5)),
+            "p90_expense": from_cents(cube.quantile(0.9)),
+            "p99_expense": from_cents(cube.quantile(0.99)),
+            "category_percentiles": {
+                category: {name: from_cents(value) for name, value in percentiles.items()}
+                for category, percentiles in cube.category_percentiles().items()
+            },
             "max_expense": float(df['Amount'].max()),
             "weekend_vs_weekday": self._weekend_weekday_comparison(features),
             "monthly_trend": self._monthly_trend(features)
@@ -0,0 +1,138 @@
+import re
+import zlib
+import numpy as np
+import pandas as pd
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+_WORD_PATTERN = re.compile(r"[^\W\d_]+")
+
+class CategoryClassifier:
+    """
+    Multinomial naive Bayes over hashed word and bigram features.
+
+    Features are hashed into a fixed-size space (crc32, stable across
+    processes), so the vocabulary never needs to be stored or rebuilt.
+    Training is purely additive: `partial_fit` and `update` just bump
+    counts, which makes online learning from each saved expense free.
+    Scoring a description touches only its own handful of features.
+    """
+
+    def __init__(self, n_features: int = 2 ** 16, alpha: float = 0.5):
+        self.n_features = n_features
+        self.alpha = alpha
+        self.classes: List[str] = []
+        self._class_index: Dict[str, int] = {}
+        self.feature_counts = np.zeros((0, n_features), dtype=np.float32)
+        self.class_totals = np.zeros(0, dtype=np.float64)
+        self.class_docs = np.zeros(0, dtype=np.float64)
+        self.version = 0
+
+    # ========================================================================
+    # FEATURES
+    # ========================================================================
+
+    def features(self, text: Optional[str]) -> np.ndarray:
+        """Hashed unigram + bigram feature ids of a text"""
+        if not isinstance(text, str):
+            return np.zeros(0, dtype=np.int64)
+
+        words = _WORD_PATTERN.findall(text.lower())
+        grams = words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+        return np.fromiter(
+            (zlib.crc32(g.encode("utf-8")) % self.n_features for g in grams),
+            dtype=np.int64, count=len(grams)
+        )
+
+    # ========================================================================
+    # TRAINING
+    # ========================================================================
+
+    def _ensure_class(self, label: str) -> int:
+        idx = self._class_index.get(label)
+        if idx is None:
+            idx = len(self.classes)
+            self.classes.append(label)
+            self._class_index[label] = idx
+            self.feature_counts = np.vstack(
+                [self.feature_counts, np.zeros((1, self.n_features), dtype=np.float32)]
+            )
+            self.class_totals = np.append(self.class_totals, 0.0)
+            self.class_docs = np.append(self.class_docs, 0.0)
+        return idx
+
+    def update(self, text: Optional[str], label: str) -> None:
+        """Online update with a single labelled description"""
+        self.partial_fit([text], [label])
+
+    def partial_fit(self, texts: Sequence[Optional[str]], labels: Sequence[str]) -> "CategoryClassifier":
+        """Add labelled examples; empty descriptions only count toward the prior"""
+        for text, label in zip(texts, labels):
+            idx = self._ensure_class(str(label))
+            feats = self.features(text)
+            np.add.at(self.feature_counts[idx], feats, 1.0)
+            self.class_totals[idx] += len(feats)
+            self.class_docs[idx] += 1
+        self.version += 1
+        return self
+
+    def fit_frame(self, df: pd.DataFrame, text_column: str = 'description',
+                  label_column: str = 'category') -> "CategoryClassifier":
+        """Train from an expense frame (e.g. ExpenseRepository.get_all_expenses())"""
+        if df is None or df.empty:
+            return self
+        return self.partial_fit(df[text_column].tolist(), df[label_column].astype(str).tolist())
+
+    @property
+    def is_trained(self) -> bool:
+        return bool(self.classes) and self.class_docs.sum() > 0
+
+    # ========================================================================
+    # SCORING
+    # ========================================================================
+
+    def _log_scores(self, feats: np.ndarray) -> np.ndarray:
+        log_prior = np.log(self.class_docs + 1.0) - np.log(self.class_docs.sum() + len(self.classes))
+        if feats.size == 0:
+            return log_prior
+        denominator = np.log(self.class_totals + self.alpha * self.n_features)
+        numerators = np.log(self.feature_counts[:, feats] + self.alpha).sum(axis=1)
+        return log_prior + numerators - feats.size * denominator
+
+    def predict_proba(self, text: Optional[str]) -> Dict[str, float]:
+        """Posterior probability per known category"""
+        if not self.is_trained:
+            return {}
+        scores = self._log_scores(self.features(text))
+        probs = np.exp(scores - scores.max())
+        probs /= probs.sum()
+        return dict(zip(self.classes, probs.tolist()))
+
+    def predict(self, text: Optional[str]) -> Tuple[Optional[str], float]:
+        """
+        (best category, probability); (None, 0.0) before any training or
+        when the text has no feature seen in training, since the class prior
+        alone is no evidence about it
+        """
+        if not self.is_trained:
+            return None, 0.0
+        feats = self.features(text)
+        feats = feats[self.feature_counts[:, feats].any(axis=0)]
+        if feats.size == 0:
+            return None, 0.0
+        scores = self._log_scores(feats)
+        probs = np.exp(scores - scores.max())
+        best = int(probs.argmax())
+        return self.classes[best], float(probs[best] / probs.sum())
+
+    def predict_many(self, texts: Iterable[Optional[str]], min_confidence: float = 0.0,
+                     default: Optional[str] = None) -> pd.DataFrame:
+        """
+        Bulk auto-categorisation. Returns a frame with category and
+        confidence columns; rows under min_confidence get `default`.
+        """
+        categories, confidences = [], []
+        for text in texts:
+            label, confidence = self.predict(text)
+            categories.append(label if label is not None and confidence >= min_confidence else default)
+            confidences.append(confidence)
+        return pd.DataFrame({'category': categories, 'confidence': confidences})
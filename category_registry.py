@@ -0,0 +1,156 @@
+import json
+import os
+import threading
+from typing import Dict, Iterable, List, Optional
+import numpy as np
+import pandas as pd
+
+DEFAULT_CATEGORIES = [
+    "food", "transportation", "entertainment", "utilities",
+    "healthcare", "shopping", "other", "subscriptions", "rent"
+]
+
+# Spellings used by other sources (voice parser, imports) -> canonical name
+DEFAULT_ALIASES = {
+    "transport": "transportation",
+    "misc": "other",
+    "miscellaneous": "other",
+    "groceries": "food",
+    "health": "healthcare",
+    "subscription": "subscriptions",
+    "housing": "rent",
+}
+
+class CategoryRegistry:
+    """
+    Persisted, append-only mapping of category names to small integer codes.
+
+    Codes never change once assigned, so they are safe to store and to use
+    as model features. All spellings are normalised through `normalize`
+    (lowercase, trimmed, aliases resolved) before a code is looked up.
+    """
+
+    def __init__(self, path: str = "data/categories.json"):
+        self.path = path
+        self.names: List[str] = []
+        self.codes: Dict[str, int] = {}
+        self.aliases: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._dtype = None
+        self._load()
+
+    # ========================================================================
+    # PERSISTENCE
+    # ========================================================================
+
+    def _load(self) -> None:
+        data = {}
+        if os.path.exists(self.path):
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+
+        for name in data.get("categories", DEFAULT_CATEGORIES):
+            self._assign(name)
+        for name in DEFAULT_CATEGORIES:
+            self._assign(name)
+        self.aliases = {**DEFAULT_ALIASES, **data.get("aliases", {})}
+
+    def _save(self) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"categories": self.names, "aliases": self.aliases}, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def _assign(self, name: str) -> int:
+        code = self.codes.get(name)
+        if code is None:
+            if len(self.names) > np.iinfo(np.uint16).max:
+                raise ValueError("Category registry is full")
+            code = len(self.names)
+            self.names.append(name)
+            self.codes[name] = code
+            self._dtype = None
+        return code
+
+    # ========================================================================
+    # LOOKUPS
+    # ========================================================================
+
+    def normalize(self, name: Optional[str]) -> str:
+        """Canonical spelling of a category name"""
+        key = str(name).strip().lower() if name is not None and not pd.isna(name) else ""
+        if not key:
+            return "other"
+        return self.aliases.get(key, key)
+
+    def register(self, name: str, aliases: Iterable[str] = ()) -> int:
+        """Return the code for name, adding (and persisting) it if new"""
+        canonical = self.normalize(name)
+        with self._lock:
+            changed = canonical not in self.codes
+            code = self._assign(canonical)
+
+            for alias in aliases:
+                alias = alias.strip().lower()
+                if alias and alias != canonical and self.aliases.get(alias) != canonical:
+                    self.aliases[alias] = canonical
+                    changed = True
+
+            if changed:
+                self._save()
+        return code
+
+    def code(self, name: str) -> int:
+        """Code for an existing (or newly registered) category"""
+        canonical = self.normalize(name)
+        code = self.codes.get(canonical)
+        return code if code is not None else self.register(canonical)
+
+    def name(self, code: int) -> str:
+        return self.names[code]
+
+    def __contains__(self, name: str) -> bool:
+        return self.normalize(name) in self.codes
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @property
+    def custom_names(self) -> List[str]:
+        return [n for n in self.names if n not in DEFAULT_CATEGORIES]
+
+    @property
+    def dtype(self) -> pd.CategoricalDtype:
+        """Categorical dtype whose codes are the registry codes"""
+        if self._dtype is None:
+            self._dtype = pd.CategoricalDtype(categories=list(self.names))
+        return self._dtype
+
+    # ========================================================================
+    # VECTORISED ENCODING
+    # ========================================================================
+
+    def encode_codes(self, values) -> np.ndarray:
+        """uint16 registry codes for a column of raw category names"""
+        uniques_codes, uniques = pd.factorize(pd.Series(values, dtype=object).fillna(""))
+        lookup = np.array([self.code(u) for u in uniques], dtype=np.uint16)
+        return lookup[uniques_codes]
+
+    def encode(self, values) -> pd.Categorical:
+        """Normalise a column of raw names into a registry-coded Categorical"""
+        codes = self.encode_codes(values)
+        return pd.Categorical.from_codes(codes.astype(np.int32), dtype=self.dtype)
+
+
+_REGISTRIES: Dict[str, CategoryRegistry] = {}
+
+def get_category_registry(path: str = "data/categories.json") -> CategoryRegistry:
+    """Process-wide registry instance for path"""
+    registry = _REGISTRIES.get(path)
+    if registry is None:
+        registry = _REGISTRIES.setdefault(path, CategoryRegistry(path))
+    return registry
@@ -0,0 +1,152 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+from src.models.money import from_cents
+from src.ui.figure_cache import cached_figure
+from src.utils.perf import timed
+
+# Plotly lines stay readable down to ~2 px per point
+PIXELS_PER_POINT = 2
+MIN_POINTS = 50
+FULL_WIDTH = 1200
+HALF_WIDTH = 600
+
+def point_budget(width_px: int = FULL_WIDTH) -> int:
+    """Number of points worth sending for a chart of the given pixel width"""
+    return max(MIN_POINTS, int(width_px) // PIXELS_PER_POINT)
+
+# ============================================================================
+# DOWNSAMPLING
+# ============================================================================
+
+def lttb(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets: indices of `threshold` points that keep
+    the visual shape of (x, y). First and last points are always kept.
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    # Interior points split into threshold - 2 buckets
+    edges = (np.arange(threshold - 1) * (n - 2) / (threshold - 2)).astype(np.int64) + 1
+    edges[-1] = n - 1
+
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for i in range(threshold - 2):
+        lo, hi = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            next_lo, next_hi = edges[i + 1], edges[i + 2]
+            avg_x, avg_y = x[next_lo:next_hi].mean(), y[next_lo:next_hi].mean()
+        else:
+            avg_x, avg_y = x[-1], y[-1]
+
+        # Twice the triangle area against the previous pick and the next bucket's mean
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(area.argmax())
+        selected[i + 1] = a
+    return selected
+
+def min_max(y: np.ndarray, threshold: int) -> np.ndarray:
+    """
+    Indices of each bucket's minimum and maximum (spikes are never lost),
+    plus the first and last points, at most `threshold` in all
+    """
+    n = len(y)
+    if threshold >= n or threshold < 4:
+        return np.arange(n)
+
+    y = np.asarray(y)
+    edges = np.linspace(0, n, (threshold - 2) // 2 + 1).astype(np.int64)
+    picks = [0, n - 1]
+    for lo, hi in zip(edges[:-1], edges[1:]):
+        if hi > lo:
+            picks.append(lo + int(y[lo:hi].argmin()))
+            picks.append(lo + int(y[lo:hi].argmax()))
+    return np.unique(picks)
+
+DOWNSAMPLERS = {'lttb', 'minmax'}
+
+def downsample(series: pd.Series, max_points: int, method: str = 'lttb') -> pd.Series:
+    """Series reduced to at most max_points points; datetime indexes are used as x"""
+    if len(series) <= max_points:
+        return series
+    if method not in DOWNSAMPLERS:
+        raise ValueError(f"Unknown downsampling method: {method}")
+
+    values = series.to_numpy(dtype=np.float64)
+    if method == 'minmax':
+        keep = min_max(values, max_points)
+    else:
+        if isinstance(series.index, pd.DatetimeIndex):
+            x = series.index.asi8
+        else:
+            x = np.arange(len(series))
+        keep = lttb(x, values, max_points)
+    return series.iloc[keep]
+
+# ============================================================================
+# SERIES
+# ============================================================================
+
+def daily_series(cube, start=None, end=None) -> pd.Series:
+    """Daily totals in cents between start and end (inclusive), trimmed to active days"""
+    daily = cube.daily_totals()
+    active = np.flatnonzero(daily.to_numpy())
+    if len(active) == 0:
+        return daily.iloc[:0]
+    daily = daily.iloc[active[0]:active[-1] + 1]
+    if start is not None or end is not None:
+        daily = daily.loc[start:end]
+    return daily
+
+def monthly_series(cube) -> pd.Series:
+    """Monthly totals in cents, indexed by month start"""
+    monthly = cube.monthly_totals()
+    monthly.index = pd.PeriodIndex(monthly.index, freq='M').to_timestamp()
+    return monthly
+
+# ============================================================================
+# RENDERING
+# ============================================================================
+
+@timed()
+def render_daily_trend(cube, key: str, title: str = "Daily Spending", width: int = FULL_WIDTH,
+                       method: str = 'lttb', height: int = 350, version=None) -> None:
+    """
+    Daily spending line with a zoom slider. Zooming re-fetches the visible
+    range from the cube, so narrower ranges show finer detail within the
+    same point budget. With a data version, each zoom range's figure is
+    served from the shared figure cache.
+    """
+    full = daily_series(cube)
+    if len(full) < 2:
+        return
+
+    first, last = full.index[0].date(), full.index[-1].date()
+    start, end = st.slider(
+        "Zoom", min_value=first, max_value=last, value=(first, last), key=f"{key}_zoom"
+    )
+    visible = daily_series(cube, pd.Timestamp(start), pd.Timestamp(end))
+    budget = point_budget(width)
+
+    def build():
+        # plotly is only needed on a figure-cache miss
+        import plotly.express as px
+        
+        points = downsample(visible, budget, method)
+        fig = px.line(
+            x=points.index, y=from_cents(points.to_numpy()), title=title,
+            labels={'x': 'Date', 'y': 'Amount ($)'}, color_discrete_sequence=['#667eea']
+        )
+        fig.update_layout(height=height, plot_bgcolor='rgba(0,0,0,0)')
+        return fig
+
+    params = (str(start), str(end), budget, method, title, height)
+    st.plotly_chart(cached_figure('daily_trend', version, build, params), use_container_width=True)
+    if len(visible) > budget:
+        st.caption(f"Showing at most {budget} of {len(visible)} days; zoom in for more detail")
\ No newline at end of file
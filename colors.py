@@ -2,6 +2,7 @@
 Semantic Color System - Design Tokens
 Fixes color overshadowing and establishes clear visual hierarchy
 """
+from types import MappingProxyType
 
 # Base Color Palette
 BASE_COLORS = {
@@ -145,15 +146,133 @@ DARK_MODE_COLORS = {
     }
 }
 
+# ============================================================================
+# PRECOMPUTED TOKENS AND CSS (built once at import)
+# ============================================================================
+
+def _flatten(tree, prefix=''):
+    """{'text': {'primary': c}} -> {'text.primary': c}"""
+    flat = {}
+    for key, value in tree.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(_flatten(value, path + '.'))
+        else:
+            flat[path] = value
+    return flat
+
+# Dark mode replaces whole groups ('text', 'background'), as get_color always
+# did; paths a replaced group lacks (text.disabled) fall back to '#000000'
+THEME_TOKENS = {
+    'light': MappingProxyType(_flatten(SEMANTIC_COLORS)),
+    'dark': MappingProxyType(_flatten({**SEMANTIC_COLORS, **DARK_MODE_COLORS})),
+}
+
 def get_color(path, dark_mode=False):
     """Get color by semantic path (e.g., 'text.primary')"""
-    colors = {**SEMANTIC_COLORS, **(DARK_MODE_COLORS if dark_mode else {})}
-    keys = path.split('.')
-    
-    try:
-        result = colors
-        for key in keys:
-            result = result[key]
-        return result
-    except (KeyError, TypeError):
-        return '#000000'
\ No newline at end of file
+    return THEME_TOKENS['dark' if dark_mode else 'light'].get(path, '#000000')
+
+def _build_theme_css(tokens):
+    return f"""
+<style>
+    :root {{
+        /* Text Colors */
+        --text-primary: {tokens['text.primary']};
+        --text-secondary: {tokens['text.secondary']};
+        --text-muted: {tokens['text.muted']};
+        --text-inverse: {tokens['text.inverse']};
+        
+        /* Background Colors */
+        --bg-primary: {tokens['background.primary']};
+        --bg-secondary: {tokens['background.secondary']};
+        --bg-tertiary: {tokens['background.tertiary']};
+        
+        /* Interactive Colors */
+        --interactive-primary: {tokens['interactive.primary.default']};
+        --interactive-primary-hover: {tokens['interactive.primary.hover']};
+        --interactive-success: {tokens['interactive.success.default']};
+        --interactive-warning: {tokens['interactive.warning.default']};
+        --interactive-danger: {tokens['interactive.danger.default']};
+        
+        /* Financial Colors */
+        --financial-positive: {tokens['financial.positive']};
+        --financial-negative: {tokens['financial.negative']};
+        --financial-neutral: {tokens['financial.neutral']};
+        --financial-pending: {tokens['financial.pending']};
+    }}
+    
+    .stApp {{
+        background-color: var(--bg-primary);
+        color: var(--text-primary);
+    }}
+    
+    .stSidebar {{
+        background-color: var(--bg-secondary);
+    }}
+    
+    .stSelectbox > div > div {{
+        background-color: var(--bg-secondary);
+        color: var(--text-primary);
+        border-color: var(--bg-tertiary);
+    }}
+    
+    .stMetric {{
+        background-color: var(--bg-secondary);
+        padding: 1rem;
+        border-radius: 0.75rem;
+        border: 1px solid var(--bg-tertiary);
+    }}
+    
+    .stButton > button {{
+        background-color: var(--interactive-success);
+        color: var(--text-inverse);
+        border: none;
+        border-radius: 0.5rem;
+        font-weight: 600;
+        transition: background-color 0.2s ease;
+    }}
+    
+    .stButton > button:hover {{
+        background-color: var(--interactive-primary-hover);
+    }}
+    
+    .stDataFrame {{
+        background-color: var(--bg-secondary);
+    }}
+    
+    h1, h2, h3 {{
+        color: var(--text-primary);
+    }}
+    
+    /* Financial Status Colors */
+    .positive {{ color: var(--financial-positive); }}
+    .negative {{ color: var(--financial-negative); }}
+    .neutral {{ color: var(--financial-neutral); }}
+    .pending {{ color: var(--financial-pending); }}
+    
+    /* Status Indicators */
+    .status-success {{ 
+        background-color: rgba(34, 197, 94, 0.1);
+        color: var(--interactive-success);
+        border: 1px solid rgba(34, 197, 94, 0.2);
+    }}
+    
+    .status-warning {{ 
+        background-color: rgba(245, 158, 11, 0.1);
+        color: var(--interactive-warning);
+        border: 1px solid rgba(245, 158, 11, 0.2);
+    }}
+    
+    .status-danger {{ 
+        background-color: rgba(239, 68, 68, 0.1);
+        color: var(--interactive-danger);
+        border: 1px solid rgba(239, 68, 68, 0.2);
+    }}
+</style>
+"""
+
+THEME_CSS = MappingProxyType({theme: _build_theme_css(tokens) for theme, tokens in THEME_TOKENS.items()})
+
+def get_theme_css(theme='dark'):
+    """Precomputed <style> block for a theme ('Light', 'Dark' or 'Auto'; Auto is dark)"""
+    return THEME_CSS.get(str(theme).lower(), THEME_CSS['dark'])
\ No newline at end of file
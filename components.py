@@ -1,4 +1,9 @@
+import numpy as np
+import pandas as pd
 import streamlit as st
+from src.models.money import format_money_series
+from src.services.export_service import EXPORT_FORMATS, get_export_service
+from src.utils.perf import timed
 
 def render_category_chart(category_totals):
     if category_totals.empty:
@@ -12,4 +17,76 @@ def render_expense_table(df):
         st.info("No expenses logged yet")
         return
     
-    st.dataframe(df, use_container_width=True)
\ No newline at end of file
+    st.dataframe(df, use_container_width=True)
+
+def render_download_button(label, build, name, version, filters=None, fmt='csv', lazy=True, **button_kwargs):
+    """
+    Download button backed by the export service. build() returns the frame
+    to export and only runs when no export exists for (name, version,
+    filters). With lazy=True nothing is generated until the user asks.
+    """
+    exports = get_export_service()
+    path = exports.cached(name, version, filters, fmt)
+    
+    if path is None:
+        if lazy and not st.button(f"⚙️ Prepare {label}", key=f"prepare_{name}_{fmt}",
+                                  use_container_width=button_kwargs.get('use_container_width', False)):
+            return
+        path = exports.export(build, name, version, filters, fmt)
+    
+    with open(path, 'rb') as f:
+        st.download_button(
+            label, f,
+            file_name=f"{name}.{EXPORT_FORMATS[fmt][1]}",
+            mime=exports.mime(fmt),
+            key=f"download_{name}_{fmt}",
+            **button_kwargs
+        )
+
+SORT_LABELS = {'date': 'Date', 'amount_cents': 'Amount', 'category': 'Category'}
+PAGE_SIZES = [25, 50, 100]
+
+@timed()
+def render_paginated_table(df, index, ids=None, key="transactions", date_format='%Y-%m-%d %H:%M'):
+    """
+    Transaction table that sends one page to the browser. Rows are sorted
+    through the FilterIndex's cached orders, sliced on the server, and only
+    the visible page is formatted, so cost doesn't grow with history size.
+    """
+    if ids is None:
+        ids = np.arange(index.size)
+    if len(ids) == 0:
+        st.info("No expenses logged yet")
+        return
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        sort_by = st.selectbox("Sort by", list(SORT_LABELS), format_func=SORT_LABELS.get, key=f"{key}_sort")
+    
+    with col2:
+        descending = st.checkbox("Newest / largest first", value=True, key=f"{key}_descending")
+    
+    with col3:
+        page_size = st.selectbox("Rows per page", PAGE_SIZES, key=f"{key}_page_size")
+    
+    # Filters can shrink the result under the current page; clamp before the widget exists
+    n_pages = max(1, -(-len(ids) // page_size))
+    page_key = f"{key}_page"
+    st.session_state[page_key] = min(max(1, st.session_state.get(page_key, 1)), n_pages)
+    
+    with col4:
+        page = st.number_input("Page", min_value=1, max_value=n_pages, step=1, key=page_key)
+    
+    ordered = index.sort_ids(ids, sort_by, ascending=not descending)
+    first = (page - 1) * page_size
+    rows = df.iloc[ordered[first:first + page_size]]
+    
+    display = pd.DataFrame({
+        'date': rows['date'].dt.strftime(date_format),
+        'category': rows['category'].astype(str),
+        'amount': format_money_series(rows['amount_cents']),
+        'description': rows['description']
+    })
+    st.dataframe(display, use_container_width=True, hide_index=True)
+    st.caption(f"Rows {first + 1}–{first + len(rows)} of {len(ids)} · page {page} of {n_pages}")
\ No newline at end of file
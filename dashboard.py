@@ -2,14 +2,22 @@ import streamlit as st
 from src.services.expense_service import ExpenseService
 from src.services.literacy_service import LiteracyService
 from src.models.goal import CreditInfo
-from src.ui.components import render_category_chart, render_expense_table
+from src.ui.components import render_category_chart, render_expense_table, render_download_button
+from src.services.export_service import PARQUET_AVAILABLE, export_frame
+from src.ui.analytics import get_category_color_map
+from src.ui.chart_data import render_daily_trend
+from src.ui.figure_cache import cached_figure
+from src.models.money import from_cents, format_money, format_money_series
+from src.utils.perf import timed
 import pandas as pd
 import io
 
+@timed()
 def render_dashboard(service: ExpenseService):
     st.title("💰 Fedha Yako")
     
     df = service.get_all_expenses()
+    version = service.repository.get_data_version()
     literacy_service = LiteracyService()
     
     # Credit Score Gauge
@@ -22,8 +30,8 @@ def render_dashboard(service: ExpenseService):
         st.metric("Credit Utilization", f"{credit_info.utilization:.1%}")
     with col3:
         if not df.empty:
-            total_spending = df['amount'].sum()
-            st.metric("Total Spending", f"${total_spending:.2f}")
+            total_spending = df['amount_cents'].sum()
+            st.metric("Total Spending", format_money(total_spending))
         else:
             st.metric("Total Spending", "$0.00")
     
@@ -40,15 +48,18 @@ def render_dashboard(service: ExpenseService):
         
         if not recent_expenses.empty:
             # Display table
-            st.dataframe(recent_expenses[['date', 'amount', 'category', 'description']], use_container_width=True)
+            display_recent = pd.DataFrame({
+                'date': recent_expenses['date'],
+                'amount': format_money_series(recent_expenses['amount_cents']),
+                'category': recent_expenses['category'],
+                'description': recent_expenses['description']
+            })
+            st.dataframe(display_recent, use_container_width=True)
             
-            # CSV Export for Recent Activity
-            csv_recent = recent_expenses.to_csv(index=False)
-            st.download_button(
-                label="📋 Download Recent Activity CSV",
-                data=csv_recent,
-                file_name="recent_expenses.csv",
-                mime="text/csv"
+            # CSV Export for Recent Activity (written once per data version)
+            render_download_button(
+                "📋 Download Recent Activity CSV", lambda: export_frame(recent_expenses),
+                "recent_expenses", version, filters={'limit': len(recent_expenses)}, lazy=False
             )
         else:
             st.info("No expenses logged yet. Add one using the sidebar!")
@@ -59,56 +70,41 @@ def render_dashboard(service: ExpenseService):
         if not df.empty:
             category_totals = service.get_category_totals(df)
             
-            # Enhanced bar chart with attractive colors
-            import plotly.express as px
-            
-            # Dynamic color mapping for custom categories
-            base_colors = {
-                'food': "#FFE96B",
-                'transportation': "#50EBCC", 
-                'entertainment': "#3827C0",
-                'utilities': '#00CEC9',
-                'healthcare': "#5231E9",
-                'shopping': '#E17055',
-                'other': "#EE175F"
-            }
-            
-            # Generate colors for custom categories
-            custom_colors = ['#FF9F43', '#10AC84', '#5F27CD', '#00D2D3', '#FF6348', '#C44569', '#40407A']
-            color_map = base_colors.copy()
-            
-            custom_idx = 0
-            for cat in category_totals.index:
-                if cat not in color_map:
-                    color_map[cat] = custom_colors[custom_idx % len(custom_colors)]
-                    custom_idx += 1
+            # Enhanced bar chart with attractive colors, built once per data version
+            def build_category_chart():
+                import plotly.express as px
+                
+                # Same stable per-category colors as the analytics page
+                color_map = get_category_color_map(category_totals.index)
+                
+                fig = px.bar(
+                    x=category_totals.index,
+                    y=from_cents(category_totals.values),
+                    title="Category Spending",
+                    color=category_totals.index,
+                    color_discrete_map=color_map
+                )
+                fig.update_layout(showlegend=False, plot_bgcolor='rgba(0,0,0,0)')
+                return fig
             
-            fig = px.bar(
-                x=category_totals.index,
-                y=category_totals.values,
-                title="Category Spending",
-                color=category_totals.index,
-                color_discrete_map=color_map
+            st.plotly_chart(
+                cached_figure('dashboard.category_bar', version, build_category_chart),
+                use_container_width=True
             )
-            fig.update_layout(showlegend=False, plot_bgcolor='rgba(0,0,0,0)')
-            st.plotly_chart(fig, use_container_width=True)
             
             # Show category breakdown table
             category_df = pd.DataFrame({
                 'Category': category_totals.index,
-                'Amount': category_totals.values,
+                'Amount': from_cents(category_totals.values),
                 'Percentage': (category_totals.values / category_totals.sum() * 100).round(1)
             })
             
             st.dataframe(category_df, use_container_width=True)
             
             # CSV Export for Category Analysis
-            csv_categories = category_df.to_csv(index=False)
-            st.download_button(
-                label="📋 Download Category Analysis CSV",
-                data=csv_categories,
-                file_name="category_spending.csv",
-                mime="text/csv"
+            render_download_button(
+                "📋 Download Category Analysis CSV", lambda: category_df,
+                "category_spending", version, lazy=False
             )
         else:
             st.info("No data to display")
@@ -121,12 +117,12 @@ def render_dashboard(service: ExpenseService):
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            total_spending = df['amount'].sum()
-            st.metric("💰 Total Spending", f"${total_spending:.2f}")
+            total_spending = df['amount_cents'].sum()
+            st.metric("💰 Total Spending", format_money(total_spending))
         
         with col2:
-            avg_expense = df['amount'].mean()
-            st.metric("📉 Average Expense", f"${avg_expense:.2f}")
+            avg_expense = df['amount_cents'].mean()
+            st.metric("📉 Average Expense", format_money(avg_expense))
         
         with col3:
             expense_count = len(df)
@@ -135,6 +131,9 @@ def render_dashboard(service: ExpenseService):
         with col4:
             categories_used = df['category'].nunique()
             st.metric("🏷️ Categories Used", categories_used)
+        
+        # Same downsampled, zoomable daily trend as the analytics page
+        render_daily_trend(service.get_cube(df), key="dashboard_daily", version=version)
     
     # Full Data Export
     if not df.empty:
@@ -142,12 +141,13 @@ def render_dashboard(service: ExpenseService):
         col1, col2, col3 = st.columns(3)
         
         with col2:
-            # Complete dataset export
-            csv_all = df.to_csv(index=False)
-            st.download_button(
-                label="📦 Download Complete Dataset CSV",
-                data=csv_all,
-                file_name="all_expenses.csv",
-                mime="text/csv",
-                use_container_width=True
-            )
\ No newline at end of file
+            # Complete dataset export, generated only when asked for
+            render_download_button(
+                "📦 Download Complete Dataset CSV", lambda: export_frame(df),
+                "all_expenses", version, use_container_width=True
+            )
+            if PARQUET_AVAILABLE:
+                render_download_button(
+                    "📦 Download Complete Dataset Parquet", lambda: export_frame(df),
+                    "all_expenses", version, fmt='parquet', use_container_width=True
+                )
\ No newline at end of file
@@ -1 +1,47 @@
-import pandas as pd\nfrom sklearn.preprocessing import LabelEncoder\n\nclass DataProcessor:\n    def __init__(self):\n        self.label_encoder = LabelEncoder()\n    \n    def prepare_features(self, df):\n        if df.empty:\n            return pd.DataFrame()\n        \n        df = df.copy()\n        df['month'] = pd.to_datetime(df['date']).dt.month\n        df['day_of_week'] = pd.to_datetime(df['date']).dt.dayofweek\n        df['category_encoded'] = self.label_encoder.fit_transform(df['category'])\n        \n        return df[['month', 'day_of_week', 'category_encoded', 'amount']]
\ No newline at end of file
+import pandas as pd
+from src.models.category_registry import get_category_registry
+from src.models.money import from_cents
+
+FEATURE_COLUMNS = ['month', 'day', 'day_of_week', 'is_weekend', 'category_encoded', 'week_of_month']
+
+class DataProcessor:
+    """
+    Model features for the budget predictor. Categories are encoded with
+    registry codes on both the training and the prediction side, so the
+    encoding never depends on which categories a training set happened to hold.
+    """
+
+    def __init__(self, registry=None):
+        self.registry = registry or get_category_registry()
+
+    def prepare_features(self, df):
+        """Feature frame (FEATURE_COLUMNS plus the 'amount' target in display units)"""
+        if df.empty:
+            return pd.DataFrame()
+
+        dates = pd.to_datetime(df['date'])
+        if 'amount_cents' in df:
+            amount = from_cents(df['amount_cents'].to_numpy())
+        else:
+            amount = df['amount'].to_numpy()
+
+        return pd.DataFrame({
+            'month': dates.dt.month,
+            'day': dates.dt.day,
+            'day_of_week': dates.dt.dayofweek,
+            'is_weekend': (dates.dt.dayofweek >= 5).astype(int),
+            'category_encoded': self.registry.encode_codes(df['category']).astype(int),
+            'week_of_month': (dates.dt.day - 1) // 7 + 1,
+            'amount': amount
+        }, index=df.index)
+
+    def feature_row(self, date, category):
+        """Single feature vector in FEATURE_COLUMNS order, encoded as in prepare_features"""
+        return [
+            date.month,
+            date.day,
+            date.weekday(),
+            1 if date.weekday() >= 5 else 0,
+            self.registry.code(category),
+            (date.day - 1) // 7 + 1
+        ]
\ No newline at end of file
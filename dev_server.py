@@ -1,31 +1,272 @@
+import argparse
+import email.utils
+import gzip
 import http.server
-import socketserver
+import json
 import os
+import shutil
 import webbrowser
+from http import HTTPStatus
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
 
 PORT = 8000
+DIRECTORY = "frontend"
+
+# Written by `vite build` (build.manifest in vite.config.ts); it lists every
+# content-hashed file of the build, e.g. assets/index-BX3f9a1c.js. A name that
+# merely looks hashed (assets/user-Settings.js) is never treated as one.
+MANIFEST = os.path.join(".vite", "manifest.json")
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+
+# Precompressed variants, in order of preference: (Accept-Encoding token, suffix)
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+COMPRESSIBLE = ('.html', '.js', '.mjs', '.css', '.json', '.svg', '.map', '.txt', '.xml', '.wasm')
+MIN_COMPRESS_BYTES = 1024
+
+def accepted_encodings(header: str) -> set:
+    """Codings a client accepts (q > 0) from an Accept-Encoding header"""
+    accepted = set()
+    for part in (header or "").split(','):
+        coding, _, params = part.strip().partition(';')
+        q = 1.0
+        for param in params.split(';'):
+            name, _, value = param.strip().partition('=')
+            if name == 'q':
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if coding and q > 0:
+            accepted.add(coding.lower())
+    if '*' in accepted:
+        accepted.update(coding for coding, _ in ENCODINGS)
+    return accepted
+
+_manifests = {}
+
+def hashed_assets(directory: str) -> frozenset:
+    """
+    Paths (relative to directory, '/'-separated) of the content-hashed files
+    listed in the build manifest, plus their source maps. Reloaded when the
+    manifest changes; empty without one, so everything is revalidated.
+    """
+    path = os.path.join(directory, MANIFEST)
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return frozenset()
+    cached = _manifests.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    try:
+        with open(path, encoding='utf-8') as f:
+            chunks = json.load(f).values()
+    except (OSError, ValueError, AttributeError):
+        return frozenset()
+    files = set()
+    for chunk in chunks:
+        if chunk.get('file'):
+            files.add(chunk['file'])
+        files.update(chunk.get('css', ()))
+        files.update(chunk.get('assets', ()))
+    files.update([name + '.map' for name in files])
+    result = frozenset(files)
+    _manifests[path] = (mtime, result)
+    return result
+
+def precompress(directory: str) -> int:
+    """
+    Write .gz (and .br when the brotli package is installed) next to every
+    compressible file that lacks an up-to-date variant. Returns files written.
+    """
+    written = 0
+    for root, _, files in os.walk(directory):
+        for name in files:
+            if not name.endswith(COMPRESSIBLE):
+                continue
+            path = os.path.join(root, name)
+            stat = os.stat(path)
+            if stat.st_size < MIN_COMPRESS_BYTES:
+                continue
+            with open(path, 'rb') as f:
+                data = f.read()
+
+            variants = [(".gz", lambda: gzip.compress(data, compresslevel=9, mtime=0))]
+            if BROTLI_AVAILABLE:
+                variants.append((".br", lambda: brotli.compress(data, quality=11)))
+            for suffix, compress in variants:
+                target = path + suffix
+                if os.path.exists(target) and os.stat(target).st_mtime_ns >= stat.st_mtime_ns:
+                    continue
+                tmp_path = target + '.tmp'
+                with open(tmp_path, 'wb') as f:
+                    f.write(compress())
+                os.replace(tmp_path, target)
+                written += 1
+    return written
 
 class Handler(http.server.SimpleHTTPRequestHandler):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, directory="frontend", **kwargs)
-    
+    """
+    Static handler for the built frontend.
+
+    Serves a precompressed .br/.gz variant when the client accepts it and
+    it is not older than the file, with strong ETags and Last-Modified
+    (answering conditional requests with 304), immutable caching for the
+    content-hashed files in the build manifest and revalidation for
+    everything else. Bodies are sent with sendfile. With no_cache every
+    response is uncacheable, as during development.
+    """
+
+    protocol_version = "HTTP/1.1"
+    no_cache = False
+
+    def __init__(self, *args, directory=DIRECTORY, **kwargs):
+        super().__init__(*args, directory=directory, **kwargs)
+
     def end_headers(self):
-        self.send_header('Cache-Control', 'no-cache, no-store, must-revalidate')
-        self.send_header('Pragma', 'no-cache')
-        self.send_header('Expires', '0')
+        if self.no_cache:
+            self.send_header('Cache-Control', 'no-cache, no-store, must-revalidate')
+            self.send_header('Pragma', 'no-cache')
+            self.send_header('Expires', '0')
         super().end_headers()
 
-if __name__ == "__main__":
+    def send_head(self):
+        if self.no_cache:
+            return super().send_head()
+
+        path = self.translate_path(self.path)
+        if os.path.isdir(path):
+            if not path.endswith("/"):
+                # Stock redirect to the trailing-slash URL
+                return super().send_head()
+            # "/" and "dir/" serve their index.html with the same headers as a direct request
+            index = os.path.join(path, "index.html")
+            if not os.path.isfile(index):
+                return super().send_head()
+            path = index
+
+        try:
+            stat = os.stat(path)
+        except OSError:
+            self.send_error(HTTPStatus.NOT_FOUND, "File not found")
+            return None
+
+        served_path, encoding, served_stat = self._select_variant(path, stat)
+        try:
+            f = open(served_path, 'rb')
+        except OSError:
+            self.send_error(HTTPStatus.NOT_FOUND, "File not found")
+            return None
+
+        etag = f'"{served_stat.st_size:x}-{served_stat.st_mtime_ns:x}{"-" + encoding if encoding else ""}"'
+        relative = os.path.relpath(path, self.directory).replace(os.sep, '/')
+        cache_control = IMMUTABLE if relative in hashed_assets(self.directory) else REVALIDATE
+        if self._not_modified(etag, stat.st_mtime):
+            f.close()
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self._send_validators(etag, stat.st_mtime, cache_control)
+            self.end_headers()
+            return None
+
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", self.guess_type(path))
+        self.send_header("Content-Length", str(served_stat.st_size))
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        self._send_validators(etag, stat.st_mtime, cache_control)
+        self.end_headers()
+        return f
+
+    def _select_variant(self, path, stat):
+        """(path, Content-Encoding or None, stat) of the best representation to send"""
+        if not path.endswith(COMPRESSIBLE):
+            return path, None, stat
+        accepted = accepted_encodings(self.headers.get("Accept-Encoding"))
+        for coding, suffix in ENCODINGS:
+            if coding not in accepted:
+                continue
+            try:
+                variant = os.stat(path + suffix)
+            except OSError:
+                continue
+            # A variant older than its source is stale; never serve it
+            if variant.st_mtime_ns >= stat.st_mtime_ns:
+                return path + suffix, coding, variant
+        return path, None, stat
+
+    def _send_validators(self, etag, mtime, cache_control):
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", self.date_time_string(mtime))
+        self.send_header("Cache-Control", cache_control)
+        self.send_header("Vary", "Accept-Encoding")
+
+    def _not_modified(self, etag, mtime) -> bool:
+        if_none_match = self.headers.get("If-None-Match")
+        if if_none_match is not None:
+            # If-None-Match takes precedence over If-Modified-Since (RFC 9110)
+            tags = [tag.strip() for tag in if_none_match.split(',')]
+            return '*' in tags or etag in tags or f"W/{etag}" in tags
+
+        if_modified_since = self.headers.get("If-Modified-Since")
+        if if_modified_since is None:
+            return False
+        try:
+            since = email.utils.parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, IndexError, OverflowError, ValueError):
+            return False
+        return int(mtime) <= since
+
+    def copyfile(self, source, outputfile):
+        """Zero-copy body transfer; socket.sendfile falls back to send() where unsupported"""
+        if outputfile is self.wfile and hasattr(self.connection, 'sendfile'):
+            self.connection.sendfile(source)
+        else:
+            shutil.copyfileobj(source, outputfile)
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the built frontend")
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--bind", default="", help="Address to listen on (default: all interfaces)")
+    parser.add_argument("--directory", default=DIRECTORY)
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Development mode: forbid caching of every response")
+    parser.add_argument("--precompress", action="store_true",
+                        help="Write .gz/.br variants of compressible files before serving")
+    parser.add_argument("--no-browser", action="store_true")
+    args = parser.parse_args()
+
     os.chdir(os.path.dirname(os.path.abspath(__file__)))
-    
-    with socketserver.TCPServer(("", PORT), Handler) as httpd:
-        print(f"Frontend development server running at http://localhost:{PORT}")
+
+    if args.precompress:
+        written = precompress(args.directory)
+        print(f"Precompressed {written} file(s){'' if BROTLI_AVAILABLE else ' (gzip only; install brotli for .br)'}")
+
+    handler = type("ConfiguredHandler", (Handler,), {"no_cache": args.no_cache})
+
+    def make_handler(*handler_args, **handler_kwargs):
+        return handler(*handler_args, directory=args.directory, **handler_kwargs)
+
+    # One thread per connection, so a slow client never blocks the others
+    with http.server.ThreadingHTTPServer((args.bind, args.port), make_handler) as httpd:
+        mode = "no-cache development mode" if args.no_cache else "cached mode"
+        print(f"Frontend server running at http://localhost:{args.port} ({mode})")
         print("Press Ctrl+C to stop the server")
-        
+
         # Open browser automatically to index.html
-        webbrowser.open(f"http://localhost:{PORT}/index.html")
-        
+        if not args.no_browser:
+            webbrowser.open(f"http://localhost:{args.port}/index.html")
+
         try:
             httpd.serve_forever()
         except KeyboardInterrupt:
-            print("\nServer stopped.")
\ No newline at end of file
+            print("\nServer stopped.")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -1,14 +1,131 @@
-from dataclasses import dataclass
-from datetime import datetime
-from typing import Optional
-
-@dataclass
-class Expense:
-    amount: float
-    category: str
-    description: Optional[str] = ""
-    date: datetime = None
-    
-    def __post_init__(self):
-        if self.date is None:
-            self.date = datetime.now()
\ No newline at end of file
+import sys
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterable, Iterator, List, Optional, Sequence
+from src.models.money import Cents, to_cents, from_cents
+
+# Category recorded for rows that arrive without one (the registry's "misc")
+MISSING_CATEGORY = "other"
+
+@dataclass(slots=True)
+class Expense:
+    amount_cents: Cents
+    category: str
+    description: Optional[str] = ""
+    date: datetime = None
+    
+    def __post_init__(self):
+        if self.date is None:
+            self.date = datetime.now()
+        self.amount_cents = int(self.amount_cents)
+    
+    @classmethod
+    def from_amount(cls, amount, category: str, description: Optional[str] = "", date: datetime = None):
+        """Build from a display-unit amount such as a form input"""
+        return cls(amount_cents=to_cents(amount), category=category, description=description, date=date)
+    
+    @property
+    def amount(self) -> float:
+        """Amount in display units, for rendering only"""
+        return from_cents(self.amount_cents)
+
+class ExpenseBatch:
+    """
+    Columnar block of expenses for bulk imports and streaming ingestion.
+    
+    Holds parallel numpy arrays (datetime64 dates, int64 cents, uint16
+    category codes into `categories`) plus an interned description list,
+    so a million rows cost a few arrays instead of a million objects.
+    """
+    
+    __slots__ = ('dates', 'amount_cents', 'category_codes', 'categories', 'descriptions')
+    
+    def __init__(
+        self,
+        dates: np.ndarray,
+        amount_cents: np.ndarray,
+        category_codes: np.ndarray,
+        categories: Sequence[str],
+        descriptions: List[str]
+    ):
+        if not (len(dates) == len(amount_cents) == len(category_codes) == len(descriptions)):
+            raise ValueError("ExpenseBatch columns must have equal length")
+        codes = np.asarray(category_codes)
+        if codes.size and (codes.min() < 0 or codes.max() >= len(categories)):
+            raise ValueError("ExpenseBatch category codes must index categories")
+        
+        self.dates = np.asarray(dates, dtype='datetime64[ns]')
+        self.amount_cents = np.asarray(amount_cents, dtype=np.int64)
+        self.category_codes = np.asarray(category_codes, dtype=np.uint16)
+        self.categories = tuple(categories)
+        self.descriptions = descriptions
+    
+    def __len__(self) -> int:
+        return len(self.amount_cents)
+    
+    def __iter__(self) -> Iterator[Expense]:
+        for i in range(len(self)):
+            yield self[i]
+    
+    def __getitem__(self, i: int) -> Expense:
+        return Expense(
+            amount_cents=int(self.amount_cents[i]),
+            category=self.categories[self.category_codes[i]],
+            description=self.descriptions[i],
+            date=pd.Timestamp(self.dates[i]).to_pydatetime()
+        )
+    
+    @classmethod
+    def from_expenses(cls, expenses: Iterable[Expense], registry=None) -> "ExpenseBatch":
+        """
+        Pack row objects (e.g. from a one-off import) into columns. With a
+        CategoryRegistry the codes are registry codes; otherwise they index
+        the distinct categories of this batch.
+        """
+        expenses = list(expenses)
+        raw = [e.category for e in expenses]
+        if registry is not None:
+            codes, categories = registry.encode_codes(raw), registry.names
+        else:
+            codes, categories = pd.factorize(pd.Index(raw, dtype=object).fillna(MISSING_CATEGORY))
+        return cls(
+            dates=np.array([np.datetime64(e.date, 'ns') for e in expenses], dtype='datetime64[ns]'),
+            amount_cents=np.fromiter((e.amount_cents for e in expenses), dtype=np.int64, count=len(expenses)),
+            category_codes=codes,
+            categories=list(categories),
+            descriptions=[sys.intern(e.description or "") for e in expenses]
+        )
+    
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "ExpenseBatch":
+        """
+        Wrap an expense frame; numeric columns are shared with df, not copied,
+        whenever their dtypes already match.
+        """
+        category = df['category']
+        if not isinstance(category.dtype, pd.CategoricalDtype):
+            category = category.astype('category')
+        if category.isna().any():
+            # Missing categories have code -1; file them under MISSING_CATEGORY
+            if MISSING_CATEGORY not in category.cat.categories:
+                category = category.cat.add_categories([MISSING_CATEGORY])
+            category = category.fillna(MISSING_CATEGORY)
+        
+        return cls(
+            dates=df['date'].to_numpy(dtype='datetime64[ns]'),
+            amount_cents=df['amount_cents'].to_numpy(dtype=np.int64),
+            category_codes=category.cat.codes.to_numpy(),
+            categories=list(category.cat.categories),
+            descriptions=[sys.intern(d) if isinstance(d, str) else "" for d in df['description']]
+        )
+    
+    def to_frame(self) -> pd.DataFrame:
+        """Expose the batch as an expense frame without copying the arrays"""
+        return pd.DataFrame({
+            'date': self.dates,
+            'amount_cents': self.amount_cents,
+            'category': pd.Categorical.from_codes(self.category_codes, categories=self.categories),
+            'description': self.descriptions
+        }, copy=False)
\ No newline at end of file
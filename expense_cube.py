@@ -0,0 +1,304 @@
+import numpy as np
+import pandas as pd
+from datetime import datetime
+from typing import Dict, List, Optional
+from src.services.quantile_sketch import KLLSketch
+from src.models.money import Cents
+from src.models.expense import ExpenseBatch
+
+_EMPTY_MIN = np.iinfo(np.int64).max
+_EMPTY_MAX = np.iinfo(np.int64).min
+
+WEEKDAYS = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+class ExpenseCube:
+    """
+    Pre-aggregated (day, category) cube of expenses.
+
+    Holds dense int64 arrays of sum/count/min/max (in cents) with one row per calendar
+    day and one column per category. Month, weekday and category rollups are
+    reductions over these arrays, so chart queries scale with
+    days x categories instead of the number of transactions.
+
+    Alongside the cube, a KLL quantile sketch is kept per category and per
+    month so medians and percentiles never need a full sort of the data.
+    """
+
+    def __init__(self):
+        self.start_day: Optional[np.datetime64] = None   # first day with an expense
+        self.n_days = 0
+        self._lead = 0   # spare rows before start_day, kept out of every view
+        self.categories: List[str] = []
+        self._category_index: Dict[str, int] = {}
+        self._allocate(0, 0)
+        self.overall_sketch = KLLSketch()
+        self.category_sketches: Dict[str, KLLSketch] = {}
+        self.month_sketches: Dict[str, KLLSketch] = {}
+
+    def _allocate(self, day_capacity: int, category_capacity: int) -> None:
+        shape = (day_capacity, category_capacity)
+        self.sum = np.zeros(shape, dtype=np.int64)
+        self.count = np.zeros(shape, dtype=np.int64)
+        self.min = np.full(shape, _EMPTY_MIN, dtype=np.int64)
+        self.max = np.full(shape, _EMPTY_MAX, dtype=np.int64)
+
+    # ========================================================================
+    # CONSTRUCTION & INCREMENTAL UPDATES
+    # ========================================================================
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "ExpenseCube":
+        """Build a cube from an expense frame with date, amount_cents and category columns"""
+        cube = cls()
+        cube.add_frame(df)
+        return cube
+
+    def add(self, date: datetime, amount_cents: Cents, category: str) -> None:
+        """Fold a single expense into the cube"""
+        day = np.datetime64(pd.Timestamp(date).floor('D'), 'D')
+        self._add_arrays(
+            np.array([day]),
+            np.array([amount_cents], dtype=np.int64),
+            np.array([self._ensure_category(category)], dtype=np.int64)
+        )
+
+    def add_frame(self, df: pd.DataFrame) -> None:
+        """Fold every row of an expense frame into the cube"""
+        if df is None or df.empty:
+            return
+
+        category = df['category']
+        if not isinstance(category.dtype, pd.CategoricalDtype):
+            category = category.astype(str).astype('category')
+
+        self._add_arrays(
+            pd.to_datetime(df['date']).to_numpy().astype('datetime64[D]'),
+            df['amount_cents'].to_numpy(dtype=np.int64),
+            self._category_indices(category.cat.codes.to_numpy(), category.cat.categories)
+        )
+
+    def add_batch(self, batch: ExpenseBatch) -> None:
+        """Fold an ExpenseBatch into the cube straight from its arrays"""
+        if len(batch) == 0:
+            return
+
+        self._add_arrays(
+            batch.dates.astype('datetime64[D]'),
+            batch.amount_cents,
+            self._category_indices(batch.category_codes, batch.categories)
+        )
+
+    def _category_indices(self, codes: np.ndarray, categories) -> np.ndarray:
+        """Translate category codes into cube columns, one lookup per distinct category"""
+        # Only categories that occur get a column; registry dtypes list every known one
+        present = np.unique(codes)
+        lookup = np.zeros(len(categories), dtype=np.int64)
+        lookup[present] = [self._ensure_category(str(categories[c])) for c in present]
+        return lookup[codes]
+
+    def _add_arrays(self, days: np.ndarray, amounts: np.ndarray, cat_idx: np.ndarray) -> None:
+        self._ensure_days(days.min(), days.max())
+        day_idx = (days - self.start_day).astype(np.int64) + self._lead
+
+        np.add.at(self.sum, (day_idx, cat_idx), amounts)
+        np.add.at(self.count, (day_idx, cat_idx), 1)
+        np.minimum.at(self.min, (day_idx, cat_idx), amounts)
+        np.maximum.at(self.max, (day_idx, cat_idx), amounts)
+        self._update_sketches(days, amounts, cat_idx)
+
+    def _update_sketches(self, days: np.ndarray, amounts: np.ndarray, cat_idx: np.ndarray) -> None:
+        self.overall_sketch.update_many(amounts)
+
+        for idx in np.unique(cat_idx):
+            category = self.categories[idx]
+            sketch = self.category_sketches.setdefault(category, KLLSketch())
+            sketch.update_many(amounts[cat_idx == idx])
+
+        months = days.astype('datetime64[M]')
+        for month in np.unique(months):
+            sketch = self.month_sketches.setdefault(str(month), KLLSketch())
+            sketch.update_many(amounts[months == month])
+
+    def _ensure_category(self, category: str) -> int:
+        idx = self._category_index.get(category)
+        if idx is not None:
+            return idx
+
+        idx = len(self.categories)
+        self.categories.append(category)
+        self._category_index[category] = idx
+
+        if idx >= self.sum.shape[1]:
+            self._grow(extra_cols=max(self.sum.shape[1], 8))
+        return idx
+
+    def _ensure_days(self, first: np.datetime64, last: np.datetime64) -> None:
+        if self.start_day is None:
+            self.start_day = first
+
+        prepend = int((self.start_day - first).astype(np.int64))
+        if prepend > 0:
+            if prepend > self._lead:
+                # Leave headroom on the left so back-filled history stays amortised
+                pad = max(prepend - self._lead, self.n_days // 2)
+                self._grow(prepend_rows=pad)
+                self._lead += pad
+            self._lead -= prepend
+            self.start_day = first
+            self.n_days += prepend
+
+        needed = int((last - self.start_day).astype(np.int64)) + 1
+        rows = self._lead + needed
+        if rows > self.sum.shape[0]:
+            self._grow(extra_rows=max(rows, 2 * self.sum.shape[0], 32) - self.sum.shape[0])
+        self.n_days = max(self.n_days, needed)
+
+    def _grow(self, prepend_rows: int = 0, extra_rows: int = 0, extra_cols: int = 0) -> None:
+        old = (self.sum, self.count, self.min, self.max)
+        rows, cols = self.sum.shape
+        self._allocate(rows + prepend_rows + extra_rows, cols + extra_cols)
+
+        for new, prev in zip((self.sum, self.count, self.min, self.max), old):
+            new[prepend_rows:prepend_rows + rows, :cols] = prev
+
+    # ========================================================================
+    # ROLLUPS
+    # ========================================================================
+
+    @property
+    def is_empty(self) -> bool:
+        return self.n_days == 0 or not self.categories
+
+    def _view(self, arr: np.ndarray) -> np.ndarray:
+        """Slice off the unused capacity of a backing array"""
+        return arr[self._lead:self._lead + self.n_days, :len(self.categories)]
+
+    @property
+    def days(self) -> pd.DatetimeIndex:
+        if self.start_day is None:
+            return pd.DatetimeIndex([])
+        return pd.DatetimeIndex(self.start_day + np.arange(self.n_days))
+
+    @property
+    def total(self) -> Cents:
+        return int(self._view(self.sum).sum())
+
+    @property
+    def transaction_count(self) -> int:
+        return int(self._view(self.count).sum())
+
+    @property
+    def mean(self) -> float:
+        """Mean expense in (fractional) cents"""
+        count = self.transaction_count
+        return self.total / count if count else 0.0
+
+    @property
+    def max_amount(self) -> Cents:
+        return int(self._view(self.max).max()) if not self.is_empty else 0
+
+    def category_totals(self) -> pd.Series:
+        """Total spending per category"""
+        return pd.Series(self._view(self.sum).sum(axis=0), index=self.categories, name='amount_cents')
+
+    def category_counts(self) -> pd.Series:
+        return pd.Series(self._view(self.count).sum(axis=0), index=self.categories, name='count')
+
+    def daily_totals(self) -> pd.Series:
+        """Total spending per calendar day from the first to the last expense (gaps are zero)"""
+        return pd.Series(self._view(self.sum).sum(axis=1), index=self.days, name='amount_cents')
+
+    def monthly_totals(self) -> pd.Series:
+        """Total spending per month, indexed by 'YYYY-MM' labels"""
+        if self.is_empty:
+            return pd.Series(dtype=np.int64, name='amount_cents')
+
+        months = self.days.to_period('M')
+        codes, labels = pd.factorize(months, sort=True)
+        # np.bincount weights are float64; np.add.at keeps the int64 sums exact
+        totals = np.zeros(len(labels), dtype=np.int64)
+        counts = np.zeros(len(labels), dtype=np.int64)
+        np.add.at(totals, codes, self._view(self.sum).sum(axis=1))
+        np.add.at(counts, codes, self._view(self.count).sum(axis=1))
+
+        # Only months that actually saw an expense
+        keep = counts > 0
+        return pd.Series(totals[keep], index=labels.strftime('%Y-%m')[keep], name='amount_cents')
+
+    def weekday_average(self) -> pd.Series:
+        """Average expense per weekday in cents, Monday first"""
+        if self.is_empty:
+            return pd.Series(np.nan, index=WEEKDAYS, name='amount_cents')
+
+        weekday = self.days.dayofweek.to_numpy()
+        sums = np.bincount(weekday, weights=self._view(self.sum).sum(axis=1), minlength=7)
+        counts = np.bincount(weekday, weights=self._view(self.count).sum(axis=1), minlength=7)
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            averages = np.where(counts > 0, sums / counts, np.nan)
+        return pd.Series(averages, index=WEEKDAYS, name='amount_cents')
+
+    # ========================================================================
+    # QUANTILES
+    # ========================================================================
+
+    def quantile(self, q: float, category: Optional[str] = None, month: Optional[str] = None) -> float:
+        """
+        Approximate amount quantile in cents, overall or for one category / month ('YYYY-MM').
+        Returns NaN when there is no data for the requested slice.
+        """
+        if category is not None:
+            sketch = self.category_sketches.get(category)
+        elif month is not None:
+            sketch = self.month_sketches.get(month)
+        else:
+            sketch = self.overall_sketch
+        return sketch.quantile(q) if sketch is not None else np.nan
+
+    def category_percentiles(self, qs=(0.5, 0.9, 0.99)) -> Dict[str, Dict[str, float]]:
+        """Per-category percentiles in cents keyed like {'food': {'p50': .., 'p90': ..}}"""
+        return {
+            category: {f"p{round(q * 100):g}": float(sketch.quantile(q)) for q in qs}
+            for category, sketch in self.category_sketches.items()
+        }
+
+    # ========================================================================
+    # SERIALIZATION
+    # ========================================================================
+
+    def to_dict(self) -> Dict:
+        """Plain-python snapshot of the aggregates and their sketches"""
+        return {
+            "start_day": str(self.start_day) if self.start_day is not None else None,
+            "categories": list(self.categories),
+            "sum": self._view(self.sum).tolist(),
+            "count": self._view(self.count).tolist(),
+            "min": self._view(self.min).tolist(),
+            "max": self._view(self.max).tolist(),
+            "overall_sketch": self.overall_sketch.to_dict(),
+            "category_sketches": {k: v.to_dict() for k, v in self.category_sketches.items()},
+            "month_sketches": {k: v.to_dict() for k, v in self.month_sketches.items()}
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "ExpenseCube":
+        cube = cls()
+        cube.categories = list(data.get("categories", []))
+        cube._category_index = {c: i for i, c in enumerate(cube.categories)}
+
+        if data.get("start_day") is not None:
+            cube.start_day = np.datetime64(data["start_day"], 'D')
+            cube.sum = np.array(data["sum"], dtype=np.int64).reshape(-1, len(cube.categories))
+            cube.count = np.array(data["count"], dtype=np.int64).reshape(cube.sum.shape)
+            cube.min = np.array(data["min"], dtype=np.int64).reshape(cube.sum.shape)
+            cube.max = np.array(data["max"], dtype=np.int64).reshape(cube.sum.shape)
+            cube.n_days = cube.sum.shape[0]
+
+        cube.overall_sketch = KLLSketch.from_dict(data.get("overall_sketch", {}))
+        cube.category_sketches = {
+            k: KLLSketch.from_dict(v) for k, v in data.get("category_sketches", {}).items()
+        }
+        cube.month_sketches = {
+            k: KLLSketch.from_dict(v) for k, v in data.get("month_sketches", {}).items()
+        }
+        return cube
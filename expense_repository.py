@@ -1,29 +1,105 @@
+import csv
 import pandas as pd
 import os
-from src.models.expense import Expense
+from src.models.expense import Expense, ExpenseBatch
+from src.models.money import to_cents_array, compact_cents
+from src.models.category_registry import get_category_registry
+from src.utils.perf import timed
+from src.services.metrics import REGISTRY
+
+EXPENSE_WRITES = REGISTRY.counter("fedha_expense_writes_total", "Expense rows written to the repository")
+READ_SECONDS = REGISTRY.histogram("fedha_repository_read_seconds", "Latency of full repository reads")
+
+COLUMNS = ['date', 'amount_cents', 'category', 'description']
+# One date format from every write path; reads parse any ISO 8601 variant,
+# so files written before it (str(datetime), with or without microseconds) still load
+DATE_FORMAT = '%Y-%m-%d %H:%M:%S.%f'
+LEGACY_AMOUNT_COLUMN = 'amount'
 
 class ExpenseRepository:
     def __init__(self, csv_path="data/expenses.csv"):
         self.csv_path = csv_path
         self._ensure_data_dir()
+        self.registry = get_category_registry(
+            os.path.join(os.path.dirname(self.csv_path), "categories.json")
+        )
+        self._migrate_legacy_schema()
     
     def _ensure_data_dir(self):
         os.makedirs(os.path.dirname(self.csv_path), exist_ok=True)
     
+    def _migrate_legacy_schema(self):
+        """Rewrite files from the float 'amount' era to integer cents, once"""
+        if not os.path.exists(self.csv_path):
+            return
+        
+        with open(self.csv_path, 'r', encoding='utf-8') as f:
+            header = f.readline().strip().split(',')
+        
+        if LEGACY_AMOUNT_COLUMN not in header:
+            return
+        
+        df = pd.read_csv(self.csv_path, parse_dates=['date'], date_format='ISO8601')
+        df['amount_cents'] = to_cents_array(df[LEGACY_AMOUNT_COLUMN].fillna(0))
+        df[COLUMNS].to_csv(self.csv_path, index=False, date_format=DATE_FORMAT)
+    
+    @timed()
     def save_expense(self, expense: Expense):
-        df = pd.DataFrame([{
-            'date': expense.date,
-            'amount': expense.amount,
-            'category': expense.category,
-            'description': expense.description
-        }])
+        expense.category = self.normalize_category(expense.category)
+        # A single row goes straight through the csv module; no one-row frame
+        is_new = not os.path.exists(self.csv_path)
+        with open(self.csv_path, 'a', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f, lineterminator='\n')
+            if is_new:
+                writer.writerow(COLUMNS)
+            writer.writerow([expense.date.strftime(DATE_FORMAT), expense.amount_cents, expense.category, expense.description])
+        EXPENSE_WRITES.inc()
+    
+    def normalize_category(self, category: str) -> str:
+        """Canonical registry name for category, registering it if new"""
+        return self.registry.name(self.registry.code(category))
+    
+    @timed()
+    def save_batch(self, batch: ExpenseBatch):
+        """Append a whole ExpenseBatch in one write; returns it re-coded against the registry"""
+        if len(batch) == 0:
+            return batch
         
+        # Aliases are resolved once per distinct category, not per row
+        lookup = self.registry.encode_codes(list(batch.categories))
+        batch = ExpenseBatch(
+            batch.dates, batch.amount_cents, lookup[batch.category_codes],
+            self.registry.names, batch.descriptions
+        )
+        
+        df = batch.to_frame()
         if os.path.exists(self.csv_path):
-            df.to_csv(self.csv_path, mode='a', header=False, index=False)
+            df.to_csv(self.csv_path, mode='a', header=False, index=False, date_format=DATE_FORMAT)
         else:
-            df.to_csv(self.csv_path, index=False)
+            df.to_csv(self.csv_path, index=False, date_format=DATE_FORMAT)
+        EXPENSE_WRITES.inc(len(batch))
+        return batch
+    
+    def get_data_version(self):
+        """Cheap fingerprint of the stored data, changes on every write"""
+        if not os.path.exists(self.csv_path):
+            return None
+        stat = os.stat(self.csv_path)
+        return (stat.st_mtime_ns, stat.st_size)
     
+    @timed()
+    @READ_SECONDS.timed
     def get_all_expenses(self):
         if os.path.exists(self.csv_path):
-            return pd.read_csv(self.csv_path, parse_dates=['date'])
-        return pd.DataFrame(columns=['date', 'amount', 'category', 'description'])
\ No newline at end of file
+            df = pd.read_csv(
+                self.csv_path, parse_dates=['date'], date_format='ISO8601', dtype={'amount_cents': 'int64'}
+            )
+            df['amount_cents'] = compact_cents(df['amount_cents'].to_numpy())
+            df['category'] = self.registry.encode(df['category'])
+            return df
+        return pd.DataFrame({
+            'date': pd.Series(dtype='datetime64[ns]'),
+            'amount_cents': pd.Series(dtype='int64'),
+            'category': pd.Series(dtype=self.registry.dtype),
+            'description': pd.Series(dtype='object')
+        })
\ No newline at end of file
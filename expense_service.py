@@ -1,24 +1,149 @@
 import pandas as pd
-from src.models.expense import Expense
+from src.models.expense import Expense, ExpenseBatch
 from src.repositories.expense_repository import ExpenseRepository
+from src.services.expense_cube import ExpenseCube
+from src.services.filter_index import FilterIndex
+from src.ml.category_classifier import CategoryClassifier
+from src.utils.perf import span, timed
+from src.services.metrics import REGISTRY
+
+# Derived state outlives a single Streamlit rerun;
+# keyed by (kind, csv path) -> (data version, object)
+_DERIVED = {}
+
+# Kinds that add_expense/add_expenses update in place; others are rebuilt
+_INCREMENTAL = ('cube', 'classifier')
+
+def _read_only(column):
+    """A column's values backed by a read-only array (no copy of the data)"""
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        codes = column.cat.codes.to_numpy()
+        codes.flags.writeable = False
+        return pd.Categorical.from_codes(codes, dtype=column.dtype)
+    values = column.to_numpy()
+    values.flags.writeable = False
+    if values.dtype == column.dtype:
+        return values
+    return pd.array(values, dtype=column.dtype, copy=False)
+
+def freeze_frame(df):
+    """
+    The same frame built over read-only arrays, so writing values into a
+    frame shared across sessions raises instead of changing it for all of
+    them. Views and copies taken from it stay writable under copy-on-write.
+    """
+    return pd.DataFrame(
+        {name: _read_only(column) for name, column in df.items()}, index=df.index, copy=False
+    )
 
 class ExpenseService:
     def __init__(self):
         self.repository = ExpenseRepository()
     
+    def _live_state(self):
+        """Derived objects that are in sync with the stored data right now"""
+        version = self.repository.get_data_version()
+        return {
+            kind: obj
+            for (kind, path), (obj_version, obj) in _DERIVED.items()
+            if kind in _INCREMENTAL and path == self.repository.csv_path and obj_version == version
+        }
+    
+    def _mark_current(self, live):
+        version = self.repository.get_data_version()
+        for kind, obj in live.items():
+            _DERIVED[(kind, self.repository.csv_path)] = (version, obj)
+    
+    def _get_derived(self, kind, build):
+        version = self.repository.get_data_version()
+        cached = _DERIVED.get((kind, self.repository.csv_path))
+        if cached is not None and cached[0] == version:
+            self._count_lookup(kind, "hit")
+            return cached[1]
+        
+        self._count_lookup(kind, "miss")
+        with span(f"build {kind}"):
+            obj = build()
+        _DERIVED[(kind, self.repository.csv_path)] = (version, obj)
+        return obj
+    
+    @staticmethod
+    def _count_lookup(kind, result):
+        REGISTRY.counter(
+            "fedha_derived_cache_requests_total", "Derived-state lookups by kind and hit/miss",
+            {"cache": kind, "result": result}
+        ).inc()
+    
+    @timed()
     def add_expense(self, amount, category, description=""):
-        expense = Expense(amount=amount, category=category, description=description)
+        """Record an expense; amount is in display units and stored as cents"""
+        expense = Expense.from_amount(amount, category=category, description=description)
+        live = self._live_state()
+        
         self.repository.save_expense(expense)
+        
+        # Fold the new row into live derived state instead of rebuilding it
+        if 'cube' in live:
+            live['cube'].add(expense.date, expense.amount_cents, expense.category)
+        if 'classifier' in live:
+            live['classifier'].update(expense.description, expense.category)
+        self._mark_current(live)
+    
+    @timed()
+    def add_expenses(self, batch: ExpenseBatch):
+        """Bulk ingest path: one write and one vectorised cube update per batch"""
+        live = self._live_state()
+        
+        batch = self.repository.save_batch(batch)
+        
+        if 'cube' in live:
+            live['cube'].add_batch(batch)
+        if 'classifier' in live:
+            live['classifier'].partial_fit(
+                batch.descriptions, [batch.categories[c] for c in batch.category_codes]
+            )
+        self._mark_current(live)
     
     def get_all_expenses(self):
-        return self.repository.get_all_expenses()
+        """
+        Stored expenses, loaded once per data version. The frame is shared
+        between reruns and sessions: its arrays are read-only, so callers
+        take views of it and must not assign columns. Month and weekday
+        rollups come from the cube (get_cube), not from extra columns.
+        """
+        return self._get_derived('frame', lambda: freeze_frame(self.repository.get_all_expenses()))
+    
+    def get_cube(self, df=None):
+        """Day x category aggregate cube, rebuilt only when the stored data changes"""
+        return self._get_derived(
+            'cube', lambda: ExpenseCube.from_frame(df if df is not None else self.get_all_expenses())
+        )
+    
+    def get_filter_index(self, df=None):
+        """Category/amount/date filter index over the stored data"""
+        return self._get_derived(
+            'filter_index', lambda: FilterIndex.from_frame(df if df is not None else self.get_all_expenses())
+        )
+    
+    def get_category_classifier(self):
+        """Description -> category classifier trained on the stored history"""
+        return self._get_derived(
+            'classifier', lambda: CategoryClassifier().fit_frame(self.get_all_expenses())
+        )
+    
+    @timed()
+    def auto_categorize(self, descriptions, min_confidence=0.6, default="other"):
+        """Suggest categories for imported descriptions from the user's own history"""
+        return self.get_category_classifier().predict_many(
+            descriptions, min_confidence=min_confidence, default=default
+        )
     
     def get_recent_expenses(self, df, limit=5):
         if df.empty:
             return df
-        return df.sort_values('date', ascending=False).head(limit)
+        return df.nlargest(limit, 'date')
     
     def get_category_totals(self, df):
         if df.empty:
             return pd.Series()
-        return df.groupby('category')['amount'].sum()
\ No newline at end of file
+        return df.groupby('category', observed=True)['amount_cents'].sum()
\ No newline at end of file
@@ -0,0 +1,133 @@
+import hashlib
+import json
+import os
+import uuid
+from typing import Callable, Dict, Iterator, Optional
+import pandas as pd
+from src.models.money import from_cents
+from src.utils.perf import span
+
+try:
+    import pyarrow  # noqa: F401  (pandas' Parquet engine)
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+EXPORT_FORMATS = {
+    'csv': ('text/csv', 'csv'),
+    'parquet': ('application/vnd.apache.parquet', 'parquet'),
+}
+CHUNK_ROWS = 50000
+TMP_SUFFIX = '.tmp'
+# Downloadable expense files keep display-unit amounts; cents stay internal
+EXPORT_COLUMNS = ['date', 'amount', 'category', 'description']
+
+def export_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Expense rows in the user-facing export format (EXPORT_COLUMNS)"""
+    return pd.DataFrame({
+        'date': df['date'],
+        'amount': from_cents(df['amount_cents']),
+        'category': df['category'],
+        'description': df['description']
+    }, columns=EXPORT_COLUMNS)
+
+def stream_csv(df: pd.DataFrame, chunk_rows: int = CHUNK_ROWS) -> Iterator[str]:
+    """CSV text of df in pieces of at most chunk_rows rows (header first)"""
+    yield df.iloc[:0].to_csv(index=False)
+    for start in range(0, len(df), chunk_rows):
+        yield df.iloc[start:start + chunk_rows].to_csv(index=False, header=False)
+
+def filter_signature(filters: Optional[Dict] = None) -> str:
+    """Stable short hash of the filters an export was made with"""
+    payload = json.dumps(filters or {}, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:12]
+
+class ExportService:
+    """
+    On-demand export files.
+
+    An export is written only when asked for, streamed to disk in row chunks
+    (CSV) or as a compressed Parquet file, and kept under
+    (name, data version, filter signature). Later requests for the same
+    data reuse the file; a new data version replaces it.
+    """
+
+    def __init__(self, export_dir: str = "data/exports", chunk_rows: int = CHUNK_ROWS):
+        self.export_dir = export_dir
+        self.chunk_rows = chunk_rows
+        os.makedirs(self.export_dir, exist_ok=True)
+
+    def _path(self, name: str, version, filters: Optional[Dict], fmt: str) -> str:
+        version_tag = filter_signature({'version': version})
+        extension = EXPORT_FORMATS[fmt][1]
+        return os.path.join(
+            self.export_dir, f"{name}-{version_tag}-{filter_signature(filters)}.{extension}"
+        )
+
+    def cached(self, name: str, version, filters: Optional[Dict] = None, fmt: str = 'csv') -> Optional[str]:
+        """Path of an existing export for this data version and filters, if any"""
+        if version is None:
+            return None
+        path = self._path(name, version, filters, fmt)
+        return path if os.path.exists(path) else None
+
+    def export(
+        self,
+        build: Callable[[], pd.DataFrame],
+        name: str,
+        version,
+        filters: Optional[Dict] = None,
+        fmt: str = 'csv'
+    ) -> str:
+        """
+        Path of the export file, writing it first if needed. build is only
+        called on a miss. version=None (unversioned data) always rewrites.
+        """
+        if fmt not in EXPORT_FORMATS:
+            raise ValueError(f"Unknown export format: {fmt}")
+        if fmt == 'parquet' and not PARQUET_AVAILABLE:
+            raise ValueError("Parquet export needs pyarrow")
+
+        path = self._path(name, version, filters, fmt)
+        if version is not None and os.path.exists(path):
+            return path
+
+        with span(f"export {name}", fmt=fmt):
+            df = build()
+            # Unique per writer: sessions exporting the same file never share a tmp file
+            tmp_path = f"{path}.{uuid.uuid4().hex}{TMP_SUFFIX}"
+            if fmt == 'csv':
+                with open(tmp_path, 'w', newline='', encoding='utf-8') as f:
+                    for piece in stream_csv(df, self.chunk_rows):
+                        f.write(piece)
+            else:
+                df.to_parquet(tmp_path, index=False, compression='zstd')
+            os.replace(tmp_path, path)
+
+        self._drop_stale(name, path)
+        return path
+
+    def _drop_stale(self, name: str, keep: str) -> None:
+        """Remove this export's files from older data versions (never files still being written)"""
+        version_tag = os.path.basename(keep)[len(name) + 1:].split('-')[0]
+        for entry in os.listdir(self.export_dir):
+            if entry.endswith(TMP_SUFFIX):
+                continue
+            if entry.startswith(f"{name}-") and not entry.startswith(f"{name}-{version_tag}-"):
+                try:
+                    os.remove(os.path.join(self.export_dir, entry))
+                except OSError:
+                    pass
+
+    @staticmethod
+    def mime(fmt: str) -> str:
+        return EXPORT_FORMATS[fmt][0]
+
+_export_service: Optional[ExportService] = None
+
+def get_export_service() -> ExportService:
+    """Process-wide export service (one export directory per app)"""
+    global _export_service
+    if _export_service is None:
+        _export_service = ExportService()
+    return _export_service
\ No newline at end of file
@@ -0,0 +1,90 @@
+import json
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Optional
+import streamlit as st
+from src.utils.perf import span
+from src.services.metrics import REGISTRY
+
+DEFAULT_THEME = "Dark"
+
+def current_theme() -> str:
+    """
+    Theme chosen on the account page (part of every figure key); read from
+    the plain "theme" session key, which outlives the page's widget
+    """
+    return st.session_state.get("theme", DEFAULT_THEME)
+
+class FigureCache:
+    """
+    Process-wide LRU of serialized Plotly figure specs.
+
+    Entries are keyed by (data version, chart id, parameters, theme) and
+    stored as plain JSON-compatible dicts, so building the figure and
+    serializing it happen once per key for every session of the app.
+    Specs are shared: callers pass them straight to st.plotly_chart and
+    must not modify them. Unversioned data (version None) is never cached.
+    """
+
+    def __init__(self, max_entries: int = 128):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[tuple, dict]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, chart_id: str, version, build: Callable, params: Hashable = (),
+            theme: Optional[str] = None) -> dict:
+        """Spec for the chart, calling build() (returning a go.Figure) on a miss"""
+        if version is None:
+            return self._build(chart_id, build)
+
+        key = (version, chart_id, params, theme or current_theme())
+        with self._lock:
+            spec = self._entries.get(key)
+            if spec is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return spec
+            self.misses += 1
+
+        # Built outside the lock; two sessions racing on one key just build twice
+        spec = self._build(chart_id, build)
+        with self._lock:
+            self._entries[key] = spec
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return spec
+
+    @staticmethod
+    def _build(chart_id: str, build: Callable) -> dict:
+        with span(f"figure {chart_id}"):
+            with span("build"):
+                fig = build()
+            with span("serialize"):
+                return json.loads(fig.to_json())
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
+
+FIGURE_CACHE = FigureCache()
+REGISTRY.gauge(
+    "fedha_figure_cache_hit_ratio", "Share of figure lookups served from the figure cache",
+    fn=lambda: FIGURE_CACHE.stats()["hit_rate"]
+)
+
+def cached_figure(chart_id: str, version, build: Callable, params: Hashable = (),
+                  theme: Optional[str] = None) -> dict:
+    """Shortcut for FIGURE_CACHE.get"""
+    return FIGURE_CACHE.get(chart_id, version, build, params, theme)
\ No newline at end of file
@@ -0,0 +1,214 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+class FilterResult(NamedTuple):
+    ids: np.ndarray         # matching row positions, ascending
+    count: int
+    total_cents: int
+
+    @property
+    def mean_cents(self) -> float:
+        return self.total_cents / self.count if self.count else 0.0
+
+class FilterIndex:
+    """
+    Read-only index over an expense frame for interactive filtering.
+
+    Built once per data version:
+    - one packed bitmap (1 bit per row) per category
+    - amount-sorted and date-sorted row permutations, with prefix sums of
+      the amounts in each order
+
+    A range filter is two binary searches; compound filters start from the
+    narrowest range and check the remaining conditions only on those rows,
+    so nothing scans the whole frame except a category-only query.
+    """
+
+    def __init__(self, dates: np.ndarray, amount_cents: np.ndarray,
+                 category_codes: np.ndarray, categories: Iterable[str]):
+        self.categories: List[str] = list(categories)
+        self.amount_cents = np.asarray(amount_cents, dtype=np.int64)
+        self.dates = np.asarray(dates, dtype='datetime64[ns]').view(np.int64)
+        codes = np.asarray(category_codes)
+        self._codes = codes
+        self.size = len(self.amount_cents)
+
+        self._category_bits: Dict[str, np.ndarray] = {}
+        self._category_totals: Dict[str, int] = {}
+        self._category_counts: Dict[str, int] = {}
+        for code, name in enumerate(self.categories):
+            mask = codes == code
+            self._category_bits[name] = np.packbits(mask)
+            self._category_counts[name] = int(mask.sum())
+            self._category_totals[name] = int(self.amount_cents[mask].sum())
+        # Registry-coded frames carry every known category, used or not
+        self._present = frozenset(name for name, count in self._category_counts.items() if count)
+
+        self._amount_order = np.argsort(self.amount_cents, kind='stable')
+        self._sorted_amounts = self.amount_cents[self._amount_order]
+        self._amount_prefix = np.concatenate(([0], np.cumsum(self._sorted_amounts)))
+
+        self._date_order = np.argsort(self.dates, kind='stable')
+        self._sorted_dates = self.dates[self._date_order]
+        self._date_prefix = np.concatenate(([0], np.cumsum(self.amount_cents[self._date_order])))
+        self._orders: Dict[str, np.ndarray] = {
+            'date': self._date_order, 'amount_cents': self._amount_order
+        }
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "FilterIndex":
+        """Index an expense frame (date, amount_cents, category)"""
+        if isinstance(df['category'].dtype, pd.CategoricalDtype):
+            codes = df['category'].cat.codes.to_numpy()
+            categories = [str(c) for c in df['category'].cat.categories]
+        else:
+            codes, categories = pd.factorize(df['category'])
+        return cls(
+            pd.to_datetime(df['date']).to_numpy('datetime64[ns]'),
+            df['amount_cents'].to_numpy(),
+            codes,
+            categories
+        )
+
+    @property
+    def date_bounds(self):
+        """(first, last) timestamp in the data, or (None, None) when empty"""
+        if self.size == 0:
+            return None, None
+        return pd.Timestamp(self._sorted_dates[0]), pd.Timestamp(self._sorted_dates[-1])
+
+    # ========================================================================
+    # QUERY
+    # ========================================================================
+
+    @staticmethod
+    def _to_ns(value) -> int:
+        return pd.Timestamp(value).as_unit('ns').value
+
+    def _amount_range(self, min_cents, max_cents):
+        lo = 0 if min_cents is None else int(np.searchsorted(self._sorted_amounts, min_cents, 'left'))
+        hi = self.size if max_cents is None else int(np.searchsorted(self._sorted_amounts, max_cents, 'right'))
+        return lo, max(lo, hi)
+
+    def _date_range(self, start, end):
+        lo = 0 if start is None else int(np.searchsorted(self._sorted_dates, self._to_ns(start), 'left'))
+        hi = self.size if end is None else int(np.searchsorted(self._sorted_dates, self._to_ns(end), 'left'))
+        return lo, max(lo, hi)
+
+    def _category_bitmap(self, categories) -> Optional[np.ndarray]:
+        """OR of the selected categories' bitmaps; None when every category with rows is selected"""
+        selected = [c for c in dict.fromkeys(categories) if c in self._category_bits]
+        if self._present.issubset(selected):
+            return None
+        bits = np.zeros((self.size + 7) // 8, dtype=np.uint8)
+        for name in selected:
+            np.bitwise_or(bits, self._category_bits[name], out=bits)
+        return bits
+
+    @staticmethod
+    def _test_bits(bits: np.ndarray, ids: np.ndarray) -> np.ndarray:
+        return ((bits[ids >> 3] >> (7 - (ids & 7))) & 1).astype(bool)
+
+    def _ascending(self, ids: np.ndarray) -> np.ndarray:
+        """Row ids in frame order without an O(k log k) sort"""
+        if len(ids) == 0:
+            return ids
+        mask = np.zeros(self.size, dtype=bool)
+        mask[ids] = True
+        return np.flatnonzero(mask)
+
+    def query(
+        self,
+        categories: Optional[Iterable[str]] = None,
+        min_cents: Optional[int] = None,
+        max_cents: Optional[int] = None,
+        start=None,
+        end=None
+    ) -> FilterResult:
+        """
+        Rows matching every given filter. categories=None means all;
+        amounts are inclusive cents; start is inclusive, end exclusive.
+        """
+        bits = None if categories is None else self._category_bitmap(categories)
+        amount_filtered = min_cents is not None or max_cents is not None
+        date_filtered = start is not None or end is not None
+        a_lo, a_hi = self._amount_range(min_cents, max_cents)
+        d_lo, d_hi = self._date_range(start, end)
+
+        # Single-condition queries: counts and totals straight from the index
+        if not amount_filtered and not date_filtered:
+            if bits is None:
+                return FilterResult(np.arange(self.size), self.size, int(self._amount_prefix[-1]))
+            selected = [c for c in dict.fromkeys(categories) if c in self._category_bits]
+            ids = np.flatnonzero(np.unpackbits(bits, count=self.size))
+            return FilterResult(
+                ids,
+                sum(self._category_counts[c] for c in selected),
+                sum(self._category_totals[c] for c in selected)
+            )
+        if bits is None and not date_filtered:
+            return FilterResult(
+                self._ascending(self._amount_order[a_lo:a_hi]), a_hi - a_lo,
+                int(self._amount_prefix[a_hi] - self._amount_prefix[a_lo])
+            )
+        if bits is None and not amount_filtered:
+            return FilterResult(
+                self._ascending(self._date_order[d_lo:d_hi]), d_hi - d_lo,
+                int(self._date_prefix[d_hi] - self._date_prefix[d_lo])
+            )
+
+        # Compound: start from the narrower range, check the rest per row
+        if amount_filtered and (not date_filtered or a_hi - a_lo <= d_hi - d_lo):
+            ids = self._amount_order[a_lo:a_hi]
+            if date_filtered:
+                ids = ids[self._within(self.dates[ids], self._to_ns(start) if start is not None else None,
+                                       self._to_ns(end) - 1 if end is not None else None)]
+        else:
+            ids = self._date_order[d_lo:d_hi]
+            if amount_filtered:
+                ids = ids[self._within(self.amount_cents[ids], min_cents, max_cents)]
+        if bits is not None:
+            ids = ids[self._test_bits(bits, ids)]
+
+        ids = self._ascending(ids)
+        return FilterResult(ids, len(ids), int(self.amount_cents[ids].sum()))
+
+    @staticmethod
+    def _within(values: np.ndarray, low, high) -> np.ndarray:
+        """Inclusive bounds check; None leaves that side open"""
+        keep = np.ones(len(values), dtype=bool)
+        if low is not None:
+            keep &= values >= low
+        if high is not None:
+            keep &= values <= high
+        return keep
+
+    # ========================================================================
+    # SORTING
+    # ========================================================================
+
+    SORT_COLUMNS = ('date', 'amount_cents', 'category')
+
+    def order(self, by: str) -> np.ndarray:
+        """Stable permutation of all rows sorted by a column (category by name)"""
+        if by not in self._orders:
+            if by != 'category':
+                raise ValueError(f"Cannot sort by {by}; choose one of {self.SORT_COLUMNS}")
+            name_rank = np.argsort(np.argsort(np.asarray(self.categories, dtype=object)))
+            self._orders[by] = np.argsort(name_rank[self._codes], kind='stable')
+        return self._orders[by]
+
+    def sort_ids(self, ids: np.ndarray, by: str, ascending: bool = True) -> np.ndarray:
+        """
+        ids reordered by a column. Walks the cached whole-frame order once
+        (O(n)) instead of sorting the selection.
+        """
+        order = self.order(by)
+        if len(ids) == self.size:
+            selected = order
+        else:
+            member = np.zeros(self.size, dtype=bool)
+            member[ids] = True
+            selected = order[member[order]]
+        return selected if ascending else selected[::-1]
\ No newline at end of file
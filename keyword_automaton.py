@@ -0,0 +1,133 @@
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+class KeywordAutomaton:
+    """
+    Aho-Corasick automaton over lowercase keywords.
+
+    `find` reports every whole-word keyword occurrence in a single linear
+    pass over the text, independent of how many keywords are loaded.
+    Keywords can be added at any time; failure links are rebuilt lazily on
+    the next search, so a burst of additions costs one rebuild.
+    """
+
+    def __init__(self, keywords: Optional[Dict[str, Iterable[str]]] = None):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._own: List[List[int]] = [[]]       # keyword ids ending exactly here
+        self._out: List[Tuple[int, ...]] = [()]  # own + everything along failure links
+        self._keywords: List[str] = []
+        self._labels: List[Set[str]] = []
+        self._keyword_ids: Dict[str, int] = {}
+        self._dirty = False
+
+        for label, words in (keywords or {}).items():
+            for word in words:
+                self.add(word, label)
+
+    def __len__(self) -> int:
+        return len(self._keywords)
+
+    def add(self, keyword: str, label: str) -> None:
+        """Register keyword under label (a keyword may carry several labels)"""
+        keyword = keyword.strip().lower()
+        if not keyword:
+            return
+
+        keyword_id = self._keyword_ids.get(keyword)
+        if keyword_id is not None:
+            self._labels[keyword_id].add(label)
+            return
+
+        state = 0
+        for char in keyword:
+            nxt = self._goto[state].get(char)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._own.append([])
+                self._out.append(())
+                self._goto[state][char] = nxt
+            state = nxt
+
+        keyword_id = len(self._keywords)
+        self._keywords.append(keyword)
+        self._labels.append({label})
+        self._keyword_ids[keyword] = keyword_id
+        self._own[state].append(keyword_id)
+        self._dirty = True
+
+    def _build(self) -> None:
+        """Breadth-first pass computing failure links and merged outputs"""
+        queue = deque()
+        for child in self._goto[0].values():
+            self._fail[child] = 0
+            self._out[child] = tuple(self._own[child])
+            queue.append(child)
+
+        while queue:
+            state = queue.popleft()
+            for char, child in self._goto[state].items():
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                self._out[child] = tuple(self._own[child]) + self._out[self._fail[child]]
+                queue.append(child)
+
+        self._dirty = False
+
+    def find(self, text: str) -> Iterator[Tuple[int, int, str]]:
+        """Yield (start, end, keyword) for every whole-word match in text"""
+        if self._dirty:
+            self._build()
+
+        text = text.lower()
+        goto, fail, out, keywords = self._goto, self._fail, self._out, self._keywords
+        length = len(text)
+        state = 0
+
+        for i, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+
+            if not out[state]:
+                continue
+
+            # Whole-word check: no letter/digit glued to either side
+            if i + 1 < length and text[i + 1].isalnum():
+                continue
+            for keyword_id in out[state]:
+                keyword = keywords[keyword_id]
+                start = i - len(keyword) + 1
+                if start > 0 and text[start - 1].isalnum():
+                    continue
+                yield start, i + 1, keyword
+
+    def __contains__(self, keyword: str) -> bool:
+        return keyword in self._keyword_ids
+
+    @property
+    def keywords(self) -> List[str]:
+        return list(self._keywords)
+
+    def labels(self, keyword: str) -> Set[str]:
+        keyword_id = self._keyword_ids.get(keyword)
+        return set(self._labels[keyword_id]) if keyword_id is not None else set()
+
+    def label_scores(self, text: str, extra_keywords: Iterable[str] = ()) -> Dict[str, int]:
+        """
+        Number of distinct keywords found per label. extra_keywords (e.g.
+        fuzzy matches found elsewhere) are counted as if they occurred in text.
+        """
+        seen = {kw for _, _, kw in self.find(text)}
+        seen.update(kw for kw in extra_keywords if kw in self._keyword_ids)
+
+        scores: Dict[str, int] = {}
+        for keyword in seen:
+            for label in self._labels[self._keyword_ids[keyword]]:
+                scores[label] = scores.get(label, 0) + 1
+        return scores
@@ -1,4 +1,5 @@
 from src.models.goal import CreditInfo
+from src.models.money import from_cents
 import random
 
 class LiteracyService:
@@ -36,7 +37,7 @@ class LiteracyService:
         if expenses_df.empty:
             return "Start tracking your expenses to get personalized advice!"
         
-        total_spending = expenses_df['amount'].sum()
+        total_spending = from_cents(expenses_df['amount_cents'].sum())
         avg_daily = total_spending / len(expenses_df) if len(expenses_df) > 0 else 0
         
         if avg_daily > 50:
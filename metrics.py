@@ -0,0 +1,329 @@
+import os
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Tuple
+
+DEFAULT_PORT = 9464
+QUANTILES = (0.5, 0.9, 0.99, 0.999)
+
+def _label_text(labels: Tuple[Tuple[str, str], ...], extra: str = "") -> str:
+    parts = [f'{key}="{_escape(value)}"' for key, value in labels]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _number(value: float) -> str:
+    if value == float('inf'):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+# ============================================================================
+# METRIC TYPES
+# ============================================================================
+
+class Counter:
+    """Monotonically increasing count"""
+    kind = 'counter'
+
+    def __init__(self, name: str, labels: Tuple = ()):
+        self.name = name
+        self.labels = labels
+        self._value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1) -> None:
+        if amount < 0:
+            raise ValueError("Counters only go up")
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    def samples(self) -> List[Tuple[str, str, float]]:
+        return [(self.name, _label_text(self.labels), self._value)]
+
+class Gauge:
+    """Value that goes up and down, or is read from a callback at scrape time"""
+    kind = 'gauge'
+
+    def __init__(self, name: str, labels: Tuple = (), fn: Optional[Callable[[], float]] = None):
+        self.name = name
+        self.labels = labels
+        self.fn = fn
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def set(self, value: float) -> None:
+        self._value = value
+
+    def inc(self, amount: float = 1) -> None:
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1) -> None:
+        self.inc(-amount)
+
+    @property
+    def value(self) -> float:
+        return self.fn() if self.fn is not None else self._value
+
+    def samples(self) -> List[Tuple[str, str, float]]:
+        return [(self.name, _label_text(self.labels), self.value)]
+
+class Histogram:
+    """
+    HDR-style latency histogram.
+
+    Values are recorded as integers in `resolution` units (microseconds for
+    seconds by default) into log-linear buckets: every power of two is split
+    into 2**sub_bucket_bits equal sub-buckets, so any quantile is within
+    1 / 2**sub_bucket_bits (~3% by default) of the true value, at any
+    magnitude, with O(1) recording and memory bounded by the value range.
+    Exposed to Prometheus as a summary (quantiles, _sum, _count).
+    """
+    kind = 'summary'
+
+    def __init__(self, name: str, labels: Tuple = (), resolution: float = 1e-6,
+                 sub_bucket_bits: int = 5):
+        self.name = name
+        self.labels = labels
+        self.resolution = resolution
+        self._sub_bits = sub_bucket_bits
+        self._sub_count = 1 << sub_bucket_bits
+        self._counts: Dict[int, int] = {}
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+        self._lock = threading.Lock()
+
+    def _index(self, units: int) -> int:
+        if units < self._sub_count:
+            return units
+        shift = units.bit_length() - self._sub_bits - 1
+        return shift * self._sub_count + (units >> shift)
+
+    def _bucket_value(self, index: int) -> float:
+        """Midpoint of a bucket, in recorded units"""
+        if index < self._sub_count:
+            return float(index)
+        shift = index // self._sub_count - 1
+        sub = index - shift * self._sub_count
+        return ((sub << shift) + ((sub + 1) << shift) - 1) / 2
+
+    def observe(self, value: float) -> None:
+        index = self._index(max(0, int(value / self.resolution)))
+        with self._lock:
+            self._counts[index] = self._counts.get(index, 0) + 1
+            self.count += 1
+            self.sum += value
+            if value > self.max:
+                self.max = value
+
+    @contextmanager
+    def time(self):
+        """Observe the duration of a block, in seconds"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+    def timed(self, func):
+        """Decorator form of time()"""
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with self.time():
+                return func(*args, **kwargs)
+        return wrapper
+
+    def quantiles(self, qs=QUANTILES) -> Dict[float, float]:
+        with self._lock:
+            buckets = sorted(self._counts.items())
+            count = self.count
+        result = {}
+        if not count:
+            return {q: 0.0 for q in qs}
+
+        cumulative, position = 0, 0
+        for q in sorted(qs):
+            rank = max(1, int(q * count + 0.5))
+            while cumulative < rank:
+                cumulative += buckets[position][1]
+                position += 1
+            result[q] = self._bucket_value(buckets[position - 1][0]) * self.resolution
+        return result
+
+    def samples(self) -> List[Tuple[str, str, float]]:
+        samples = [
+            (self.name, _label_text(self.labels, f'quantile="{q}"'), value)
+            for q, value in self.quantiles().items()
+        ]
+        samples.append((f"{self.name}_sum", _label_text(self.labels), self.sum))
+        samples.append((f"{self.name}_count", _label_text(self.labels), self.count))
+        return samples
+
+class ActiveSet:
+    """Distinct keys (e.g. session ids) seen within a sliding time window"""
+
+    def __init__(self, window_seconds: float = 300):
+        self.window = window_seconds
+        self._seen: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def touch(self, key) -> None:
+        with self._lock:
+            self._seen[key] = time.monotonic()
+            if len(self._seen) > 10000:
+                self._prune()
+
+    def count(self) -> int:
+        with self._lock:
+            self._prune()
+            return len(self._seen)
+
+    def _prune(self) -> None:
+        cutoff = time.monotonic() - self.window
+        for key in [k for k, seen in self._seen.items() if seen < cutoff]:
+            del self._seen[key]
+
+# ============================================================================
+# REGISTRY
+# ============================================================================
+
+class MetricsRegistry:
+    """
+    Process-wide metrics, keyed by (name, labels). Registration is
+    get-or-create, so modules can declare their metrics at import time and
+    Streamlit reruns or reloads never duplicate them.
+    """
+
+    def __init__(self):
+        self._metrics: Dict[Tuple[str, Tuple], object] = {}
+        self._help: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, cls, name: str, help_text: str, labels: Optional[Dict], **kwargs):
+        key = (name, tuple(sorted((labels or {}).items())))
+        with self._lock:
+            metric = self._metrics.get(key)
+            if metric is None:
+                metric = self._metrics[key] = cls(name, key[1], **kwargs)
+                self._help.setdefault(name, help_text)
+            elif not isinstance(metric, cls):
+                raise ValueError(f"Metric {name} is already registered as a {metric.kind}")
+            return metric
+
+    def counter(self, name: str, help_text: str, labels: Optional[Dict] = None) -> Counter:
+        return self._get(Counter, name, help_text, labels)
+
+    def gauge(self, name: str, help_text: str, labels: Optional[Dict] = None,
+              fn: Optional[Callable[[], float]] = None) -> Gauge:
+        gauge = self._get(Gauge, name, help_text, labels)
+        if fn is not None:
+            gauge.fn = fn
+        return gauge
+
+    def histogram(self, name: str, help_text: str, labels: Optional[Dict] = None,
+                  resolution: float = 1e-6) -> Histogram:
+        return self._get(Histogram, name, help_text, labels, resolution=resolution)
+
+    def exposition(self) -> str:
+        """All metrics in the Prometheus text format (version 0.0.4)"""
+        with self._lock:
+            metrics = sorted(self._metrics.items())
+            help_texts = dict(self._help)
+
+        lines, described = [], set()
+        for (name, _), metric in metrics:
+            if name not in described:
+                described.add(name)
+                lines.append(f"# HELP {name} {_escape(help_texts[name])}")
+                lines.append(f"# TYPE {name} {metric.kind}")
+            try:
+                samples = metric.samples()
+            except Exception as e:
+                # A failing callback gauge must not break the whole scrape
+                lines.append(f"# {name}: {_escape(e)}")
+                continue
+            for sample_name, label_text, value in samples:
+                lines.append(f"{sample_name}{label_text} {_number(value)}")
+        return "\n".join(lines) + "\n"
+
+REGISTRY = MetricsRegistry()
+
+# Sessions with a rerun in the last five minutes; app.py touches it on every rerun
+ACTIVE_SESSIONS = ActiveSet()
+REGISTRY.gauge(
+    "fedha_active_sessions", "Streamlit sessions active in the last 5 minutes",
+    fn=ACTIVE_SESSIONS.count
+)
+
+# ============================================================================
+# HTTP ENDPOINT
+# ============================================================================
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    registry = REGISTRY
+
+    def do_GET(self):
+        if self.path.split('?')[0] not in ('/metrics', '/'):
+            self.send_error(404)
+            return
+        body = self.registry.exposition().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # Scrapes every few seconds would flood the Streamlit log
+
+def make_metrics_server(port: int, host: str = "127.0.0.1",
+                        registry: MetricsRegistry = REGISTRY) -> ThreadingHTTPServer:
+    """
+    A new /metrics server for registry, serving from a daemon thread. Port 0
+    binds a free port (see server.server_address). Raises OSError if the
+    port cannot be bound. Independent of the process-wide server below.
+    """
+    handler = type('MetricsHandler', (_MetricsHandler,), {'registry': registry})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+    return server
+
+_SERVER = None
+_SERVER_STARTED = False
+_SERVER_LOCK = threading.Lock()
+
+def start_metrics_server(port: Optional[int] = None, host: str = "127.0.0.1",
+                         registry: MetricsRegistry = REGISTRY):
+    """
+    Serve /metrics from a daemon thread; safe to call on every rerun (the
+    server is started, or attempted, once per process). The port defaults to $METRICS_PORT or
+    9464; port 0 (or METRICS_PORT=0) disables it. Returns the server or None.
+    """
+    global _SERVER, _SERVER_STARTED
+    if port is None:
+        port = int(os.environ.get('METRICS_PORT', DEFAULT_PORT))
+    if port == 0:
+        return None
+
+    with _SERVER_LOCK:
+        if _SERVER_STARTED:
+            return _SERVER
+        _SERVER_STARTED = True
+        try:
+            _SERVER = make_metrics_server(port, host, registry)
+        except OSError as e:
+            print(f"⚠️ Metrics endpoint not started on {host}:{port}: {e}")
+            return None
+        return _SERVER
\ No newline at end of file
@@ -0,0 +1,78 @@
+"""
+Integer-cents money helpers.
+
+Amounts are carried as whole cents (int64, or int32 where the values fit)
+through the model, storage and aggregate layers so sums are exact. Display
+units only appear at render time via the helpers below.
+
+numpy and pandas are imported inside the array helpers, so pages that only
+format scalars (goals, learning) never load them.
+"""
+from decimal import Decimal, ROUND_HALF_UP
+from typing import TYPE_CHECKING, Union
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+Cents = int
+
+CENTS_PER_UNIT = 100
+CURRENCY_SYMBOL = "$"
+
+_INT32_MAX = 2 ** 31 - 1
+
+
+def _round_half_up(value) -> int:
+    """Nearest integer, halves away from zero (round() would go to even)"""
+    return int(Decimal(str(value)).quantize(Decimal(1), rounding=ROUND_HALF_UP))
+
+
+def to_cents(amount: Union[float, int, str, Decimal]) -> Cents:
+    """Convert a display-unit amount (e.g. 12.345) to cents, rounding half up"""
+    return _round_half_up(Decimal(str(amount)) * CENTS_PER_UNIT)
+
+
+def to_cents_array(amounts) -> "np.ndarray":
+    """Vectorised to_cents for legacy float columns"""
+    import numpy as np
+    
+    # Round away the binary noise first so 0.285 -> 28.5 -> 29 like to_cents
+    values = np.round(np.asarray(amounts, dtype=np.float64) * CENTS_PER_UNIT, 6)
+    return np.floor(np.abs(values) + 0.5).astype(np.int64) * np.sign(values).astype(np.int64)
+
+
+def from_cents(cents):
+    """Cents to display units; works on scalars, arrays and Series"""
+    if getattr(cents, 'ndim', 0):
+        return cents / CENTS_PER_UNIT
+    return float(cents) / CENTS_PER_UNIT
+
+
+def compact_cents(cents: "np.ndarray") -> "np.ndarray":
+    """Downcast a cents array to int32 when every value fits"""
+    import numpy as np
+    
+    cents = np.asarray(cents, dtype=np.int64)
+    if cents.size == 0 or np.abs(cents).max() <= _INT32_MAX:
+        return cents.astype(np.int32)
+    return cents
+
+
+def format_money(cents, symbol: str = CURRENCY_SYMBOL) -> str:
+    """Format cents as e.g. '$12.50' without going through float"""
+    cents = _round_half_up(cents)
+    sign = "-" if cents < 0 else ""
+    units, remainder = divmod(abs(cents), CENTS_PER_UNIT)
+    return f"{sign}{symbol}{units}.{remainder:02d}"
+
+
+def format_money_series(cents: "pd.Series", symbol: str = CURRENCY_SYMBOL) -> "pd.Series":
+    """Vectorised format_money for display columns"""
+    import numpy as np
+    
+    cents = cents.astype(np.int64)
+    units = (cents.abs() // CENTS_PER_UNIT).astype(str)
+    remainder = (cents.abs() % CENTS_PER_UNIT).astype(str).str.zfill(2)
+    sign = np.where(cents < 0, "-", "")
+    return sign + symbol + units + "." + remainder
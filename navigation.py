@@ -1,5 +1,8 @@
 import streamlit as st
+from src.models.money import format_money
+from src.utils.perf import timed
 
+@timed()
 def render_navigation_sidebar():
     """Render navigation sidebar with main sections"""
     
@@ -30,19 +33,21 @@ def render_navigation_sidebar():
         
         st.markdown("---")
         
-        # Quick Stats
-        from src.services.expense_service import ExpenseService
-        service = ExpenseService()
-        df = service.get_all_expenses()
-        
-        if not df.empty:
-            st.subheader("📈 Quick Stats")
-            total = df['amount'].sum()
-            count = len(df)
-            avg = df['amount'].mean()
-            
-            st.metric("Total Spent", f"${total:.2f}")
-            st.metric("Transactions", count)
-            st.metric("Average", f"${avg:.2f}")
-        
-        return page
\ No newline at end of file
+        return page
+
+@timed()
+def render_quick_stats(service):
+    """Sidebar totals; only pages that load the expense data show them"""
+    df = service.get_all_expenses()
+    if df.empty:
+        return
+    
+    with st.sidebar:
+        st.subheader("📈 Quick Stats")
+        total = df['amount_cents'].sum()
+        count = len(df)
+        avg = df['amount_cents'].mean()
+        
+        st.metric("Total Spent", format_money(total))
+        st.metric("Transactions", count)
+        st.metric("Average", format_money(avg))
\ No newline at end of file
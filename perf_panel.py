@@ -0,0 +1,65 @@
+import pandas as pd
+import streamlit as st
+from src.utils.perf import TRACER
+
+def _format_bytes(delta: int) -> str:
+    sign = '-' if delta < 0 else '+'
+    size = abs(delta)
+    for unit in ('B', 'KB', 'MB'):
+        if size < 1024:
+            return f"{sign}{size:.0f} {unit}"
+        size /= 1024
+    return f"{sign}{size:.1f} GB"
+
+def _waterfall_figure(trace):
+    import plotly.graph_objects as go
+
+    spans = trace['spans']
+    labels = [f"{'  ' * span['depth']}{span['name']}" for span in spans]
+    fig = go.Figure(go.Bar(
+        y=labels,
+        x=[span['duration_ms'] for span in spans],
+        base=[span['start_ms'] for span in spans],
+        orientation='h',
+        marker_color=[span['depth'] for span in spans],
+        marker_colorscale='Viridis',
+        customdata=[_format_bytes(span['memory_delta']) for span in spans],
+        hovertemplate="%{y}<br>%{x:.1f} ms<br>RSS %{customdata}<extra></extra>"
+    ))
+    fig.update_layout(
+        height=max(200, 24 * len(spans) + 80),
+        xaxis_title="ms since rerun start",
+        yaxis=dict(autorange='reversed'),
+        plot_bgcolor='rgba(0,0,0,0)',
+        margin=dict(l=10, r=10, t=30, b=10)
+    )
+    return fig
+
+def render_perf_panel(max_reruns: int = 10):
+    """Waterfall of the last reruns' timing spans (the current rerun is not finished yet)"""
+    traces = TRACER.recent(max_reruns)
+    if not traces:
+        st.info("No reruns recorded yet. Interact with the app and come back.")
+        return
+
+    summary = pd.DataFrame({
+        'started': [trace['started_at'] for trace in traces],
+        'page': [trace['attrs'].get('page', '') for trace in traces],
+        'duration (ms)': [trace['duration_ms'] for trace in traces],
+        'spans': [len(trace['spans']) for trace in traces]
+    })
+    st.dataframe(summary, use_container_width=True, hide_index=True)
+
+    choice = st.selectbox(
+        "Rerun", range(len(traces)), key="perf_panel_rerun",
+        format_func=lambda i: f"{summary['started'][i]} · {summary['page'][i]} · {summary['duration (ms)'][i]:.0f} ms"
+    )
+    trace = traces[choice]
+    st.plotly_chart(_waterfall_figure(trace), use_container_width=True)
+
+    spans = pd.DataFrame(trace['spans'])
+    spans['memory'] = spans['memory_delta'].map(_format_bytes)
+    st.dataframe(
+        spans[['name', 'depth', 'start_ms', 'duration_ms', 'memory']],
+        use_container_width=True, hide_index=True
+    )
\ No newline at end of file
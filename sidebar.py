@@ -3,43 +3,56 @@ from src.services.expense_service import ExpenseService
 from src.services.voice_service import VoiceService
 from src.models.goal import Goal
 from datetime import datetime, timedelta
+from src.utils.perf import timed
 
+@timed()
 def render_sidebar(service: ExpenseService):
-    voice_service = VoiceService()
-    
     with st.sidebar:
         # Expense Form
         st.header("Add New Expense")
         
-        
+        # Voice input: a transcript prefills the form below
+        transcript = st.text_input("🎤 Voice transcript", placeholder="spent 12 dollars on lunch")
+        if st.button("Parse") and transcript:
+            # Swahili users also get Swahili number and currency words ("elfu tano");
+            # "language" is the Account page choice, kept outside the widget's state
+            locales = ("en", "sw") if st.session_state.get("language") == "Swahili" else ("en",)
+            voice_service = VoiceService(classifier=service.get_category_classifier(), locales=locales)
+            result = voice_service.parse_voice_input(transcript)
+            if result["success"]:
+                st.session_state.voice_amount = result["amount"]
+                st.session_state.voice_category = result["category"]
+                st.session_state.voice_description = result["description"]
+            else:
+                st.warning(result["error"])
         
         # Manual input
         amount = st.number_input("Amount ", 
                                value=getattr(st.session_state, 'voice_amount', 0.01),
                                min_value=0.01, step=0.01)
         
-        # Category selection with custom option
-        default_categories = ["food", "transportation", "entertainment", "utilities", "healthcare", "shopping"]
-        
-        # Get existing custom categories from session state
-        if 'custom_categories' not in st.session_state:
-            st.session_state.custom_categories = []
-        
-        all_categories = default_categories + st.session_state.custom_categories
+        # Categories come from the shared, persisted registry
+        registry = service.repository.registry
+        all_categories = list(registry.names)
         
         # Add new category section
         with st.expander("➕ Add New Category"):
             new_category = st.text_input("Enter new category name:")
             if st.button("Add Category") and new_category:
-                if new_category.lower() not in [cat.lower() for cat in all_categories]:
-                    st.session_state.custom_categories.append(new_category.lower())
+                if new_category not in registry:
+                    registry.register(new_category)
                     st.success(f"Added new category: {new_category}")
                     st.rerun()
                 else:
                     st.error("Category already exists!")
         
         # Category selection
-        category = st.selectbox("Category", all_categories)
+        voice_category = st.session_state.get('voice_category')
+        voice_category = registry.normalize(voice_category) if voice_category else None
+        category = st.selectbox(
+            "Category", all_categories,
+            index=all_categories.index(voice_category) if voice_category in all_categories else 0
+        )
         description = st.text_input("Description", 
                                   value=getattr(st.session_state, 'voice_description', ""))
         
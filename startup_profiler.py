@@ -0,0 +1,127 @@
+import importlib
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, List, Optional
+
+# Taken when the entry point imports this module, as early as possible
+PROCESS_START = time.perf_counter()
+
+# Libraries worth calling out when a lazy import drags them in
+HEAVY_PACKAGES = ('plotly', 'pandas', 'numpy', 'sklearn', 'joblib', 'pyarrow', 'scipy')
+
+class StartupProfiler:
+    """
+    Process-wide record of what a cold start costs.
+
+    Imports are timed at the points where the app loads code (the core
+    imports of the entry point and every lazily loaded page), together with
+    the modules each one pulled in, similar to `python -X importtime` but
+    grouped by what the app asked for. Each page's first render in the
+    process is timed as well; later renders are not recorded.
+    """
+
+    def __init__(self, report_path: str = "data/startup_profile.json"):
+        self.report_path = report_path
+        self.imports: List[Dict] = []
+        self.first_renders: Dict[str, float] = {}
+        self.started_at = datetime.now().isoformat(timespec='seconds')
+        self._lock = threading.Lock()
+
+    # ========================================================================
+    # IMPORTS
+    # ========================================================================
+
+    @contextmanager
+    def importing(self, label: str):
+        """Time the imports in a block and note the modules they loaded"""
+        before = set(sys.modules)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            loaded = set(sys.modules) - before
+            if loaded:
+                self._record_import(label, seconds, loaded)
+
+    def load(self, module_name: str):
+        """Import a module on first use; only the first (real) import is recorded"""
+        module = sys.modules.get(module_name)
+        if module is not None:
+            return module
+        with self.importing(module_name):
+            return importlib.import_module(module_name)
+
+    def _record_import(self, label: str, seconds: float, loaded) -> None:
+        heavy = sorted({name.split('.')[0] for name in loaded} & set(HEAVY_PACKAGES))
+        with self._lock:
+            self.imports.append({
+                'module': label,
+                'seconds': round(seconds, 6),
+                'modules_loaded': len(loaded),
+                'heavy_packages': heavy,
+                'since_start': round(time.perf_counter() - PROCESS_START, 6)
+            })
+
+    # ========================================================================
+    # FIRST RENDERS
+    # ========================================================================
+
+    @contextmanager
+    def first_render(self, page: str):
+        """Time the first render of a page in this process; a no-op afterwards"""
+        if page in self.first_renders:
+            yield
+            return
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            with self._lock:
+                recorded = page not in self.first_renders
+                if recorded:
+                    self.first_renders[page] = round(time.perf_counter() - start, 6)
+            if recorded:
+                self.publish()
+
+    # ========================================================================
+    # REPORT
+    # ========================================================================
+
+    def report(self) -> Dict:
+        with self._lock:
+            imports = sorted(self.imports, key=lambda item: item['seconds'], reverse=True)
+            return {
+                'started_at': self.started_at,
+                'pid': os.getpid(),
+                'uptime_seconds': round(time.perf_counter() - PROCESS_START, 3),
+                'import_seconds': round(sum(item['seconds'] for item in self.imports), 6),
+                'imports': imports,
+                'first_renders': dict(self.first_renders)
+            }
+
+    def publish(self, path: Optional[str] = None) -> Optional[str]:
+        """Write the report as JSON (atomically); returns the path, or None on failure"""
+        path = path or self.report_path
+        try:
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(self.report(), f, indent=2)
+            os.replace(tmp_path, path)
+            return path
+        except OSError as e:
+            print(f"⚠️ Could not publish startup profile: {e}")
+            return None
+
+PROFILER = StartupProfiler()
+
+def lazy_attr(module_name: str, attr: str):
+    """Attribute of a module imported (and timed) on first use"""
+    return getattr(PROFILER.load(module_name), attr)
\ No newline at end of file
@@ -0,0 +1,56 @@
+import json
+import os
+import tempfile
+import unittest
+from src.models.category_registry import DEFAULT_CATEGORIES, CategoryRegistry
+
+class TestCategoryRegistry(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "categories.json")
+    
+    def tearDown(self):
+        self.tmp.cleanup()
+    
+    def test_codes_are_stable_and_append_only(self):
+        registry = CategoryRegistry(self.path)
+        self.assertEqual(registry.names, DEFAULT_CATEGORIES)
+        food = registry.code("food")
+        pets = registry.register("Pets")
+        self.assertEqual(pets, len(DEFAULT_CATEGORIES))
+        self.assertEqual(registry.code("pets"), pets)
+        self.assertEqual(registry.register("gym"), pets + 1)
+        
+        reloaded = CategoryRegistry(self.path)
+        self.assertEqual(reloaded.code("food"), food)
+        self.assertEqual(reloaded.code("pets"), pets)
+        self.assertEqual(reloaded.code("gym"), pets + 1)
+    
+    def test_alias_resolution(self):
+        registry = CategoryRegistry(self.path)
+        self.assertEqual(registry.normalize("  Transport "), "transportation")
+        self.assertEqual(registry.code("Misc"), registry.code("other"))
+        self.assertEqual(registry.normalize(None), "other")
+        self.assertEqual(registry.normalize(""), "other")
+        
+        registry.register("Pets", aliases=["dog food", "Vet"])
+        self.assertEqual(registry.code("vet"), registry.code("pets"))
+        self.assertIn("Dog Food", registry)
+        codes = registry.encode_codes(["Groceries", "food", "vet", None])
+        self.assertEqual(codes.tolist(), [registry.code("food")] * 2 + [registry.code("pets"), registry.code("other")])
+    
+    def test_json_round_trip(self):
+        registry = CategoryRegistry(self.path)
+        registry.register("pets", aliases=["vet"])
+        with open(self.path, encoding='utf-8') as f:
+            data = json.load(f)
+        self.assertEqual(data["categories"], registry.names)
+        self.assertEqual(data["aliases"]["vet"], "pets")
+        
+        reloaded = CategoryRegistry(self.path)
+        self.assertEqual(reloaded.names, registry.names)
+        self.assertEqual(reloaded.aliases, registry.aliases)
+        self.assertEqual(list(reloaded.dtype.categories), registry.names)
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
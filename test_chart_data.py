@@ -0,0 +1,45 @@
+import unittest
+import numpy as np
+import pandas as pd
+from src.ui.chart_data import downsample, lttb, min_max
+
+class TestDownsampling(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(7)
+        self.y = np.cumsum(rng.normal(size=5000))
+        self.y[1234] = 500.0    # spike
+        self.y[4321] = -500.0   # dip
+        self.x = np.arange(len(self.y))
+    
+    def test_lttb_keeps_endpoints_and_budget(self):
+        keep = lttb(self.x, self.y, 200)
+        self.assertEqual(len(keep), 200)
+        self.assertEqual(keep[0], 0)
+        self.assertEqual(keep[-1], len(self.y) - 1)
+        self.assertTrue(np.all(np.diff(keep) > 0))
+    
+    def test_min_max_keeps_global_extremes(self):
+        keep = min_max(self.y, 200)
+        self.assertLessEqual(len(keep), 200)
+        self.assertIn(int(self.y.argmax()), keep)
+        self.assertIn(int(self.y.argmin()), keep)
+        self.assertEqual(keep[0], 0)
+        self.assertEqual(keep[-1], len(self.y) - 1)
+    
+    def test_short_input_is_unchanged(self):
+        np.testing.assert_array_equal(lttb(self.x[:50], self.y[:50], 100), np.arange(50))
+        np.testing.assert_array_equal(min_max(self.y[:50], 100), np.arange(50))
+        short = pd.Series(self.y[:50])
+        self.assertIs(downsample(short, 100), short)
+    
+    def test_downsample_series(self):
+        index = pd.date_range('2020-01-01', periods=len(self.y), freq='D')
+        series = pd.Series(self.y, index=index)
+        for method in ('lttb', 'minmax'):
+            points = downsample(series, 300, method)
+            self.assertLessEqual(len(points), 300)
+            self.assertEqual(points.index[0], index[0])
+            self.assertEqual(points.index[-1], index[-1])
+            self.assertEqual(points.max(), series.max())
+        with self.assertRaises(ValueError):
+            downsample(series, 300, 'every_nth')
\ No newline at end of file
@@ -0,0 +1,50 @@
+import unittest
+from src.design_system.colors import (
+    DARK_MODE_COLORS, SEMANTIC_COLORS, THEME_CSS, THEME_TOKENS, get_color, get_theme_css
+)
+
+def nested_get_color(path, dark_mode=False):
+    """get_color as it was before the tokens were precomputed"""
+    colors = {**SEMANTIC_COLORS, **(DARK_MODE_COLORS if dark_mode else {})}
+    try:
+        result = colors
+        for key in path.split('.'):
+            result = result[key]
+        return result
+    except (KeyError, TypeError):
+        return '#000000'
+
+class TestColors(unittest.TestCase):
+    def test_theme_tokens(self):
+        self.assertEqual(set(THEME_TOKENS), {'light', 'dark'})
+        self.assertEqual(THEME_TOKENS['light']['text.primary'], SEMANTIC_COLORS['text']['primary'])
+        self.assertEqual(THEME_TOKENS['dark']['text.primary'], DARK_MODE_COLORS['text']['primary'])
+        self.assertEqual(THEME_TOKENS['dark']['financial.positive'], SEMANTIC_COLORS['financial']['positive'])
+        with self.assertRaises(TypeError):
+            THEME_TOKENS['light']['text.primary'] = '#ffffff'
+    
+    def test_tokens_reproduce_nested_lookup(self):
+        paths = list(THEME_TOKENS['light']) + ['text.primary.extra', 'text.unknown', 'nope']
+        for dark_mode in (False, True):
+            for path in paths:
+                self.assertEqual(get_color(path, dark_mode), nested_get_color(path, dark_mode), (path, dark_mode))
+    
+    def test_get_color_fallback(self):
+        self.assertEqual(get_color('text.unknown'), '#000000')
+        self.assertEqual(get_color('text.disabled', dark_mode=True), '#000000')
+        self.assertNotEqual(get_color('text.disabled'), '#000000')
+    
+    def test_get_theme_css(self):
+        self.assertIn(THEME_TOKENS['light']['background.primary'], get_theme_css('Light'))
+        self.assertIn(THEME_TOKENS['dark']['background.primary'], get_theme_css('Dark'))
+        self.assertNotEqual(get_theme_css('Light'), get_theme_css('Dark'))
+        self.assertIs(get_theme_css('Light'), THEME_CSS['light'])
+        self.assertIs(get_theme_css('Dark'), THEME_CSS['dark'])
+        # Auto and unknown themes use dark
+        self.assertIs(get_theme_css('Auto'), THEME_CSS['dark'])
+        self.assertIs(get_theme_css(None), THEME_CSS['dark'])
+        self.assertIs(get_theme_css(), THEME_CSS['dark'])
+        self.assertTrue(get_theme_css('Light').strip().startswith('<style>'))
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,34 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime
+import pandas as pd
+from src.models.category_registry import CategoryRegistry
+from src.ml.data_processor import FEATURE_COLUMNS, DataProcessor
+
+class TestDataProcessor(unittest.TestCase):
+    def test_training_and_prediction_features_agree(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            registry = CategoryRegistry(os.path.join(tmp, "categories.json"))
+            processor = DataProcessor(registry)
+            # Only some categories present: a fitted label encoder would number them 0, 1
+            df = pd.DataFrame({
+                'date': pd.to_datetime(['2024-03-02 10:00', '2024-03-15 09:00']),
+                'amount_cents': [1250, 400],
+                'category': ['shopping', 'Transport']
+            })
+            features = processor.prepare_features(df)
+            
+            self.assertEqual(list(features.columns), FEATURE_COLUMNS + ['amount'])
+            self.assertEqual(features['amount'].tolist(), [12.5, 4.0])
+            for i, row in enumerate(df.itertuples()):
+                self.assertEqual(
+                    features[FEATURE_COLUMNS].iloc[i].tolist(),
+                    processor.feature_row(row.date.to_pydatetime(), row.category)
+                )
+            self.assertEqual(features['category_encoded'].tolist(),
+                             [registry.code('shopping'), registry.code('transportation')])
+            self.assertEqual(processor.feature_row(datetime(2024, 3, 2), 'food')[3], 1)
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
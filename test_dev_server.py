@@ -0,0 +1,139 @@
+import http.client
+import json
+import os
+import tempfile
+import threading
+import unittest
+from http.server import ThreadingHTTPServer
+import dev_server
+from dev_server import IMMUTABLE, REVALIDATE, Handler, accepted_encodings, precompress
+
+class QuietHandler(Handler):
+    def log_message(self, format, *args):
+        pass
+
+class TestDevServer(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = self.tmp.name
+        os.makedirs(os.path.join(self.root, "assets"))
+        os.makedirs(os.path.join(self.root, ".vite"))
+        self.write("index.html", b"<html>" + b"x" * 2000 + b"</html>")
+        self.write("assets/index-BX3f9a1c.js", b"console.log(1);" * 100)
+        self.write("assets/user-Settings.js", b"export default 1;")
+        self.write(".vite/manifest.json", json.dumps({
+            "index.html": {"file": "assets/index-BX3f9a1c.js", "isEntry": True}
+        }).encode())
+        self.write("index.html.gz", b"gzip-variant")
+        self.write("index.html.br", b"brotli-variant")
+        self.servers = []
+    
+    def tearDown(self):
+        for server in self.servers:
+            server.shutdown()
+            server.server_close()
+        self.tmp.cleanup()
+    
+    def write(self, name, data, age=0):
+        path = os.path.join(self.root, name)
+        with open(path, 'wb') as f:
+            f.write(data)
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns - age))
+    
+    def get(self, path, headers=None, no_cache=False):
+        if not self.servers or self.servers[-1].no_cache != no_cache:
+            handler = type("TestHandler", (QuietHandler,), {"no_cache": no_cache})
+            server = ThreadingHTTPServer(
+                ("127.0.0.1", 0), lambda *a, **k: handler(*a, directory=self.root, **k)
+            )
+            server.no_cache = no_cache
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            self.servers.append(server)
+        connection = http.client.HTTPConnection(*self.servers[-1].server_address, timeout=5)
+        try:
+            connection.request("GET", path, headers=headers or {})
+            response = connection.getresponse()
+            return response, response.read()
+        finally:
+            connection.close()
+    
+    def test_accepted_encodings(self):
+        self.assertEqual(accepted_encodings("gzip, br;q=0.5"), {"gzip", "br"})
+        self.assertEqual(accepted_encodings("br;q=0, gzip"), {"gzip"})
+        self.assertEqual(accepted_encodings("*"), {"*", "br", "gzip"})
+        self.assertEqual(accepted_encodings(None), set())
+    
+    def test_variant_selection(self):
+        response, body = self.get("/index.html", {"Accept-Encoding": "gzip, br"})
+        self.assertEqual((response.getheader("Content-Encoding"), body), ("br", b"brotli-variant"))
+        response, body = self.get("/index.html", {"Accept-Encoding": "gzip"})
+        self.assertEqual((response.getheader("Content-Encoding"), body), ("gzip", b"gzip-variant"))
+        response, body = self.get("/index.html", {"Accept-Encoding": "br;q=0, gzip;q=0"})
+        self.assertIsNone(response.getheader("Content-Encoding"))
+        self.assertTrue(body.startswith(b"<html>"))
+        self.assertEqual(response.getheader("Vary"), "Accept-Encoding")
+    
+    def test_directory_serves_index_with_cache_headers(self):
+        response, body = self.get("/", {"Accept-Encoding": "gzip"})
+        self.assertEqual(response.status, 200)
+        self.assertEqual(response.getheader("Cache-Control"), REVALIDATE)
+        self.assertEqual(response.getheader("Content-Type"), "text/html")
+        self.assertEqual((response.getheader("Content-Encoding"), body), ("gzip", b"gzip-variant"))
+        direct, _ = self.get("/index.html", {"Accept-Encoding": "gzip"})
+        self.assertEqual(response.getheader("ETag"), direct.getheader("ETag"))
+        
+        response, _ = self.get("/", {"Accept-Encoding": "gzip", "If-None-Match": direct.getheader("ETag")})
+        self.assertEqual(response.status, 304)
+        # A directory without the trailing slash still redirects
+        response, _ = self.get("/assets")
+        self.assertEqual(response.status, 301)
+        self.assertEqual(response.getheader("Location"), "/assets/")
+    
+    def test_stale_variants_are_ignored(self):
+        self.write("index.html.br", b"old", age=10 ** 10)
+        response, body = self.get("/index.html", {"Accept-Encoding": "br, gzip"})
+        self.assertEqual((response.getheader("Content-Encoding"), body), ("gzip", b"gzip-variant"))
+    
+    def test_etag_revalidation(self):
+        response, _ = self.get("/index.html", {"Accept-Encoding": "gzip"})
+        etag = response.getheader("ETag")
+        self.assertTrue(etag.endswith('-gzip"'))
+        
+        response, body = self.get("/index.html", {"Accept-Encoding": "gzip", "If-None-Match": etag})
+        self.assertEqual((response.status, body), (304, b""))
+        self.assertEqual(response.getheader("ETag"), etag)
+        # The identity representation has its own tag
+        response, _ = self.get("/index.html", {"If-None-Match": etag})
+        self.assertEqual(response.status, 200)
+    
+    def test_only_manifest_files_are_immutable(self):
+        response, _ = self.get("/assets/index-BX3f9a1c.js")
+        self.assertEqual(response.getheader("Cache-Control"), IMMUTABLE)
+        # Looks hashed, but is not build output
+        response, _ = self.get("/assets/user-Settings.js")
+        self.assertEqual(response.getheader("Cache-Control"), REVALIDATE)
+        
+        os.remove(os.path.join(self.root, ".vite", "manifest.json"))
+        response, _ = self.get("/assets/index-BX3f9a1c.js")
+        self.assertEqual(response.getheader("Cache-Control"), REVALIDATE)
+    
+    def test_no_cache_mode(self):
+        response, body = self.get("/assets/index-BX3f9a1c.js", {"Accept-Encoding": "gzip"}, no_cache=True)
+        self.assertEqual(response.status, 200)
+        self.assertEqual(response.getheader("Cache-Control"), "no-cache, no-store, must-revalidate")
+        self.assertIsNone(response.getheader("ETag"))
+        self.assertIsNone(response.getheader("Content-Encoding"))
+        self.assertEqual(body, b"console.log(1);" * 100)
+    
+    def test_precompress_skips_small_and_fresh_files(self):
+        os.remove(os.path.join(self.root, "index.html.gz"))
+        written = precompress(self.root)
+        # index.html.br is already fresh
+        self.assertEqual(written, 3 if dev_server.BROTLI_AVAILABLE else 2)
+        self.assertTrue(os.path.exists(os.path.join(self.root, "assets", "index-BX3f9a1c.js.gz")))
+        self.assertFalse(os.path.exists(os.path.join(self.root, "assets", "user-Settings.js.gz")))
+        self.assertEqual(precompress(self.root), 0)
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,82 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime
+import numpy as np
+import pandas as pd
+from src.models.expense import Expense, ExpenseBatch
+from src.repositories.expense_repository import COLUMNS, ExpenseRepository
+
+class TestExpenseBatch(unittest.TestCase):
+    def setUp(self):
+        self.rows = [
+            Expense(1250, "food", "lunch", datetime(2024, 1, 2, 12, 30)),
+            Expense(300, "transport", "bus", datetime(2024, 1, 3, 8, 0)),
+            Expense(999, "food", "dinner", datetime(2024, 1, 3, 19, 0)),
+        ]
+    
+    def test_from_expenses(self):
+        batch = ExpenseBatch.from_expenses(self.rows)
+        self.assertEqual(len(batch), 3)
+        self.assertEqual(batch.amount_cents.dtype, np.int64)
+        self.assertEqual(batch.amount_cents.tolist(), [1250, 300, 999])
+        self.assertEqual(batch.categories, ("food", "transport"))
+        self.assertEqual(batch.category_codes.tolist(), [0, 1, 0])
+        self.assertEqual([e.description for e in batch], ["lunch", "bus", "dinner"])
+        self.assertEqual(batch[1].date, datetime(2024, 1, 3, 8, 0))
+        self.assertEqual(list(batch.to_frame().columns), COLUMNS)
+        
+        with self.assertRaises(ValueError):
+            ExpenseBatch(batch.dates, batch.amount_cents[:2], batch.category_codes, batch.categories, [])
+    
+    def test_save_batch_writes_header_once_and_appends(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            repository = ExpenseRepository(os.path.join(tmp, "expenses.csv"))
+            saved = repository.save_batch(ExpenseBatch.from_expenses(self.rows[:2]))
+            repository.save_batch(ExpenseBatch.from_expenses(self.rows[2:]))
+            self.assertEqual(repository.save_batch(ExpenseBatch.from_expenses([])).amount_cents.size, 0)
+            
+            # Returned batch is re-coded against the registry, aliases resolved
+            self.assertEqual(saved[1].category, "transportation")
+            with open(repository.csv_path, encoding='utf-8') as f:
+                lines = f.read().splitlines()
+            self.assertEqual(lines[0], ",".join(COLUMNS))
+            self.assertEqual(len(lines), 4)
+            
+            df = repository.get_all_expenses()
+            self.assertEqual(df['amount_cents'].tolist(), [1250, 300, 999])
+            self.assertEqual(df['category'].astype(str).tolist(), ["food", "transportation", "food"])
+
+    def test_missing_category_becomes_other(self):
+        rows = self.rows[:2] + [Expense(100, None, "?", datetime(2024, 1, 4))]
+        batch = ExpenseBatch.from_expenses(rows)
+        self.assertEqual(batch[2].category, "other")
+        
+        frame = ExpenseBatch.from_expenses(self.rows).to_frame()
+        frame['category'] = frame['category'].cat.set_categories(["food"])
+        batch = ExpenseBatch.from_frame(frame)
+        self.assertEqual([e.category for e in batch], ["food", "other", "food"])
+        self.assertEqual(batch.to_frame()['category'].isna().sum(), 0)
+        
+        with self.assertRaises(ValueError):
+            ExpenseBatch(batch.dates, batch.amount_cents, [0, -1, 0], batch.categories, batch.descriptions)
+    
+    def test_single_and_batch_saves_mix(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            repository = ExpenseRepository(os.path.join(tmp, "expenses.csv"))
+            repository.save_expense(Expense(1250, "food", "lunch", datetime(2024, 1, 2, 12, 30, 5, 123456)))
+            repository.save_batch(ExpenseBatch.from_expenses([Expense(300, "rent", "", datetime(2024, 1, 3))]))
+            repository.save_expense(Expense(999, "food", "dinner", datetime(2024, 1, 4, 19, 0)))
+            # A row from before the fixed format, as str(datetime) wrote it
+            with open(repository.csv_path, 'a', encoding='utf-8') as f:
+                f.write("2024-01-05 08:00:00,100,food,tea\n")
+            
+            df = repository.get_all_expenses()
+            self.assertTrue(pd.api.types.is_datetime64_any_dtype(df['date']))
+            self.assertEqual(df['date'].tolist(), [
+                pd.Timestamp(2024, 1, 2, 12, 30, 5, 123456), pd.Timestamp(2024, 1, 3),
+                pd.Timestamp(2024, 1, 4, 19, 0), pd.Timestamp(2024, 1, 5, 8, 0)
+            ])
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,58 @@
+import unittest
+import pandas as pd
+from src.services.expense_cube import ExpenseCube
+
+class TestExpenseCube(unittest.TestCase):
+    def setUp(self):
+        self.df = pd.DataFrame({
+            'date': pd.to_datetime(['2024-01-01 09:00', '2024-01-01 18:00', '2024-01-06 12:00', '2024-02-03 08:30']),
+            'amount_cents': [1000, 500, 2000, 750],
+            'category': ['food', 'food', 'rent', 'food']
+        })
+        self.cube = ExpenseCube.from_frame(self.df)
+    
+    def test_category_totals_match_groupby(self):
+        expected = self.df.groupby('category')['amount_cents'].sum()
+        pd.testing.assert_series_equal(
+            self.cube.category_totals().sort_index(), expected, check_names=False
+        )
+    
+    def test_monthly_totals(self):
+        monthly = self.cube.monthly_totals()
+        self.assertEqual(list(monthly.index), ['2024-01', '2024-02'])
+        self.assertEqual(list(monthly.values), [3500, 750])
+    
+    def test_weekday_average(self):
+        # 2024-01-01 is a Monday, 2024-01-06 and 2024-02-03 are Saturdays
+        averages = self.cube.weekday_average()
+        self.assertEqual(averages['Monday'], 750)
+        self.assertEqual(averages['Saturday'], 1375)
+        self.assertTrue(pd.isna(averages['Sunday']))
+    
+    def test_incremental_insert_before_start(self):
+        self.cube.add(pd.Timestamp('2023-12-31'), 400, 'transportation')
+        self.assertEqual(self.cube.transaction_count, 5)
+        self.assertEqual(self.cube.category_totals()['transportation'], 400)
+        self.assertEqual(self.cube.monthly_totals().index[0], '2023-12')
+    
+    def test_daily_totals_span_only_active_days(self):
+        # Back-filling reserves spare rows before the start; none may show up as days
+        self.cube.add(pd.Timestamp('2023-12-31'), 400, 'transportation')
+        daily = self.cube.daily_totals()
+        self.assertEqual(daily.index[0], pd.Timestamp('2023-12-31'))
+        self.assertEqual(daily.index[-1], pd.Timestamp('2024-02-03'))
+        self.assertEqual(len(daily), 35)
+        self.assertTrue(self.cube.days.equals(daily.index))
+        self.assertEqual(daily.sum(), self.cube.total)
+        self.assertEqual(daily[pd.Timestamp('2024-01-01')], 1500)
+        self.assertEqual(daily[pd.Timestamp('2024-01-02')], 0)
+        
+        # Later inserts into the reserved rows land on the right day
+        self.cube.add(pd.Timestamp('2023-12-20'), 100, 'food')
+        self.cube.add(pd.Timestamp('2023-12-25'), 200, 'food')
+        daily = self.cube.daily_totals()
+        self.assertEqual(daily.index[0], pd.Timestamp('2023-12-20'))
+        self.assertEqual(daily[pd.Timestamp('2023-12-25')], 200)
+        self.assertEqual(daily[pd.Timestamp('2023-12-31')], 400)
+        self.assertEqual(daily.sum(), self.cube.total)
+        self.assertEqual(ExpenseCube.from_dict(self.cube.to_dict()).daily_totals().tolist(), daily.tolist())
\ No newline at end of file
@@ -0,0 +1,43 @@
+import os
+import tempfile
+import unittest
+import pandas as pd
+from src.services.expense_service import ExpenseService
+
+class TestExpenseService(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cwd = os.getcwd()
+        os.chdir(self.tmp.name)
+        self.service = ExpenseService()
+    
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+    
+    def test_frame_loaded_once_per_data_version(self):
+        self.service.add_expense(12.5, "food", "lunch")
+        df = self.service.get_all_expenses()
+        self.assertIs(self.service.get_all_expenses(), df)
+        self.assertIsInstance(df['category'].dtype, pd.CategoricalDtype)
+        self.assertTrue(pd.api.types.is_datetime64_any_dtype(df['date']))
+        
+        self.service.add_expense(3, "transport", "bus")
+        reloaded = self.service.get_all_expenses()
+        self.assertIsNot(reloaded, df)
+        self.assertEqual(len(reloaded), 2)
+        self.assertEqual(len(df), 1)
+    
+    def test_shared_frame_is_read_only(self):
+        self.service.add_expense(12.5, "food", "lunch")
+        self.service.add_expense(3, "transport", "bus")
+        df = self.service.get_all_expenses()
+        for column in ('amount_cents', 'category', 'description'):
+            with self.assertRaisesRegex(ValueError, "read-only", msg=column):
+                df.loc[0, column] = df.loc[1, column]
+        self.assertEqual(df['amount_cents'].tolist(), [1250, 300])
+        
+        # Views and copies of it are still writable
+        view = df[df['amount_cents'] > 0]
+        view.loc[0, 'amount_cents'] = 1
+        self.assertEqual(df.loc[0, 'amount_cents'], 1250)
\ No newline at end of file
@@ -0,0 +1,58 @@
+import os
+import tempfile
+import unittest
+import pandas as pd
+from src.services.export_service import EXPORT_COLUMNS, ExportService, export_frame, stream_csv
+
+class TestExportService(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.exports = ExportService(self.tmp.name, chunk_rows=3)
+        self.df = pd.DataFrame({'amount_cents': range(10), 'category': ['food', 'rent'] * 5})
+        self.builds = 0
+    
+    def tearDown(self):
+        self.tmp.cleanup()
+    
+    def build(self):
+        self.builds += 1
+        return self.df
+    
+    def test_chunked_csv_matches_to_csv(self):
+        self.assertEqual("".join(stream_csv(self.df, 3)), self.df.to_csv(index=False))
+        path = self.exports.export(self.build, "all", (1, 100))
+        with open(path, encoding='utf-8') as f:
+            self.assertEqual(f.read(), self.df.to_csv(index=False))
+    
+    def test_cached_per_version_and_filters(self):
+        first = self.exports.export(self.build, "all", (1, 100))
+        self.assertEqual(self.exports.export(self.build, "all", (1, 100)), first)
+        self.assertEqual(self.builds, 1)
+        
+        self.exports.export(self.build, "all", (1, 100), filters={'min_cents': 5})
+        self.assertEqual(self.builds, 2)
+        
+        # A new data version replaces the old files
+        self.exports.export(self.build, "all", (2, 120))
+        self.assertFalse(os.path.exists(first))
+        self.assertIsNone(self.exports.cached("all", (1, 100)))
+    
+    def test_in_progress_files_survive_pruning(self):
+        # Another session still writing an export of the old version
+        writing = os.path.join(self.tmp.name, "all-old-x.csv.1234.tmp")
+        open(writing, 'w').close()
+        path = self.exports.export(self.build, "all", (2, 120))
+        self.assertTrue(os.path.exists(writing))
+        self.assertEqual(set(os.listdir(self.tmp.name)), {os.path.basename(path), os.path.basename(writing)})
+    
+    def test_export_frame_uses_display_amounts(self):
+        rows = pd.DataFrame({
+            'date': pd.to_datetime(['2024-01-05', '2024-01-06']),
+            'amount_cents': pd.Series([1575, 800000], dtype='int32'),
+            'category': ['food', 'rent'],
+            'description': ['lunch', 'january']
+        })
+        exported = export_frame(rows)
+        self.assertEqual(list(exported.columns), EXPORT_COLUMNS)
+        self.assertEqual(exported['amount'].tolist(), [15.75, 8000.0])
+        self.assertIn("2024-01-05,15.75,food,lunch", exported.to_csv(index=False))
\ No newline at end of file
@@ -0,0 +1,67 @@
+import unittest
+from src.ui.figure_cache import FigureCache
+
+class FakeFigure:
+    def __init__(self, name):
+        self.name = name
+    
+    def to_json(self):
+        return '{"data": [], "layout": {"title": "%s"}}' % self.name
+
+class TestFigureCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = FigureCache(max_entries=2)
+        self.builds = []
+    
+    def build(self, name):
+        def build():
+            self.builds.append(name)
+            return FakeFigure(name)
+        return build
+    
+    def test_hit_returns_the_stored_spec(self):
+        spec = self.cache.get("trend", 1, self.build("a"), theme="Dark")
+        self.assertEqual(spec, {"data": [], "layout": {"title": "a"}})
+        self.assertIs(self.cache.get("trend", 1, self.build("b"), theme="Dark"), spec)
+        self.assertEqual(self.builds, ["a"])
+        self.assertEqual(self.cache.stats(), {"entries": 1, "hits": 1, "misses": 1, "hit_rate": 0.5})
+    
+    def test_key_includes_version_params_and_theme(self):
+        self.cache = FigureCache(max_entries=10)
+        self.cache.get("trend", 1, self.build("base"), theme="Dark")
+        self.cache.get("trend", 2, self.build("version"), theme="Dark")
+        self.cache.get("trend", 1, self.build("params"), params=("monthly",), theme="Dark")
+        self.cache.get("trend", 1, self.build("theme"), theme="Light")
+        self.cache.get("pie", 1, self.build("chart"), theme="Dark")
+        self.assertEqual(self.builds, ["base", "version", "params", "theme", "chart"])
+        
+        spec = self.cache.get("trend", 1, self.build("again"), params=("monthly",), theme="Dark")
+        self.assertEqual(spec["layout"]["title"], "params")
+        self.assertEqual(len(self.builds), 5)
+    
+    def test_least_recently_used_entry_is_evicted(self):
+        self.cache.get("a", 1, self.build("a"), theme="Dark")
+        self.cache.get("b", 1, self.build("b"), theme="Dark")
+        self.cache.get("a", 1, self.build("a2"), theme="Dark")    # a is now most recent
+        self.cache.get("c", 1, self.build("c"), theme="Dark")     # evicts b
+        self.assertEqual(self.cache.stats()["entries"], 2)
+        
+        self.cache.get("a", 1, self.build("a3"), theme="Dark")
+        self.cache.get("b", 1, self.build("b2"), theme="Dark")
+        self.assertEqual(self.builds, ["a", "b", "c", "b2"])
+    
+    def test_unversioned_data_bypasses_the_cache(self):
+        first = self.cache.get("trend", None, self.build("a"), theme="Dark")
+        second = self.cache.get("trend", None, self.build("b"), theme="Dark")
+        self.assertEqual(self.builds, ["a", "b"])
+        self.assertEqual(second["layout"]["title"], "b")
+        self.assertIsNot(first, second)
+        self.assertEqual(self.cache.stats(), {"entries": 0, "hits": 0, "misses": 0, "hit_rate": 0.0})
+        
+        self.cache.get("trend", 1, self.build("c"), theme="Dark")
+        self.cache.clear()
+        self.cache.get("trend", 1, self.build("d"), theme="Dark")
+        self.assertEqual(self.builds, ["a", "b", "c", "d"])
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
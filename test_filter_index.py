@@ -0,0 +1,74 @@
+import unittest
+import numpy as np
+import pandas as pd
+from src.services.filter_index import FilterIndex
+
+class TestFilterIndex(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(7)
+        n = 2000
+        categories = ['food', 'rent', 'transportation', 'other']
+        self.df = pd.DataFrame({
+            'date': pd.Timestamp('2025-01-01') + pd.to_timedelta(rng.integers(0, 400 * 86400, n), 's'),
+            'amount_cents': rng.integers(1, 50000, n),
+            'category': pd.Categorical(rng.choice(categories, n), categories=categories),
+        })
+        self.index = FilterIndex.from_frame(self.df)
+    
+    def brute_force(self, categories=None, min_cents=None, max_cents=None, start=None, end=None):
+        df = self.df
+        mask = np.ones(len(df), dtype=bool)
+        if categories is not None:
+            mask &= df['category'].isin(categories).to_numpy()
+        if min_cents is not None:
+            mask &= (df['amount_cents'] >= min_cents).to_numpy()
+        if max_cents is not None:
+            mask &= (df['amount_cents'] <= max_cents).to_numpy()
+        if start is not None:
+            mask &= (df['date'] >= pd.Timestamp(start)).to_numpy()
+        if end is not None:
+            mask &= (df['date'] < pd.Timestamp(end)).to_numpy()
+        return np.flatnonzero(mask)
+    
+    def test_queries_match_brute_force(self):
+        queries = [
+            {},
+            {'categories': ['food', 'rent']},
+            {'categories': []},
+            {'min_cents': 1000, 'max_cents': 2000},
+            {'start': '2025-03-01', 'end': '2025-04-01'},
+            {'categories': ['food'], 'min_cents': 100, 'max_cents': 40000},
+            {'categories': ['rent', 'other'], 'min_cents': 500, 'start': '2025-02-01', 'end': '2025-12-01'},
+        ]
+        amounts = self.df['amount_cents'].to_numpy()
+        for query in queries:
+            expected = self.brute_force(**query)
+            result = self.index.query(**query)
+            np.testing.assert_array_equal(result.ids, expected, str(query))
+            self.assertEqual(result.count, len(expected), str(query))
+            self.assertEqual(result.total_cents, int(amounts[expected].sum()), str(query))
+    
+    def test_unused_categories_do_not_defeat_all_selected(self):
+        # Registry-coded frames list categories with no rows
+        registry_names = ['food', 'rent', 'transportation', 'other', 'healthcare', 'shopping']
+        self.df['category'] = self.df['category'].cat.set_categories(registry_names)
+        self.index = FilterIndex.from_frame(self.df)
+        present = list(self.df['category'].unique())
+        self.assertIsNone(self.index._category_bitmap(present))
+        self.assertIsNotNone(self.index._category_bitmap(['food']))
+        
+        for query in ({'categories': present, 'min_cents': 1000, 'max_cents': 5000},
+                      {'categories': present, 'start': '2025-03-01', 'end': '2025-05-01'},
+                      {'categories': registry_names}):
+            np.testing.assert_array_equal(self.index.query(**query).ids, self.brute_force(**query), str(query))
+    
+    def test_sort_ids_matches_stable_sort(self):
+        ids = self.index.query(categories=['food', 'rent'], min_cents=2000).ids
+        for column in ('date', 'amount_cents'):
+            values = self.df[column].to_numpy()
+            expected = ids[np.argsort(values[ids], kind='stable')]
+            np.testing.assert_array_equal(self.index.sort_ids(ids, column), expected)
+        
+        names = self.df['category'].astype(str).to_numpy()
+        by_name = self.index.sort_ids(ids, 'category', ascending=False)
+        self.assertTrue((names[by_name][:-1] >= names[by_name][1:]).all())
\ No newline at end of file
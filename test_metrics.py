@@ -0,0 +1,48 @@
+import random
+import unittest
+import urllib.request
+from src.services.metrics import MetricsRegistry, make_metrics_server
+
+class TestMetrics(unittest.TestCase):
+    def setUp(self):
+        self.registry = MetricsRegistry()
+    
+    def test_histogram_quantiles_within_relative_error(self):
+        histogram = self.registry.histogram("latency_seconds", "Latency")
+        rng = random.Random(7)
+        values = sorted(rng.lognormvariate(-5, 1.5) for _ in range(20000))
+        for value in values:
+            histogram.observe(value)
+        
+        for q, estimate in histogram.quantiles().items():
+            exact = values[int(q * len(values)) - 1]
+            self.assertAlmostEqual(estimate, exact, delta=exact * 0.05 + 1e-6)
+        self.assertEqual(histogram.count, len(values))
+    
+    def test_exposition_format(self):
+        self.registry.counter("writes_total", "Rows written").inc(3)
+        self.registry.counter("cache_total", "Lookups", {"cache": "cube", "result": "hit"}).inc()
+        self.registry.gauge("sessions", "Active sessions", fn=lambda: 2)
+        self.assertIs(self.registry.counter("writes_total", "Rows written"),
+                      self.registry.counter("writes_total", "Rows written"))
+        
+        text = self.registry.exposition()
+        self.assertIn("# TYPE writes_total counter\nwrites_total 3\n", text)
+        self.assertIn('cache_total{cache="cube",result="hit"} 1\n', text)
+        self.assertIn("sessions 2\n", text)
+    
+    def test_http_endpoint(self):
+        self.registry.counter("writes_total", "Rows written").inc()
+        # A private server: the process-wide one from start_metrics_server is never touched
+        server = make_metrics_server(0, registry=self.registry)
+        port = server.server_address[1]
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics", timeout=5) as response:
+                self.assertIn("text/plain", response.headers["Content-Type"])
+                self.assertIn("writes_total 1", response.read().decode())
+        finally:
+            server.shutdown()
+            server.server_close()
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,75 @@
+import os
+import tempfile
+import unittest
+from decimal import Decimal
+import numpy as np
+import pandas as pd
+from src.models.money import compact_cents, format_money, to_cents, to_cents_array
+from src.repositories.expense_repository import COLUMNS, ExpenseRepository
+
+class TestMoney(unittest.TestCase):
+    def test_to_cents_rounds_half_up(self):
+        self.assertEqual(to_cents(0.285), 29)
+        self.assertEqual(to_cents(0.125), 13)
+        self.assertEqual(to_cents(1.005), 101)
+        self.assertEqual(to_cents(-0.125), -13)
+        self.assertEqual(to_cents("12.345"), 1235)
+        self.assertEqual(to_cents(Decimal("0.005")), 1)
+        self.assertEqual(to_cents(7), 700)
+    
+    def test_to_cents_array_agrees_with_to_cents(self):
+        rng = np.random.default_rng(3)
+        amounts = np.concatenate([
+            np.round(rng.uniform(-1000, 1000, 5000), 3),
+            [0.285, 0.125, 1.005, -0.125, -2.675, 0.0, 1e9 + 0.005]
+        ])
+        expected = [to_cents(float(amount)) for amount in amounts]
+        result = to_cents_array(amounts)
+        self.assertEqual(result.dtype, np.int64)
+        self.assertEqual(result.tolist(), expected)
+    
+    def test_format_money(self):
+        self.assertEqual(format_money(1250), "$12.50")
+        self.assertEqual(format_money(5), "$0.05")
+        self.assertEqual(format_money(0), "$0.00")
+        self.assertEqual(format_money(-1250), "-$12.50")
+        self.assertEqual(format_money(-5, symbol="KES "), "-KES 0.05")
+        self.assertEqual(format_money(np.int64(123456)), "$1234.56")
+        # Fractional cents round half up like to_cents, not to even
+        self.assertEqual(format_money(12.5), "$0.13")
+        self.assertEqual(format_money(14.5), "$0.15")
+        self.assertEqual(format_money(-12.5), "-$0.13")
+        self.assertEqual(format_money(np.float64(99.4)), "$0.99")
+    
+    def test_compact_cents(self):
+        small = compact_cents([1, -2, 2 ** 31 - 1])
+        self.assertEqual(small.dtype, np.int32)
+        self.assertEqual(small.tolist(), [1, -2, 2 ** 31 - 1])
+        self.assertEqual(compact_cents([1, 2 ** 31]).dtype, np.int64)
+        self.assertEqual(compact_cents([-(2 ** 40)]).dtype, np.int64)
+        self.assertEqual(compact_cents([]).dtype, np.int32)
+    
+    def test_legacy_amount_csv_is_migrated(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "expenses.csv")
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write("date,amount,category,description\n")
+                f.write("2024-01-02 12:30:00,12.5,food,lunch\n")
+                f.write("2024-01-03 08:00:00,0.285,transportation,bus\n")
+                f.write("2024-01-04,,other,\n")
+            
+            repository = ExpenseRepository(path)
+            with open(path, encoding='utf-8') as f:
+                self.assertEqual(f.readline().strip(), ",".join(COLUMNS))
+            df = repository.get_all_expenses()
+            self.assertEqual(df['amount_cents'].tolist(), [1250, 29, 0])
+            self.assertEqual(df['date'].tolist(), [
+                pd.Timestamp(2024, 1, 2, 12, 30), pd.Timestamp(2024, 1, 3, 8), pd.Timestamp(2024, 1, 4)
+            ])
+            
+            # Migrating again is a no-op
+            ExpenseRepository(path)
+            self.assertEqual(repository.get_all_expenses()['amount_cents'].tolist(), [1250, 29, 0])
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,47 @@
+import json
+import os
+import tempfile
+import unittest
+from src.utils.perf import JsonLinesSink, Tracer
+
+class TestTracer(unittest.TestCase):
+    def setUp(self):
+        self.tracer = Tracer(max_traces=3)
+    
+    def test_nested_spans_form_one_trace(self):
+        @self.tracer.timed("load")
+        def load():
+            with self.tracer.span("parse"):
+                return list(range(1000))
+        
+        with self.tracer.trace("rerun") as attrs:
+            load()
+            attrs['page'] = "Goals"
+        
+        trace, = self.tracer.recent()
+        self.assertEqual(trace['attrs'], {'page': "Goals"})
+        self.assertEqual([(s['name'], s['depth']) for s in trace['spans']],
+                         [("rerun", 0), ("load", 1), ("parse", 2)])
+        root, child, grandchild = trace['spans']
+        self.assertLessEqual(child['start_ms'], grandchild['start_ms'])
+        self.assertGreaterEqual(root['duration_ms'], child['duration_ms'])
+    
+    def test_spans_outside_a_trace_are_ignored(self):
+        with self.tracer.span("orphan"):
+            pass
+        self.assertEqual(self.tracer.recent(), [])
+    
+    def test_ring_and_json_lines_sink(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "perf.jsonl")
+            self.tracer.add_sink(JsonLinesSink(path))
+            for i in range(5):
+                with self.tracer.trace("rerun", n=i):
+                    pass
+            
+            self.assertEqual([t['attrs']['n'] for t in self.tracer.recent(10)], [4, 3, 2])
+            with open(path) as f:
+                self.assertEqual([json.loads(line)['attrs']['n'] for line in f], list(range(5)))
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,48 @@
+import bisect
+import json
+import random
+import unittest
+from src.services.quantile_sketch import KLLSketch
+
+QUANTILES = (0.01, 0.1, 0.25, 0.5, 0.75, 0.9, 0.99)
+
+class TestKLLSketch(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(42)
+        self.values = [rng.lognormvariate(3, 1) for _ in range(50000)]
+        self.exact = sorted(self.values)
+    
+    def assertRankError(self, sketch, exact, tolerance=0.02):
+        for q in QUANTILES:
+            estimate = sketch.quantile(q)
+            true_rank = bisect.bisect_right(exact, estimate) / len(exact)
+            self.assertAlmostEqual(true_rank, q, delta=tolerance, msg=f"q={q}")
+    
+    def test_rank_error_against_exact_quantiles(self):
+        sketch = KLLSketch(seed=1)
+        sketch.update_many(self.values)
+        self.assertEqual(sketch.n, len(self.values))
+        self.assertLess(sketch.size, len(self.values) // 20)
+        self.assertEqual(sketch.quantile(0), self.exact[0])
+        self.assertEqual(sketch.quantile(1), self.exact[-1])
+        self.assertRankError(sketch, self.exact)
+    
+    def test_merge(self):
+        left, right = KLLSketch(seed=2), KLLSketch(seed=3)
+        left.update_many(self.values[:20000])
+        right.update_many(self.values[20000:])
+        merged = left.merge(right)
+        self.assertEqual(merged.n, len(self.values))
+        self.assertEqual(merged.max_value, self.exact[-1])
+        self.assertRankError(merged, self.exact)
+    
+    def test_dict_round_trip(self):
+        sketch = KLLSketch(seed=4)
+        sketch.update_many(self.values[:5000])
+        restored = KLLSketch.from_dict(json.loads(json.dumps(sketch.to_dict())))
+        self.assertEqual(restored.to_dict(), sketch.to_dict())
+        self.assertEqual(restored.quantiles(QUANTILES), sketch.quantiles(QUANTILES))
+        self.assertEqual(KLLSketch.from_dict(KLLSketch().to_dict()).n, 0)
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,35 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+from src.utils.startup_profiler import StartupProfiler
+
+class TestStartupProfiler(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.profiler = StartupProfiler(os.path.join(self.tmp.name, "profile.json"))
+    
+    def tearDown(self):
+        self.tmp.cleanup()
+    
+    def test_only_real_imports_are_recorded(self):
+        sys.modules.pop('colorsys', None)
+        module = self.profiler.load('colorsys')
+        self.assertIs(self.profiler.load('colorsys'), module)
+        self.assertEqual([item['module'] for item in self.profiler.imports], ['colorsys'])
+        self.assertGreaterEqual(self.profiler.imports[0]['modules_loaded'], 1)
+    
+    def test_first_render_is_recorded_once_and_published(self):
+        with self.profiler.first_render("Goals"):
+            pass
+        first = self.profiler.first_renders["Goals"]
+        with self.profiler.first_render("Goals"):
+            sum(range(100000))
+        self.assertEqual(self.profiler.first_renders["Goals"], first)
+        
+        with open(self.profiler.report_path) as f:
+            self.assertEqual(json.load(f)['first_renders'], {"Goals": first})
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
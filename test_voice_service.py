@@ -0,0 +1,238 @@
+import unittest
+import numpy as np
+import pandas as pd
+from src.services.voice_service import (
+    BATCH_COLUMNS, PARALLEL_MIN_ITEMS, PARSE_CACHE, ParseCache, VoiceService, NUMBER, CURRENCY, SYMBOL
+)
+from src.ml.category_classifier import CategoryClassifier
+
+class TestVoiceService(unittest.TestCase):
+    def setUp(self):
+        self.service = VoiceService()
+    
+    def test_tokenize_kinds(self):
+        tokens = self.service.tokenize("$12.50 pizza 8k 20 bucks")
+        kinds = [t.kind for t in tokens]
+        self.assertEqual(kinds[:2], [SYMBOL, NUMBER])
+        self.assertEqual(tokens[3].multiplier, 1000)
+        self.assertEqual(kinds[-1], CURRENCY)
+    
+    def test_amount_priorities(self):
+        cases = {
+            "Spent 50 dollars on groceries": 50.0,
+            "8k for rent": 8000.0,
+            "dinner at 7 cost $40": 40.0,
+            "dinner at 7 cost 40 dollars": 40.0,
+            "netflix subscription 1,200": 1200.0,
+            "twenty five dollars lunch": 25.0,
+            "five hundred": 0.0,
+        }
+        for text, expected in cases.items():
+            self.assertEqual(self.service.extract_amount(text), expected, text)
+    
+    def test_description_drops_amount_and_currency(self):
+        result = self.service.parse_voice_input("$12.50 pizza with friends")
+        self.assertTrue(result["success"])
+        self.assertEqual(result["description"], "pizza with friends")
+        
+        result = self.service.parse_voice_input("I paid 30 euros for a movie")
+        self.assertEqual(result["description"], "movie")
+    
+    def test_empty_input(self):
+        result = self.service.parse_voice_input("   ")
+        self.assertFalse(result["success"])
+        self.assertEqual(result["error"], "Empty input")
+    
+    def test_category_matches_whole_words_only(self):
+        # 'ate' inside 'late' and 'plan' inside 'planet' must not count
+        self.assertEqual(self.service.extract_category("late bus"), "Transport")
+        self.assertEqual(self.service.extract_category("planet of the apes movie"), "Misc")
+        self.assertEqual(self.service.extract_category("netflix subscription plan"), "Subscriptions")
+    
+    def test_added_keyword_is_used(self):
+        self.assertEqual(self.service.extract_category("bodaboda home"), "Misc")
+        self.service.add_category_keyword("Transport", "bodaboda")
+        self.assertEqual(self.service.extract_category("bodaboda home"), "Transport")
+    
+    def test_streaming_matches_full_parse(self):
+        stream = self.service.stream()
+        stream.append("spent fifty")
+        stream.revise("spent fifty dollars")
+        stream.append("on uber")
+        result = stream.append("ride home")
+        
+        full = self.service.parse_voice_input(stream.text)
+        for field in ("amount", "category", "description", "success"):
+            self.assertEqual(result[field], full[field], field)
+        self.assertEqual(result["amount"], 50.0)
+        self.assertEqual(result["category"], "Transport")
+    
+    def test_streaming_keeps_scores_incrementally(self):
+        self.service.add_category_keyword("Food", "ugali fish")
+        stream = self.service.stream()
+        stream.append("had ugali")
+        # A multi-word keyword split across segments is still found
+        self.assertEqual(stream.append("fish 300 shillings")["category"], "Food")
+        # Revising a segment withdraws its keywords
+        stream.revise("taxi 300 shillings")
+        self.assertEqual(stream.result()["category"], "Transport")
+        self.assertEqual(stream.result()["category"], self.service.extract_category(stream.text))
+        stream.reset()
+        self.assertEqual(stream.append("uber")["category"], "Transport")
+    
+    def test_classifier_fallback_when_no_keyword_matches(self):
+        classifier = CategoryClassifier().partial_fit(
+            ["mandazi and chai", "chai at kiosk", "matatu to town"],
+            ["food", "food", "transportation"]
+        )
+        service = VoiceService(classifier=classifier)
+        # Registry labels come back in the keyword categories' vocabulary
+        self.assertEqual(service.extract_category("chai 50"), "Food")
+        self.assertEqual(service.extract_category("matatu 50"), "Transport")
+        # Keyword hits still win over the classifier
+        self.assertEqual(service.extract_category("chai on the bus"), "Transport")
+        # Nothing seen in training: the class prior alone does not decide
+        self.assertEqual(classifier.predict("zzzz qqq"), (None, 0.0))
+        self.assertEqual(service.parse_voice_input("zzzz 50 dollars")["category"], "Misc")
+
+    
+    def test_fuzzy_keywords_and_number_words(self):
+        result = self.service.parse_voice_input("resturant bill fourty dollars")
+        self.assertEqual(result["amount"], 40.0)
+        self.assertEqual(result["category"], "Food")
+        # Short words and ordinals are never fuzzed
+        self.assertEqual(self.service.extract_amount("fifth avenue 30"), 30.0)
+        strict = VoiceService(fuzzy_distance=0)
+        self.assertEqual(strict.extract_category("resturant bill"), "Misc")
+    
+    def test_fuzzy_matches_do_not_override_ordinary_words(self):
+        # Common words one edit from a keyword are not misspellings of it
+        self.assertEqual(self.service.extract_category("paid full price for shoes 40 dollars"), "Misc")
+        self.assertEqual(self.service.extract_category("launch party 20 dollars"), "Misc")
+        self.assertEqual(self.service.extract_category("trail run entry 15 dollars"), "Misc")
+        self.assertEqual(self.service.extract_category("tipped the waiter 5 dollars"), "Misc")
+        self.assertEqual(self.service.extract_category("screaming kids 10 dollars"), "Misc")
+        self.assertEqual(self.service.extract_category("stopping fee 10 dollars"), "Misc")
+        # Ordinals come from the grammar and are never read as tens
+        self.assertIn("fifth", self.service.grammar.plain_words)
+        self.assertEqual(self.service.extract_amount("fifth dollars"), 0.0)
+        # An exact keyword beats any number of near-misses
+        self.assertEqual(self.service.extract_category("resturant resturent bus"), "Transport")
+        stream = self.service.stream()
+        stream.append("resturant resturent")
+        self.assertEqual(stream.append("bus 20")["category"], "Transport")
+        # Number-word near-misses need an amount next to them
+        self.assertEqual(self.service.parse_voice_input("thirsty so two dollars")["amount"], 2.0)
+        self.assertEqual(self.service.extract_amount("fourty dollars"), 40.0)
+    
+    def test_swahili_grammar(self):
+        service = VoiceService(locales=("en", "sw"))
+        cases = {
+            "shilingi elfu tano kwa chakula": 5000.0,
+            "elfu mbili mia tano shilingi za kenya nauli": 2500.0,
+            "mia tano na hamsini ksh": 550.0,
+            "elfu ishirini na tano bob": 25000.0,
+            "two thousand five hundred dollars": 2500.0,
+        }
+        for text, expected in cases.items():
+            self.assertEqual(service.extract_amount(text), expected, text)
+        # English-only parsers don't know the Swahili words
+        self.assertEqual(self.service.extract_amount("shilingi elfu tano"), 0.0)
+
+class TestVoiceBatch(unittest.TestCase):
+    PHRASES = [
+        "Spent 50 dollars on groceries", "uber ride 15.75", "8k for rent",
+        "netflix subscription 1,200", "twenty five dollars lunch", "hello there", ""
+    ]
+    
+    def setUp(self):
+        self.service = VoiceService()
+    
+    def assertMatchesSingleParses(self, texts, frame):
+        self.assertEqual(list(frame.columns), BATCH_COLUMNS)
+        self.assertEqual(len(frame), len(texts))
+        for text, row in zip(texts, frame.itertuples(index=False)):
+            single = self.service.parse_voice_input(text)
+            for field in BATCH_COLUMNS:
+                value = getattr(row, field)
+                if single[field] is None:
+                    self.assertTrue(pd.isna(value), (text, field))
+                else:
+                    self.assertEqual(value, single[field], (text, field))
+    
+    def test_serial_batch_matches_single_parses(self):
+        self.assertMatchesSingleParses(self.PHRASES, self.service.parse_batch(self.PHRASES))
+    
+    def test_process_pool_batch_matches_single_parses(self):
+        texts = [f"{phrase} {i}" if i % 3 else phrase
+                 for i, phrase in enumerate(self.PHRASES * (PARALLEL_MIN_ITEMS // len(self.PHRASES) + 1))]
+        self.assertGreaterEqual(len(texts), PARALLEL_MIN_ITEMS)
+        self.service.add_category_keyword("Transport", "bodaboda")
+        texts.append("bodaboda 300")
+        frame = self.service.parse_batch(texts, workers=2, chunksize=1000)
+        self.assertEqual(frame["category"].iloc[-1], "Transport")
+        self.assertMatchesSingleParses(texts, frame)
+    
+    def test_to_expense_batch(self):
+        parsed = self.service.parse_batch(["uber ride 15.75", "hello there", "8k for rent"])
+        dates = np.array(['2024-01-01', '2024-01-02', '2024-01-03'], dtype='datetime64[ns]')
+        batch = VoiceService.to_expense_batch(parsed, dates)
+        
+        self.assertEqual(len(batch), 2)
+        self.assertEqual(batch.amount_cents.tolist(), [1575, 800000])
+        self.assertEqual([batch.categories[c] for c in batch.category_codes], ["Transport", "Rent"])
+        self.assertEqual(batch.descriptions, ["uber ride", "rent"])
+        self.assertEqual(batch.dates.tolist(), dates[[0, 2]].tolist())
+        self.assertEqual(list(batch.to_frame().columns), ['date', 'amount_cents', 'category', 'description'])
+        self.assertEqual(len(VoiceService.to_expense_batch(parsed)), 2)
+
+class TestParseCache(unittest.TestCase):
+    def setUp(self):
+        PARSE_CACHE.clear()
+    
+    def tearDown(self):
+        PARSE_CACHE.clear()
+    
+    def test_hits_and_misses(self):
+        service = VoiceService()
+        first = service.parse_voice_input("Coffee 5 bucks")
+        self.assertEqual(VoiceService.cache_stats()["misses"], 1)
+        
+        # Same normalized transcript: served from the cache, original text kept
+        second = service.parse_voice_input("  coffee   5 BUCKS ")
+        stats = VoiceService.cache_stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["size"]), (1, 1, 1))
+        self.assertEqual(second["original_text"], "coffee   5 BUCKS")
+        self.assertEqual({k: v for k, v in second.items() if k != "original_text"},
+                         {k: v for k, v in first.items() if k != "original_text"})
+        
+        # Callers get copies; mutating one never changes the cached entry
+        second["amount"] = 0
+        self.assertEqual(service.parse_voice_input("coffee 5 bucks")["amount"], 5.0)
+    
+    def test_lru_eviction(self):
+        cache = ParseCache(maxsize=2)
+        cache.put(("a",), {"amount": 1})
+        cache.put(("b",), {"amount": 2})
+        self.assertEqual(cache.get(("a",)), {"amount": 1})     # a is now most recent
+        cache.put(("c",), {"amount": 3})
+        self.assertIsNone(cache.get(("b",)))
+        self.assertEqual(cache.get(("a",)), {"amount": 1})
+        self.assertEqual(cache.get(("c",)), {"amount": 3})
+        self.assertEqual(cache.stats()["size"], 2)
+    
+    def test_custom_keywords_do_not_share_results(self):
+        default, custom, other = VoiceService(), VoiceService(), VoiceService()
+        custom.add_category_keyword("Transport", "bodaboda")
+        other.add_category_keyword("Rent", "bodaboda")
+        
+        self.assertEqual(default.parse_voice_input("bodaboda 300")["category"], "Misc")
+        self.assertEqual(custom.parse_voice_input("bodaboda 300")["category"], "Transport")
+        self.assertEqual(other.parse_voice_input("bodaboda 300")["category"], "Rent")
+        self.assertEqual(default.parse_voice_input("bodaboda 300")["category"], "Misc")
+        self.assertEqual(VoiceService.cache_stats()["size"], 3)
+        
+        # A further keyword gets a fresh table id, so earlier results are not reused
+        custom.add_category_keyword("Rent", "ofisi")
+        self.assertEqual(custom.parse_voice_input("bodaboda 300")["category"], "Transport")
+        self.assertEqual(VoiceService.cache_stats()["hits"], 1)
\ No newline at end of file
@@ -9,6 +9,10 @@ export default defineConfig({
       '@': path.resolve(__dirname, './src'),
     },
   },
+  build: {
+    // .vite/manifest.json: dev_server.py gives the hashed files it lists immutable caching
+    manifest: true,
+  },
   server: {
     port: 3000,
     strictPort: true,
@@ -0,0 +1,177 @@
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+# Token kinds produced by grammar entries
+NUMBER_WORD = "number_word"     # units and tens: "five", "ishirini"
+SCALE_WORD = "scale_word"       # multiplier after its count: "five hundred"
+SCALE_PREFIX = "scale_prefix"   # multiplier before its count: "elfu tano"
+CURRENCY = "currency"
+
+class Locale(NamedTuple):
+    """Spoken-amount vocabulary of one language"""
+    code: str
+    number_words: Mapping[str, int]
+    scale_words: Mapping[str, int]
+    currency_words: Tuple[str, ...]
+    filler_words: Tuple[str, ...]
+    scale_first: bool = False   # "elfu tano" (1000 x 5) rather than "five thousand"
+    plain_words: Tuple[str, ...] = ()   # real words near a number word ("fifth"), never fuzzed
+
+class Entry(NamedTuple):
+    kind: str
+    value: float
+    locale: str
+
+# ============================================================================
+# BUILT-IN LOCALES
+# ============================================================================
+
+ENGLISH = Locale(
+    code="en",
+    number_words={
+        "zero": 0, "one": 1, "two": 2, "three": 3, "four": 4,
+        "five": 5, "six": 6, "seven": 7, "eight": 8, "nine": 9,
+        "ten": 10, "eleven": 11, "twelve": 12, "thirteen": 13,
+        "fourteen": 14, "fifteen": 15, "sixteen": 16, "seventeen": 17,
+        "eighteen": 18, "nineteen": 19, "twenty": 20, "thirty": 30,
+        "forty": 40, "fifty": 50, "sixty": 60, "seventy": 70,
+        "eighty": 80, "ninety": 90
+    },
+    scale_words={"hundred": 100, "thousand": 1000, "million": 1000000},
+    currency_words=(
+        "dollar", "dollars", "buck", "bucks", "usd", "us dollars",
+        "shilling", "shillings", "tsh", "tzs", "eur", "euro", "euros",
+        "pound", "pounds", "gbp"
+    ),
+    filler_words=(
+        "spent", "paid", "bought", "purchased", "got", "ordered",
+        "for", "on", "at", "in", "a", "an", "the", "some",
+        "my", "i", "we", "today", "yesterday", "just", "about"
+    ),
+    plain_words=(
+        "first", "second", "third", "fourth", "forth", "fifth",
+        "sixth", "seventh", "eighth", "ninth", "tenth"
+    )
+)
+
+SWAHILI = Locale(
+    code="sw",
+    number_words={
+        "sifuri": 0, "moja": 1, "mbili": 2, "tatu": 3, "nne": 4,
+        "tano": 5, "sita": 6, "saba": 7, "nane": 8, "tisa": 9,
+        "kumi": 10, "ishirini": 20, "thelathini": 30, "arobaini": 40,
+        "hamsini": 50, "sitini": 60, "sabini": 70, "themanini": 80,
+        "tisini": 90
+    },
+    scale_words={"mia": 100, "elfu": 1000, "laki": 100000, "milioni": 1000000},
+    currency_words=(
+        "shilingi", "ksh", "kshs", "kes", "tsh", "tzs", "bob",
+        "shilingi za kenya", "shilingi za tanzania"
+    ),
+    filler_words=(
+        "na", "ya", "za", "kwa", "kwenye", "nimetumia", "nimelipa",
+        "nililipa", "nilinunua", "leo", "jana"
+    ),
+    scale_first=True
+)
+
+LOCALES: Dict[str, Locale] = {ENGLISH.code: ENGLISH, SWAHILI.code: SWAHILI}
+
+# ============================================================================
+# COMPILED GRAMMAR
+# ============================================================================
+
+class Grammar:
+    """
+    Number, scale and currency vocabulary of several locales merged into one
+    word-level trie.
+
+    Each transcript word costs one dict probe at the root whatever the number
+    of locales loaded; only words that start a multi-word entry
+    ("shilingi za kenya") look further ahead. Where locales disagree on a
+    word, the first locale listed wins.
+    """
+
+    def __init__(self, locales: Sequence[Locale]):
+        self.locales = tuple(locale.code for locale in locales)
+        # word -> [Entry or None, children]
+        self._root: Dict[str, list] = {}
+        self.max_phrase = 1
+
+        fillers, plain = set(), set()
+        for locale in locales:
+            scale_kind = SCALE_PREFIX if locale.scale_first else SCALE_WORD
+            for word, value in locale.number_words.items():
+                self._insert(word, Entry(NUMBER_WORD, float(value), locale.code))
+            for word, value in locale.scale_words.items():
+                self._insert(word, Entry(scale_kind, float(value), locale.code))
+            for word in locale.currency_words:
+                self._insert(word, Entry(CURRENCY, 0.0, locale.code))
+            fillers.update(locale.filler_words)
+            plain.update(locale.plain_words)
+
+        self.filler_words = frozenset(fillers)
+        self.plain_words = frozenset(plain)
+        self.number_words = MappingProxyType({
+            word: node[0].value for word, node in self._root.items()
+            if node[0] is not None and node[0].kind != CURRENCY
+        })
+        self.currency_words = frozenset(
+            word for word, node in self._root.items()
+            if node[0] is not None and node[0].kind == CURRENCY
+        )
+        self.phrase_starts = frozenset(word for word, node in self._root.items() if node[1])
+
+    def _insert(self, phrase: str, entry: Entry) -> None:
+        words = phrase.lower().split()
+        self.max_phrase = max(self.max_phrase, len(words))
+        level = self._root
+        for word in words[:-1]:
+            level = level.setdefault(word, [None, {}])[1]
+        node = level.setdefault(words[-1], [None, {}])
+        if node[0] is None:
+            node[0] = entry
+
+    def lookup(self, word: str) -> Optional[Entry]:
+        """Entry for a single (lowercase) word"""
+        node = self._root.get(word)
+        return node[0] if node is not None else None
+
+    def match(self, words: List[str], start: int) -> Tuple[Optional[Entry], int]:
+        """
+        Longest entry starting at words[start]: (entry, words consumed), or
+        (None, 0) when nothing matches.
+        """
+        node = self._root.get(words[start])
+        if node is None:
+            return None, 0
+
+        best, length = node[0], 1 if node[0] is not None else 0
+        position = start + 1
+        while node[1] and position < len(words):
+            node = node[1].get(words[position])
+            if node is None:
+                break
+            position += 1
+            if node[0] is not None:
+                best, length = node[0], position - start
+        return best, length
+
+_GRAMMARS: Dict[Tuple[str, ...], Grammar] = {}
+
+def register_locale(locale: Locale) -> None:
+    """Add or replace a locale; grammars compiled before keep their tables"""
+    LOCALES[locale.code] = locale
+    for codes in [codes for codes in _GRAMMARS if locale.code in codes]:
+        del _GRAMMARS[codes]
+
+def get_grammar(locales: Iterable[str] = ("en",)) -> Grammar:
+    """Compiled grammar for the given locale codes, shared process-wide"""
+    codes = tuple(dict.fromkeys(locales))
+    grammar = _GRAMMARS.get(codes)
+    if grammar is None:
+        unknown = [code for code in codes if code not in LOCALES]
+        if unknown:
+            raise ValueError(f"Unknown locale(s): {', '.join(unknown)}")
+        grammar = _GRAMMARS[codes] = Grammar([LOCALES[code] for code in codes])
+    return grammar
\ No newline at end of file
@@ -1,63 +1,434 @@
+import itertools
+import os
 import re
-from typing import Dict, List, Optional, Tuple
+import threading
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
 from datetime import datetime
+from types import MappingProxyType
+import numpy as np
+import pandas as pd
+from src.services.keyword_automaton import KeywordAutomaton
+from src.services.bk_tree import BKTree
+from src.services.voice_grammar import (
+    CURRENCY, NUMBER_WORD, SCALE_PREFIX, SCALE_WORD, Grammar, get_grammar
+)
+from src.models.expense import ExpenseBatch
+from src.models.money import to_cents_array
+from src.utils.perf import timed
+from src.services.metrics import REGISTRY
 
-class VoiceService:
-    """Advanced voice-to-expense parser with multi-language and context-aware extraction"""
+# ============================================================================
+# LEXER (compiled once per process)
+# ============================================================================
+
+# One alternation per token class; finditer walks the transcript exactly once
+_TOKEN_PATTERN = re.compile(r"""
+      (?P<symbol>[$£€¥])
+    | (?P<number>\d+(?:,\d{3})*(?:\.\d+)?)(?:\s*(?P<suffix>[km])\b)?
+    | (?P<word>[^\W\d_]+(?:['’-][^\W\d_]+)*)
+    | (?P<punct>[^\s\w])
+""", re.VERBOSE | re.IGNORECASE)
+
+_SHORTHAND_MULTIPLIERS = {"k": 1000, "m": 1000000}
+_STRIP_PUNCTUATION = frozenset(".,!?;:")
+
+# Token kinds (number, scale and currency words come from voice_grammar)
+SYMBOL = "symbol"
+NUMBER = "number"
+WORD = "word"
+PUNCT = "punct"
+_NUMBER_WORD_KINDS = frozenset({NUMBER_WORD, SCALE_WORD, SCALE_PREFIX})
+_DESCRIPTION_KINDS = _NUMBER_WORD_KINDS | {WORD, PUNCT}
+_KEY_WORD_KINDS = _NUMBER_WORD_KINDS | {WORD, CURRENCY}
+_AMOUNT_KINDS = _NUMBER_WORD_KINDS | {NUMBER, CURRENCY, SYMBOL}
+
+# Batches smaller than this are parsed in-process; pool start-up would dominate
+PARALLEL_MIN_ITEMS = 5000
+BATCH_COLUMNS = ["amount", "category", "description", "success", "error"]
+
+class Token(NamedTuple):
+    kind: str
+    text: str               # spelling as it appeared in the transcript
+    value: float = 0.0      # numeric value for NUMBER and number/scale words
+    multiplier: int = 1     # 1000 for '8k', 1000000 for '2m'
+
+class AmountScan:
+    """
+    Resumable amount-candidate scan over a token stream.
+    
+    feed() can be called repeatedly with consecutive slices of a transcript;
+    copy() snapshots the state so a streaming parser can re-scan only the
+    part of the transcript that changed.
+    """
+    
+    __slots__ = (
+        "shorthand_k", "shorthand_m", "after_symbol", "before_currency", "plain",
+        "words_total", "words_current", "words_scale", "words_count",
+        "words_closed", "currency_first", "previous"
+    )
     
     def __init__(self):
-        # Enhanced category keywords with aliases
-        self.category_keywords = {
-            "Food": [
-                "food", "meal", "lunch", "dinner", "breakfast", "brunch",
-                "groceries", "grocery", "restaurant", "cafe", "coffee",
-                "snack", "eating", "ate", "drink", "pizza", "burger"
-            ],
-            "Transport": [
-                "transport", "transportation", "bus", "taxi", "fare",
-                "uber", "lyft", "grab", "train", "subway", "metro",
-                "gas", "fuel", "petrol", "parking", "ride", "trip"
-            ],
-            "Subscriptions": [
-                "subscription", "netflix", "spotify", "youtube", "prime",
-                "membership", "plan", "service", "streaming", "software"
-            ],
-            "Rent": [
-                "rent", "housing", "apartment", "mortgage", "lease",
-                "landlord", "accommodation"
-            ],
-            "Misc": [
-                "entertainment", "movie", "cinema", "music", "game", "gaming",
-                "concert", "show", "utilities", "electricity", "water",
-                "internet", "wifi", "healthcare", "doctor", "hospital",
-                "medicine", "pharmacy", "health", "medical", "shopping",
-                "clothes", "clothing", "shoes", "mall", "store", "amazon"
-            ]
-        }
-        
-        # Filler words to remove from description
-        self.filler_words = {
-            "spent", "paid", "bought", "purchased", "got", "ordered",
-            "for", "on", "at", "in", "a", "an", "the", "some",
-            "my", "i", "we", "today", "yesterday", "just", "about"
-        }
-        
-        # Number words mapping (for voice transcription)
-        self.word_to_number = {
-            "zero": 0, "one": 1, "two": 2, "three": 3, "four": 4,
-            "five": 5, "six": 6, "seven": 7, "eight": 8, "nine": 9,
-            "ten": 10, "eleven": 11, "twelve": 12, "thirteen": 13,
-            "fourteen": 14, "fifteen": 15, "sixteen": 16, "seventeen": 17,
-            "eighteen": 18, "nineteen": 19, "twenty": 20, "thirty": 30,
-            "forty": 40, "fifty": 50, "sixty": 60, "seventy": 70,
-            "eighty": 80, "ninety": 90, "hundred": 100, "thousand": 1000
-        }
+        self.shorthand_k = self.shorthand_m = None
+        self.after_symbol = self.before_currency = self.plain = None
+        # Spoken amount: settled total, running group ("five hundred"), and a
+        # scale-first multiplier waiting for its count ("elfu" in "elfu tano")
+        self.words_total = 0.0
+        self.words_current = 0.0
+        self.words_scale = 0.0
+        self.words_count: Optional[float] = None
+        self.words_closed: Optional[float] = None
+        self.currency_first = False
+        self.previous: Optional[Token] = None
+    
+    def copy(self) -> "AmountScan":
+        clone = AmountScan()
+        for name in self.__slots__:
+            setattr(clone, name, getattr(self, name))
+        return clone
+    
+    def feed(self, tokens: Iterable[Token]) -> None:
+        previous = self.previous
+        
+        for token in tokens:
+            if token.kind == NUMBER:
+                if token.multiplier == 1000 and self.shorthand_k is None:
+                    self.shorthand_k = token.value * 1000
+                elif token.multiplier == 1000000 and self.shorthand_m is None:
+                    self.shorthand_m = token.value * 1000000
+                if self.plain is None and token.multiplier == 1:
+                    self.plain = token.value
+                if self.after_symbol is None and previous is not None and previous.kind == SYMBOL:
+                    self.after_symbol = token.value
+            
+            elif token.kind in (CURRENCY, SYMBOL):
+                if self.before_currency is None and previous is not None and previous.kind == NUMBER \
+                        and previous.multiplier == 1:
+                    self.before_currency = previous.value
+                if token.kind == CURRENCY and self.words_closed is None:
+                    # Word amounts only count next to a currency word: closed by
+                    # one ("twenty dollars") or opened by one ("shilingi elfu tano")
+                    if self._words_value() > 0:
+                        self.words_closed = self._words_value()
+                    else:
+                        self.currency_first = True
+            
+            elif token.kind in _NUMBER_WORD_KINDS and self.words_closed is None:
+                self._feed_word(token)
+            
+            previous = token
         
-        # Currency symbols and keywords
-        self.currency_keywords = [
-            "dollars?", "bucks?", "usd", "shillings?", "tsh", "tzs",
-            "euro?", "eur", "pounds?", "gbp", "¥", "£", "€"
-        ]
+        self.previous = previous
+    
+    def _feed_word(self, token: Token) -> None:
+        value = token.value
+        if token.kind == NUMBER_WORD:
+            if self.words_scale and self.words_count is None:
+                self.words_count = value
+            elif self.words_scale and value < 10 and self.words_count % 10 == 0 \
+                    and self.words_count < 100:
+                # Tens + unit count: "elfu ishirini na tano" is 25 thousand
+                self.words_count += value
+            else:
+                self._settle_scale()
+                self.words_current += value
+        elif token.kind == SCALE_WORD:
+            self._settle_scale()
+            if value < 1000:
+                self.words_current = (self.words_current or 1) * value
+            else:
+                self.words_total += (self.words_current or 1) * value
+                self.words_current = 0.0
+        else:
+            self._settle_scale()
+            self.words_total += self.words_current
+            self.words_current = 0.0
+            self.words_scale = value
+    
+    def _settle_scale(self) -> None:
+        if self.words_scale:
+            self.words_total += self.words_scale * (1 if self.words_count is None else self.words_count)
+            self.words_scale = 0.0
+            self.words_count = None
+    
+    def _words_value(self) -> float:
+        pending = self.words_scale * (1 if self.words_count is None else self.words_count)
+        return self.words_total + self.words_current + pending
+    
+    def amount(self) -> float:
+        candidates = (
+            self.shorthand_k, self.shorthand_m, self.after_symbol,
+            self.before_currency, self.plain
+        )
+        for candidate in candidates:
+            if candidate is not None and candidate > 0:
+                return float(candidate)
+        
+        if self.words_closed is not None:
+            return float(self.words_closed)
+        return float(self._words_value()) if self.currency_first else 0.0
+
+# ============================================================================
+# PARSER TABLES (immutable, built once per process and shared by instances)
+# ============================================================================
+
+# Enhanced category keywords with aliases
+CATEGORY_KEYWORDS = MappingProxyType({
+    "Food": (
+        "food", "meal", "lunch", "dinner", "breakfast", "brunch",
+        "groceries", "grocery", "restaurant", "cafe", "coffee",
+        "snack", "eating", "ate", "drink", "pizza", "burger"
+    ),
+    "Transport": (
+        "transport", "transportation", "bus", "taxi", "fare",
+        "uber", "lyft", "grab", "train", "subway", "metro",
+        "gas", "fuel", "petrol", "parking", "ride", "trip"
+    ),
+    "Subscriptions": (
+        "subscription", "netflix", "spotify", "youtube", "prime",
+        "membership", "plan", "service", "streaming", "software"
+    ),
+    "Rent": (
+        "rent", "housing", "apartment", "mortgage", "lease",
+        "landlord", "accommodation"
+    ),
+    "Misc": (
+        "entertainment", "movie", "cinema", "music", "game", "gaming",
+        "concert", "show", "utilities", "electricity", "water",
+        "internet", "wifi", "healthcare", "doctor", "hospital",
+        "medicine", "pharmacy", "health", "medical", "shopping",
+        "clothes", "clothing", "shoes", "mall", "store", "amazon"
+    )
+})
+
+# Default (English) grammar; number words, currency words and fillers for
+# other locales live in voice_grammar and are merged per service
+DEFAULT_LOCALES = ("en",)
+_DEFAULT_GRAMMAR = get_grammar(DEFAULT_LOCALES)
+FILLER_WORDS = _DEFAULT_GRAMMAR.filler_words
+WORD_TO_NUMBER = _DEFAULT_GRAMMAR.number_words
+CURRENCY_KEYWORDS = _DEFAULT_GRAMMAR.currency_words
+
+_BASE_AUTOMATON = KeywordAutomaton(CATEGORY_KEYWORDS)
+
+# ============================================================================
+# FUZZY MATCHING (ASR misspellings: "resturant", "fourty")
+# ============================================================================
+
+def _single_word_keywords(category_keywords) -> List[str]:
+    return [kw for keywords in category_keywords.values() for kw in keywords if " " not in kw]
+
+# One number-word tree per compiled grammar
+_NUMBER_WORD_TREES: Dict[Grammar, BKTree] = {}
+
+def _number_word_tree(grammar: Grammar) -> BKTree:
+    tree = _NUMBER_WORD_TREES.get(grammar)
+    if tree is None:
+        tree = _NUMBER_WORD_TREES[grammar] = BKTree(grammar.number_words)
+    return tree
+_BASE_KEYWORD_TREE = BKTree(_single_word_keywords(CATEGORY_KEYWORDS))
+
+def fuzzy_limit(word: str, max_distance: int) -> int:
+    """
+    Edits allowed for a number word: none under 5 letters, 1 up to 7, then
+    max_distance. Only applied next to an amount token, see tokenize.
+    """
+    if len(word) < 5:
+        return 0
+    if len(word) < 8:
+        return min(1, max_distance)
+    return max_distance
+
+def keyword_fuzzy_limit(word: str, max_distance: int) -> int:
+    """
+    Edits allowed for a category keyword: one per 8 letters. Short words one
+    edit from a keyword are mostly other real words ("price" -> "prime",
+    "launch" -> "lunch"), not misspellings of it.
+    """
+    return min(len(word) // 8, max_distance)
+
+def _fuzzy_lookup(tree: BKTree, word: str, limit: int, prefix: int = 1) -> Optional[str]:
+    """Closest entry within limit edits that shares the first prefix letters"""
+    if limit <= 0:
+        return None
+    for _, candidate in tree.search(word, limit):
+        if candidate[:prefix] == word[:prefix]:
+            return candidate
+    return None
+
+# ============================================================================
+# PARSE RESULT CACHE
+# ============================================================================
+
+class ParseCache:
+    """Thread-safe bounded LRU of parse results with hit/miss counters"""
+    
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[tuple, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: tuple) -> Optional[Dict]:
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return result
+    
+    def put(self, key: tuple, result: Dict) -> None:
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+    
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hit_ratio": self.hits / lookups if lookups else 0.0
+            }
+
+PARSE_CACHE = ParseCache()
+
+PARSE_SECONDS = REGISTRY.histogram("fedha_voice_parse_seconds", "Latency of single transcript parses")
+BATCH_PARSES = REGISTRY.counter("fedha_voice_batch_parses_total", "Transcripts parsed through parse_batch")
+REGISTRY.gauge(
+    "fedha_voice_parse_cache_hit_ratio", "Share of voice parses served from the parse cache",
+    fn=lambda: PARSE_CACHE.stats()["hit_ratio"]
+)
+
+# Instances with their own keywords get a distinct table id, so their
+# cached results never leak into instances using the shared tables
+_table_ids = itertools.count(1)
+
+def normalize_transcript(text: str) -> str:
+    """Cache key form of a transcript: trimmed, lowercased, single-spaced"""
+    return " ".join(text.lower().split())
+
+class VoiceService:
+    """Advanced voice-to-expense parser with multi-language and context-aware extraction"""
+    
+    def __init__(
+        self, 
+        classifier=None, 
+        min_classifier_confidence: float = 0.6, 
+        fuzzy_distance: int = 2,
+        locales: Sequence[str] = DEFAULT_LOCALES
+    ):
+        """
+        Args:
+            classifier: Optional CategoryClassifier trained on the user's
+                history; consulted when no category keyword matches
+            min_classifier_confidence: Probability a classifier guess needs
+                to beat the "Misc" fallback
+            fuzzy_distance: Maximum edit distance for misspelled keywords and
+                number words (scaled down for short words); 0 disables
+            locales: Grammar locales for number, scale and currency words,
+                e.g. ("en", "sw"); see voice_grammar.LOCALES
+        """
+        self.classifier = classifier
+        self.min_classifier_confidence = min_classifier_confidence
+        self.fuzzy_distance = fuzzy_distance
+        
+        # Shared, read-only tables; nothing is rebuilt per instance
+        self.category_keywords = CATEGORY_KEYWORDS
+        self.category_automaton = _BASE_AUTOMATON
+        self.keyword_tree = _BASE_KEYWORD_TREE
+        self.grammar = get_grammar(locales)
+        self.number_tree = _number_word_tree(self.grammar)
+        self.filler_words = self.grammar.filler_words
+        self.word_to_number = self.grammar.number_words
+        self.currency_keywords = self.grammar.currency_words
+        self._table_id = 0
+        self._fuzzy_memo: Dict[Tuple[str, str], Optional[str]] = {}
+    
+    # ========================================================================
+    # TOKENIZER
+    # ========================================================================
+    
+    def tokenize(self, text: str) -> List[Token]:
+        """
+        Split a transcript into numbers (with k/m multipliers), currency
+        symbols, currency words, number and scale words, plain words and
+        punctuation in a single pass of the precompiled lexer.
+        """
+        grammar = self.grammar
+        matches = list(_TOKEN_PATTERN.finditer(text))
+        tokens = []
+        fuzzy_numbers = []
+        i = 0
+        while i < len(matches):
+            match = matches[i]
+            kind = match.lastgroup
+            i += 1
+            if kind == "suffix":
+                kind = NUMBER
+            
+            if kind == NUMBER:
+                suffix = match.group("suffix")
+                tokens.append(Token(
+                    NUMBER,
+                    match.group(0),
+                    float(match.group("number").replace(",", "")),
+                    _SHORTHAND_MULTIPLIERS[suffix.lower()] if suffix else 1
+                ))
+            elif kind == "word":
+                word = match.group(0)
+                lowered = word.lower()
+                entry = grammar.lookup(lowered)
+                
+                if lowered in grammar.phrase_starts:
+                    # Multi-word entry ("shilingi za kenya"): peek at the next words
+                    words = [lowered]
+                    for following in matches[i:i + grammar.max_phrase - 1]:
+                        if following.lastgroup != "word":
+                            break
+                        words.append(following.group(0).lower())
+                    entry, consumed = grammar.match(words, 0)
+                    if consumed > 1:
+                        word = text[match.start():matches[i + consumed - 2].end()]
+                        i += consumed - 1
+                
+                if entry is None and self.fuzzy_distance and lowered not in self.filler_words:
+                    number_word = self._fuzzy('number', lowered)
+                    if number_word is not None:
+                        fuzzy_numbers.append((len(tokens), grammar.lookup(number_word)))
+                
+                if entry is None:
+                    tokens.append(Token(WORD, word))
+                elif entry.kind == CURRENCY:
+                    tokens.append(Token(CURRENCY, word))
+                else:
+                    tokens.append(Token(entry.kind, word, entry.value))
+            elif kind == SYMBOL:
+                tokens.append(Token(SYMBOL, match.group(0)))
+            else:
+                tokens.append(Token(PUNCT, match.group(0)))
+        
+        # A near-miss of a number word only counts next to another amount
+        # token ("fourty dollars"), so "thirsty so two dollars" keeps its word
+        for index, entry in fuzzy_numbers:
+            neighbours = tokens[max(index - 1, 0):index] + tokens[index + 1:index + 2]
+            if any(token.kind in _AMOUNT_KINDS for token in neighbours):
+                tokens[index] = Token(entry.kind, tokens[index].text, entry.value)
+        
+        return tokens
     
     # ========================================================================
     # AMOUNT EXTRACTION (Enhanced)
@@ -69,128 +440,127 @@ class VoiceService:
         - Numeric: 50, 50.5, 50.50
         - Currency symbols: $50, £50
         - Shorthand: 8k, 1.5k, 2m
-        - Word format: twenty dollars, five hundred
+        - Word format: twenty dollars, shilingi elfu tano (with the "sw" locale)
         """
-        text = text.lower().replace(",", "")
-        
-        # Priority 1: Shorthand format (8k, 1.5m)
-        amount = self._extract_shorthand_amount(text)
-        if amount > 0:
-            return amount
-        
-        # Priority 2: Currency symbol format ($50, £50)
-        amount = self._extract_currency_symbol_amount(text)
-        if amount > 0:
-            return amount
-        
-        # Priority 3: Numeric with currency word (50 dollars, 20.5 shillings)
-        amount = self._extract_numeric_with_currency(text)
-        if amount > 0:
-            return amount
-        
-        # Priority 4: Plain numbers
-        amount = self._extract_plain_number(text)
-        if amount > 0:
-            return amount
-        
-        # Priority 5: Word format (twenty dollars, five hundred)
-        amount = self._extract_word_amount(text)
-        if amount > 0:
-            return amount
-        
-        return 0.0
-    
-    def _extract_shorthand_amount(self, text: str) -> float:
-        """Extract amounts like 8k, 1.5k, 2m, 500k"""
-        patterns = [
-            (r'(\d+(?:\.\d+)?)\s*k\b', 1000),      # 8k, 1.5k
-            (r'(\d+(?:\.\d+)?)\s*m\b', 1000000),   # 2m, 1.5m
-        ]
-        
-        for pattern, multiplier in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return float(match.group(1)) * multiplier
-        
-        return 0.0
-    
-    def _extract_currency_symbol_amount(self, text: str) -> float:
-        """Extract amounts with currency symbols: $50, £20.5, €100"""
-        pattern = r'[$£€¥]\s*(\d+(?:\.\d{1,2})?)'
-        match = re.search(pattern, text)
-        if match:
-            return float(match.group(1))
-        return 0.0
-    
-    def _extract_numeric_with_currency(self, text: str) -> float:
-        """Extract: 50 dollars, 20.5 shillings, 100 tsh"""
-        currency_pattern = '|'.join(self.currency_keywords)
-        pattern = rf'(\d+(?:\.\d{{1,2}})?)\s*(?:{currency_pattern})\b'
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            return float(match.group(1))
-        return 0.0
-    
-    def _extract_plain_number(self, text: str) -> float:
-        """Extract plain decimal numbers: 50, 20.5, 100.00"""
-        match = re.search(r'\b(\d+(?:\.\d{1,2})?)\b', text)
-        if match:
-            return float(match.group(1))
-        return 0.0
-    
-    def _extract_word_amount(self, text: str) -> float:
+        return self._amount_from_tokens(self.tokenize(text))
+    
+    def _amount_from_tokens(self, tokens: List[Token]) -> float:
         """
-        Extract word-based amounts: 'twenty dollars', 'five hundred'
-        Supports: twenty-five, one hundred fifty
+        Pick the amount from a token stream. Candidates are collected in one
+        pass and resolved in priority order:
+        1. Shorthand (8k before 1.5m)  2. Currency symbol ($50)
+        3. Number + currency (50 dollars)  4. Plain number  5. Number words
         """
-        words = text.split()
-        total = 0
-        current = 0
-        
-        for word in words:
-            word = word.strip('.,!?;')
-            
-            if word in self.word_to_number:
-                num = self.word_to_number[word]
-                
-                if num == 100:
-                    current = (current or 1) * 100
-                elif num == 1000:
-                    current = (current or 1) * 1000
-                else:
-                    current += num
-            
-            # Check if next word is currency
-            elif word in ['dollars', 'dollar', 'bucks', 'shillings']:
-                total = current
-                break
-        
-        return float(total) if total > 0 else 0.0
-    
+        scan = AmountScan()
+        scan.feed(tokens)
+        return scan.amount()
+
     # ========================================================================
     # CATEGORY EXTRACTION (Enhanced with confidence scoring)
     # ========================================================================
     
-    def extract_category(self, text: str) -> str:
+    def extract_category(self, text: str, tokens: Optional[List[Token]] = None) -> str:
         """
         Extract category with confidence scoring.
         Returns the category with the highest keyword match count.
         """
-        text = text.lower()
-        category_scores = {}
-        
-        for category, keywords in self.category_keywords.items():
-            score = sum(1 for keyword in keywords if keyword in text)
-            if score > 0:
-                category_scores[category] = score
-        
-        if not category_scores:
-            return "Misc"
-        
-        # Return category with highest score
+        scores = self.category_automaton.label_scores(text)
+        if not scores:
+            # Near-misses of keywords only count when nothing matched exactly
+            if tokens is None:
+                tokens = self.tokenize(text)
+            scores = self.category_automaton.label_scores("", self._fuzzy_keywords(tokens))
+        
+        if not scores:
+            return self._classify(text)
+        
+        # Highest score wins; ties go to the category listed first
+        category_scores = {c: scores[c] for c in self.category_keywords if c in scores}
         best_category = max(category_scores, key=category_scores.get)
         return best_category
     
+    def _fuzzy_keywords(self, tokens: List[Token]) -> List[str]:
+        """Category keywords that plain words in tokens are near-misses of"""
+        if not self.fuzzy_distance:
+            return []
+        
+        matches = []
+        for token in tokens:
+            if token.kind != WORD:
+                continue
+            word = token.text.lower()
+            if word in self.category_automaton or word in self.filler_words:
+                continue
+            keyword = self._fuzzy('keyword', word)
+            if keyword is not None:
+                matches.append(keyword)
+        return matches
+    
+    def _fuzzy(self, kind: str, word: str) -> Optional[str]:
+        """
+        Memoised tree lookup; ASR vocabularies repeat the same few words.
+        Keyword near-misses must also keep the first two letters, so
+        "screaming" and "stopping" stay clear of "streaming" and "shopping".
+        """
+        key = (kind, word)
+        if key not in self._fuzzy_memo:
+            if len(self._fuzzy_memo) >= 10000:
+                self._fuzzy_memo.clear()
+            if word in self.grammar.plain_words:
+                match = None
+            elif kind == 'number':
+                match = _fuzzy_lookup(self.number_tree, word, fuzzy_limit(word, self.fuzzy_distance))
+            else:
+                limit = keyword_fuzzy_limit(word, self.fuzzy_distance)
+                match = _fuzzy_lookup(self.keyword_tree, word, limit, prefix=2)
+            self._fuzzy_memo[key] = match
+        return self._fuzzy_memo[key]
+    
+    def _classify(self, text: str) -> str:
+        """History-trained fallback for text with no keyword hits"""
+        if self.classifier is None:
+            return "Misc"
+        
+        category, confidence = self.classifier.predict(text)
+        if category is None or confidence < self.min_classifier_confidence:
+            return "Misc"
+        return self._category_label(category)
+    
+    def _category_label(self, label: str) -> str:
+        """
+        A classifier label (a registry name such as 'transportation') in the
+        keyword categories' vocabulary, so every path returns the same labels
+        """
+        key = str(label).strip().lower()
+        for category in self.category_keywords:
+            if category.lower() == key:
+                return category
+        
+        categories = self.category_automaton.labels(key)
+        for category in self.category_keywords:
+            if category in categories:
+                return category
+        return "Misc"
+    
+    def add_category_keyword(self, category: str, keyword: str) -> None:
+        """Teach the parser a new keyword (or alias) for a category"""
+        keyword = keyword.strip().lower()
+        if not keyword or keyword in self.category_keywords.get(category, ()):
+            return
+        
+        # Copy-on-write: the first custom keyword gives this instance private tables
+        if self._table_id == 0:
+            self.category_keywords = {c: list(k) for c, k in CATEGORY_KEYWORDS.items()}
+            self.category_automaton = KeywordAutomaton(self.category_keywords)
+            self.keyword_tree = BKTree(_single_word_keywords(self.category_keywords))
+        
+        self.category_keywords.setdefault(category, []).append(keyword)
+        self.category_automaton.add(keyword, category)
+        if " " not in keyword:
+            self.keyword_tree.add(keyword)
+            self._fuzzy_memo.clear()
+        self._table_id = next(_table_ids)
+
     # ========================================================================
     # DESCRIPTION EXTRACTION (Enhanced)
     # ========================================================================
@@ -200,54 +570,48 @@ class VoiceService:
         Clean and extract meaningful description.
         Removes amounts, currency, and filler words.
         """
-        original_text = text
-        text = text.lower()
-        
-        # Remove amount patterns
-        text = re.sub(r'\d+(?:\.\d+)?\s*[km]?\b', '', text)
-        text = re.sub(r'[$£€¥]\s*\d+(?:\.\d+)?', '', text)
-        
-        # Remove currency keywords
-        currency_pattern = '|'.join(self.currency_keywords)
-        text = re.sub(rf'\b(?:{currency_pattern})\b', '', text, flags=re.IGNORECASE)
-        
-        # Split into words and remove fillers
-        words = text.split()
-        cleaned_words = [
-            word.strip('.,!?;') 
-            for word in words 
-            if word.strip('.,!?;') and word not in self.filler_words
+        return self._description_from_tokens(self.tokenize(text))
+    
+    def _description_from_tokens(self, tokens: List[Token]) -> str:
+        return self._compose_description(
+            self._description_words(tokens), self._key_words(tokens)
+        )
+    
+    def _description_words(self, tokens: List[Token]) -> List[str]:
+        """Words that survive amount, currency and filler removal"""
+        return [
+            token.text.lower()
+            for token in tokens
+            if token.kind in _DESCRIPTION_KINDS
+            and token.text not in _STRIP_PUNCTUATION
+            and token.text.lower() not in self.filler_words
         ]
-        
-        description = " ".join(cleaned_words).strip()
+    
+    def _key_words(self, tokens: List[Token]) -> List[str]:
+        """Fallback key phrases: words longer than 3 characters that aren't filler"""
+        return [
+            token.text
+            for token in tokens
+            if token.kind in _KEY_WORD_KINDS
+            and len(token.text) > 3 and token.text.lower() not in self.filler_words
+        ]
+    
+    def _compose_description(self, words: List[str], key_words: List[str]) -> str:
+        description = " ".join(words).strip()
         
         # Fallback: if description is empty or too short, use original
         if not description or len(description) < 3:
             # Try to extract noun phrases from original
-            description = self._extract_key_phrases(original_text)
+            description = " ".join(key_words[:5])  # Max 5 words
         
         return description or "Voice expense"
     
-    def _extract_key_phrases(self, text: str) -> str:
-        """Extract key noun phrases as fallback description"""
-        # Remove common patterns but keep meaningful words
-        text = re.sub(r'\d+(?:\.\d+)?[km]?', '', text)
-        text = re.sub(r'[$£€¥]\d+', '', text)
-        
-        words = text.split()
-        # Keep words longer than 3 characters that aren't filler
-        key_words = [
-            w.strip('.,!?;') 
-            for w in words 
-            if len(w) > 3 and w.lower() not in self.filler_words
-        ]
-        
-        return " ".join(key_words[:5])  # Max 5 words
-    
     # ========================================================================
     # MAIN PARSER (Enhanced with validation)
     # ========================================================================
     
+    @timed()
+    @PARSE_SECONDS.timed
     def parse_voice_input(self, text: str) -> Dict[str, any]:
         """
         Main parser that extracts amount, category, and description.
@@ -263,24 +627,117 @@ class VoiceService:
             }
         
         # Clean input
-        text = text.strip()
-        
-        # Extract components
-        amount = self.extract_amount(text)
-        category = self.extract_category(text)
-        description = self.extract_description(text, amount)
+        original_text = text.strip()
+        text = normalize_transcript(text)
+        
+        # Repeated phrases ("coffee 5 bucks") are served from the shared LRU
+        classifier_state = (id(self.classifier), self.classifier.version) if self.classifier else None
+        key = (self._table_id, self.grammar.locales, self.fuzzy_distance, classifier_state, text)
+        cached = PARSE_CACHE.get(key)
+        if cached is not None:
+            return {**cached, "original_text": original_text}
+        
+        # Tokenize once; amount and description both read the same stream
+        tokens = self.tokenize(text)
+        amount = self._amount_from_tokens(tokens)
+        category = self.extract_category(text, tokens)
+        description = self._description_from_tokens(tokens)
         
         # Validation
         is_valid = amount > 0 and len(description) > 0
         
-        return {
+        result = {
             "success": is_valid,
             "amount": amount,
             "category": category,
             "description": description,
-            "original_text": text,
+            "original_text": original_text,
             "error": None if is_valid else "Could not parse amount or description"
         }
+        PARSE_CACHE.put(key, result)
+        return dict(result)
+    
+    def stream(self) -> "StreamingVoiceParser":
+        """Incremental parser for live partial transcripts, sharing this instance's tables"""
+        return StreamingVoiceParser(self)
+    
+    @staticmethod
+    def cache_stats() -> Dict[str, float]:
+        """Hit/miss counters of the shared parse cache"""
+        return PARSE_CACHE.stats()
+    
+    # ========================================================================
+    # BATCH PARSING
+    # ========================================================================
+    
+    def parse_batch(
+        self, 
+        texts: Sequence[str], 
+        workers: Optional[int] = None, 
+        chunksize: int = 2000
+    ) -> pd.DataFrame:
+        """
+        Parse many transcripts into a columnar frame with columns
+        amount, category, description, success, error (one row per text,
+        in input order).
+        
+        Args:
+            texts: Transcripts to parse
+            workers: Process count; defaults to the CPU count. Inputs under
+                PARALLEL_MIN_ITEMS, or workers=1, are parsed in-process
+            chunksize: Transcripts handed to a worker per task
+        """
+        texts = list(texts)
+        workers = workers or os.cpu_count() or 1
+        BATCH_PARSES.inc(len(texts))
+        
+        if workers <= 1 or len(texts) < PARALLEL_MIN_ITEMS:
+            columns = _parse_chunk_with(self, texts)
+        else:
+            chunks = [texts[i:i + chunksize] for i in range(0, len(texts), chunksize)]
+            columns = {name: [] for name in BATCH_COLUMNS}
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_batch_worker,
+                initargs=(
+                    {c: list(k) for c, k in self.category_keywords.items()}, self.classifier,
+                    self.grammar.locales, self.fuzzy_distance
+                )
+            ) as pool:
+                for part in pool.map(_parse_chunk, chunks):
+                    for name in BATCH_COLUMNS:
+                        columns[name].extend(part[name])
+        
+        return pd.DataFrame({
+            "amount": np.asarray(columns["amount"], dtype=np.float64),
+            "category": columns["category"],
+            "description": columns["description"],
+            "success": np.asarray(columns["success"], dtype=bool),
+            "error": columns["error"]
+        })
+    
+    @staticmethod
+    def to_expense_batch(parsed: pd.DataFrame, dates=None) -> ExpenseBatch:
+        """
+        Turn the successful rows of a parse_batch frame into an ExpenseBatch
+        ready for ExpenseService.add_expenses. dates defaults to now.
+        """
+        mask = parsed["success"].to_numpy()
+        ok = parsed[mask]
+        
+        if dates is None:
+            dates = np.full(len(ok), np.datetime64(datetime.now(), 'ns'))
+        else:
+            dates = np.asarray(dates, dtype='datetime64[ns]')[mask]
+        
+        codes, categories = pd.factorize(ok["category"])
+        return ExpenseBatch(
+            dates=dates,
+            amount_cents=to_cents_array(ok["amount"]),
+            category_codes=codes,
+            categories=list(categories),
+            descriptions=ok["description"].tolist()
+        )
     
     # ========================================================================
     # UTILITY METHODS
@@ -316,4 +773,190 @@ class VoiceService:
         if len(result['description']) < 2:
             return False, "Description too short"
         
-        re
\ No newline at end of file
+        return True, "Looks good"
+
+
+# ============================================================================
+# STREAMING PARSER
+# ============================================================================
+
+class _Segment(NamedTuple):
+    text: str
+    transcript: str                  # all segments so far, space-joined
+    keywords: Tuple[str, ...]        # whole-word category keywords found
+    fuzzy_keywords: Tuple[str, ...]  # keywords that plain words are near-misses of
+    words: List[str]                 # description words
+    key_words: List[str]             # fallback key phrases
+    scan_after: AmountScan           # amount scan state after this segment
+
+class StreamingVoiceParser:
+    """
+    Incremental parser for live ASR output.
+    
+    A transcript is a sequence of segments (typically one per recogniser
+    result). append() adds a new segment; revise() replaces the last one,
+    which is how partial hypotheses grow. Only the changed segment is
+    tokenized and run through the keyword automaton (with the previous
+    segment's last words as overlap, for keywords spanning the boundary);
+    per-category scores are kept up to date as keywords come and go, so an
+    update costs time proportional to the new text.
+    """
+    
+    def __init__(self, service: Optional[VoiceService] = None):
+        self.service = service or VoiceService()
+        self._segments: List[_Segment] = []
+        self._keyword_counts: Counter = Counter()
+        self._category_scores: Counter = Counter()
+        # Fuzzy hits are kept apart; they only decide when nothing matched exactly
+        self._fuzzy_counts: Counter = Counter()
+        self._fuzzy_scores: Counter = Counter()
+        self._category_order = {c: i for i, c in enumerate(self.service.category_keywords)}
+        # Words of context a multi-word keyword may need from the previous segment
+        self._overlap_words = max(
+            (kw.count(" ") for kw in self.service.category_automaton.keywords), default=0
+        )
+    
+    @property
+    def text(self) -> str:
+        return self._segments[-1].transcript if self._segments else ""
+    
+    def append(self, fragment: str) -> Dict[str, any]:
+        """Add a new segment and return the updated parse"""
+        segment = self._build_segment(fragment)
+        self._segments.append(segment)
+        self._count_keywords(segment.keywords, 1, self._keyword_counts, self._category_scores)
+        self._count_keywords(segment.fuzzy_keywords, 1, self._fuzzy_counts, self._fuzzy_scores)
+        return self.result()
+    
+    def revise(self, fragment: str) -> Dict[str, any]:
+        """Replace the last segment (a revised partial hypothesis)"""
+        if not self._segments:
+            return self.append(fragment)
+        
+        old = self._segments.pop()
+        self._count_keywords(old.keywords, -1, self._keyword_counts, self._category_scores)
+        self._count_keywords(old.fuzzy_keywords, -1, self._fuzzy_counts, self._fuzzy_scores)
+        return self.append(fragment)
+    
+    def reset(self) -> None:
+        self._segments.clear()
+        self._keyword_counts.clear()
+        self._category_scores.clear()
+        self._fuzzy_counts.clear()
+        self._fuzzy_scores.clear()
+    
+    def _count_keywords(self, keywords: Iterable[str], delta: int,
+                        counts: Counter, scores: Counter) -> None:
+        """A category scores one per distinct keyword present anywhere in the transcript"""
+        automaton = self.service.category_automaton
+        for keyword in keywords:
+            before = counts[keyword]
+            after = before + delta
+            counts[keyword] = after
+            if (before > 0) != (after > 0):
+                for category in automaton.labels(keyword):
+                    scores[category] += 1 if after > 0 else -1
+    
+    def _build_segment(self, fragment: str) -> _Segment:
+        service = self.service
+        fragment = fragment.strip()
+        tokens = service.tokenize(fragment)
+        
+        previous = self._segments[-1] if self._segments else None
+        scan = previous.scan_after.copy() if previous else AmountScan()
+        scan.feed(tokens)
+        
+        # Only matches ending inside the new fragment are new
+        overlap = ""
+        if previous and self._overlap_words:
+            overlap = " ".join(previous.transcript.rsplit(" ", self._overlap_words)[1:])
+        offset = len(overlap) + 1 if overlap else 0
+        window = f"{overlap} {fragment}" if overlap else fragment
+        keywords = tuple({kw for _, end, kw in service.category_automaton.find(window) if end > offset})
+        
+        transcript = previous.transcript if previous else ""
+        if fragment:
+            transcript = f"{transcript} {fragment}" if transcript else fragment
+        return _Segment(
+            fragment, transcript, keywords, tuple(service._fuzzy_keywords(tokens)),
+            service._description_words(tokens), service._key_words(tokens), scan
+        )
+    
+    def _category(self) -> str:
+        # Exact hits first, as in extract_category
+        best = self._best_category(self._category_scores) or self._best_category(self._fuzzy_scores)
+        if best is None:
+            return self.service._classify(self.text)
+        return best
+    
+    def _best_category(self, scores: Counter) -> Optional[str]:
+        # Highest score wins; ties go to the category listed first
+        order = self._category_order
+        best, best_key = None, None
+        for category, score in scores.items():
+            if score > 0:
+                key = (score, -order.get(category, len(order)))
+                if best_key is None or key > best_key:
+                    best, best_key = category, key
+        return best
+    
+    def result(self) -> Dict[str, any]:
+        """Current parse in the same shape as VoiceService.parse_voice_input"""
+        text = self.text
+        if not text:
+            return {
+                "success": False,
+                "amount": 0.0,
+                "category": "Misc",
+                "description": "",
+                "error": "Empty input"
+            }
+        
+        amount = self._segments[-1].scan_after.amount()
+        description = self.service._compose_description(
+            [w for seg in self._segments for w in seg.words],
+            [w for seg in self._segments for w in seg.key_words]
+        )
+        is_valid = amount > 0 and len(description) > 0
+        
+        return {
+            "success": is_valid,
+            "amount": amount,
+            "category": self._category(),
+            "description": description,
+            "original_text": text,
+            "error": None if is_valid else "Could not parse amount or description"
+        }
+
+
+# ============================================================================
+# PROCESS POOL WORKERS
+# ============================================================================
+
+_worker_service: Optional[VoiceService] = None
+
+def _init_batch_worker(
+    category_keywords: Dict[str, List[str]], 
+    classifier=None, 
+    locales: Sequence[str] = DEFAULT_LOCALES, 
+    fuzzy_distance: int = 2
+) -> None:
+    """Build one parser per worker process, carrying over the parent's configuration"""
+    global _worker_service
+    _worker_service = VoiceService(
+        classifier=classifier, fuzzy_distance=fuzzy_distance, locales=locales
+    )
+    for category, keywords in category_keywords.items():
+        for keyword in keywords:
+            _worker_service.add_category_keyword(category, keyword)
+
+def _parse_chunk(texts: List[str]) -> Dict[str, list]:
+    return _parse_chunk_with(_worker_service or VoiceService(), texts)
+
+def _parse_chunk_with(service: VoiceService, texts: Iterable[str]) -> Dict[str, list]:
+    columns = {name: [] for name in BATCH_COLUMNS}
+    for text in texts:
+        result = service.parse_voice_input(text)
+        for name in BATCH_COLUMNS:
+            columns[name].append(result[name])
+    return columns
\ No newline at end of file